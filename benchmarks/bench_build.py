@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+End-to-end build benchmark for Fractional Pulse.
+
+For each feed size, generates a synthetic feed (synthetic_jobs.py) in a
+scratch directory and runs the pipeline stages against it as separate
+processes, the way CI runs them:
+
+    export      export_jobs.py --csv (the CSV importer)
+    job_board   generate_job_board.py
+    job_pages   generate_job_pages.py (cold render cache)
+    job_pages_warm  generate_job_pages.py again (warm render cache)
+    sitemap     generate_sitemap.py
+
+Each stage records wall time, peak RSS, files/pages written, pages and
+jobs per second and output bytes. Results are written to
+build/benchmarks/results.json; with --baseline, the run fails when a stage
+got slower or bigger than the baseline by more than --tolerance.
+
+    python benchmarks/bench_build.py --sizes 1k,10k
+    python benchmarks/bench_build.py --sizes 1k,10k,100k,1m --baseline benchmarks/baseline.json
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Add benchmarks directory to path
+bench_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, bench_dir)
+
+from synthetic_jobs import DEFAULT_SEED, write_jobs_json, write_jobs_csv
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(bench_dir), 'scripts')
+BENCH_DIR = 'build/benchmarks'
+RESULTS_FILE = f'{BENCH_DIR}/results.json'
+
+DEFAULT_SIZES = '1k,10k'
+
+# (stage name, script, extra arguments); {csv} and {export} are filled in per run
+STAGES = [
+    ('export', 'export_jobs.py', ['--csv', '{csv}', '--output', '{export}']),
+    ('job_board', 'generate_job_board.py', []),
+    ('job_pages', 'generate_job_pages.py', []),
+    ('job_pages_warm', 'generate_job_pages.py', []),
+    ('sitemap', 'generate_sitemap.py', []),
+]
+
+# Regressions smaller than these are treated as noise whatever the tolerance
+MIN_WALL_DELTA = 0.5
+MIN_RSS_DELTA_MB = 16
+
+
+def parse_size(text):
+    """Parse a feed size such as 1000, 10k or 1m."""
+    text = text.strip().lower()
+    multiplier = {'k': 1000, 'm': 1000000}.get(text[-1:], 1)
+    return int(float(text.rstrip('km')) * multiplier)
+
+
+def output_since(paths, start_ns):
+    """Count files, HTML pages and bytes under `paths` written since `start_ns`."""
+    files = pages = size = 0
+    for path in paths:
+        for root, _, names in os.walk(path):
+            for name in names:
+                st = os.stat(os.path.join(root, name))
+                if st.st_mtime_ns >= start_ns:
+                    files += 1
+                    pages += name.endswith('.html')
+                    size += st.st_size
+    return files, pages, size
+
+
+def run_stage(script, args, work_dir, log_path):
+    """
+    Run one pipeline script in `work_dir`.
+
+    Returns:
+        (wall_seconds, peak_rss_mb); raises RuntimeError if the script fails
+    """
+    with open(log_path, 'w', encoding='utf-8') as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(SCRIPTS_DIR, script), *args],
+            cwd=work_dir, stdout=log, stderr=subprocess.STDOUT,
+        )
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise RuntimeError(f"{script} exited with {process.returncode} (see {log_path})")
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss_bytes = usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+    return wall, rss_bytes / (1024 * 1024)
+
+
+def bench_size(count, seed=DEFAULT_SEED, keep=False):
+    """Benchmark every stage on a synthetic feed of `count` jobs; returns {stage: metrics}."""
+    work_dir = os.path.abspath(f'{BENCH_DIR}/work-{count}')
+    shutil.rmtree(work_dir, ignore_errors=True)
+    os.makedirs(f'{work_dir}/site')
+
+    start = time.perf_counter()
+    write_jobs_json(f'{work_dir}/data/jobs.json', count, seed)
+    write_jobs_csv(f'{work_dir}/feed.csv', count, seed)
+    print(f"  Generated {count:,} synthetic jobs in {time.perf_counter() - start:.1f}s")
+
+    fill = {'csv': f'{work_dir}/feed.csv', 'export': f'{work_dir}/export'}
+    results = {}
+    for name, script, args in STAGES:
+        start_ns = time.time_ns()
+        wall, rss_mb = run_stage(script, [a.format(**fill) for a in args], work_dir, f'{work_dir}/{name}.log')
+        files, pages, size = output_since([f'{work_dir}/site', fill['export']], start_ns)
+        results[name] = {
+            'wall_seconds': round(wall, 3),
+            'peak_rss_mb': round(rss_mb, 1),
+            'files': files,
+            'pages': pages,
+            'pages_per_second': round(pages / wall, 1) if wall else 0,
+            'jobs_per_second': round(count / wall, 1) if wall else 0,
+            'output_bytes': size,
+        }
+        print(f"    {name:<15} {wall:8.2f}s  {rss_mb:8.1f} MB  {pages:>8,} pages "
+              f"({results[name]['pages_per_second']:,.0f}/s, {results[name]['jobs_per_second']:,.0f} jobs/s)  "
+              f"{size:,} bytes")
+
+    if not keep:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions of `results` against `baseline`."""
+    regressions = []
+    for size, stages in results['sizes'].items():
+        for stage, metrics in stages.items():
+            base = baseline.get('sizes', {}).get(size, {}).get(stage)
+            if not base:
+                continue
+            for key, min_delta in (('wall_seconds', MIN_WALL_DELTA), ('peak_rss_mb', MIN_RSS_DELTA_MB)):
+                new, old = metrics[key], base[key]
+                if new > old * (1 + tolerance) and new - old > min_delta:
+                    regressions.append(f"{size} jobs / {stage}: {key} {old} -> {new} (+{(new - old) / old:.0%})")
+    return regressions
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Fractional Pulse build on synthetic feeds")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated feed sizes, e.g. 1k,10k,100k,1m (default: {DEFAULT_SIZES})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Synthetic feed seed")
+    parser.add_argument("--output", "-o", default=RESULTS_FILE, help="Results JSON path")
+    parser.add_argument("--baseline", help="Fail if results regress against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown / memory growth against the baseline (default: 0.25)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch build directories")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - BUILD BENCHMARK")
+    print("=" * 60)
+
+    results = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': args.seed,
+        'sizes': {},
+    }
+    for count in (parse_size(s) for s in args.sizes.split(',')):
+        print(f"\n  {count:,} jobs")
+        results['sizes'][str(count)] = bench_size(count, args.seed, args.keep)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n  Saved: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"  REGRESSIONS against {args.baseline}:")
+            for line in regressions:
+                print(f"    {line}")
+            print("=" * 60)
+            sys.exit(1)
+        print(f"  No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the per-job hot functions of the Fractional Pulse build.
+
+Every function that runs once or more per job (escaping, markdown, dates,
+slugs, role/compensation/hours formatting, JSON-LD) is timed with timeit
+over a fixed corpus of jobs from data/jobs.json, and its peak allocation
+per call is measured with tracemalloc. Functions that exist in more than
+one script are benchmarked once per copy and shown side by side, with a
+note when the copies disagree on the corpus.
+
+To try an alternative implementation, put a function with the same name in
+a file and pass it with --compare:
+
+    python benchmarks/bench_functions.py
+    python benchmarks/bench_functions.py --only markdown_to_html --compare /tmp/fast_markdown.py
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+# Add scripts directory to path
+script_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+sys.path.insert(0, script_dir)
+
+from job_store import iter_jobs
+
+DATA_DIR = 'data'
+JOBS_FILE = f'{DATA_DIR}/jobs.json'
+RESULTS_FILE = 'build/benchmarks/functions.json'
+
+CORPUS_SIZE = 200
+CORPUS_SEED = 7
+
+# Scripts searched for copies of each benchmarked function
+VARIANT_MODULES = ['generate_job_pages', 'generate_job_board', 'export_jobs']
+
+
+def _db_job(job):
+    """The scraper-row attributes export_jobs' formatters read, rebuilt from a jobs.json record."""
+    comp = job.get('compensation') or {}
+    hours = job.get('hours') or {}
+    return SimpleNamespace(
+        compensation_type=None if comp.get('type') == 'not_disclosed' else comp.get('type'),
+        compensation_min=comp.get('min'),
+        compensation_max=comp.get('max'),
+        hourly_rate_min=comp.get('hourly_min'),
+        hourly_rate_max=comp.get('hourly_max'),
+        hours_per_week_min=hours.get('min'),
+        hours_per_week_max=hours.get('max'),
+    )
+
+
+# Benchmarked function name -> arguments for one call, built from a job record
+BENCHMARKS = {
+    'escape_html': lambda job: (job.get('title'),),
+    'markdown_to_html': lambda job: (job.get('description') or '',),
+    'format_date': lambda job: (job.get('date_posted'),),
+    'generate_job_slug': lambda job: (job.get('company'), job.get('title'), job.get('job_id')),
+    'categorize_role': lambda job: (job.get('title'), job.get('function_category')),
+    'format_compensation': lambda job: (_db_job(job),),
+    'format_hours': lambda job: (_db_job(job),),
+    'generate_job_posting_schema': lambda job: (job,),
+}
+
+
+def load_corpus(path=JOBS_FILE, size=CORPUS_SIZE, seed=CORPUS_SEED):
+    """A fixed sample of `size` jobs from the job store (all of them if it is smaller)."""
+    jobs = list(iter_jobs(path))
+    if len(jobs) <= size:
+        return jobs
+    return random.Random(seed).sample(jobs, size)
+
+
+def _load_file(path):
+    """Import a Python file given by path as a module."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_variants(compare_files=()):
+    """Return {function name: [(label, function), ...]} across the scripts and `compare_files`."""
+    modules = [(name, importlib.import_module(name)) for name in VARIANT_MODULES]
+    modules += [(os.path.basename(path), _load_file(path)) for path in compare_files]
+    variants = {}
+    for name in BENCHMARKS:
+        for label, module in modules:
+            func = getattr(module, name, None)
+            if callable(func):
+                variants.setdefault(name, []).append((label, func))
+    return variants
+
+
+def time_per_call(func, calls, repeat=5):
+    """Best-of-`repeat` nanoseconds per call over the argument tuples in `calls`."""
+    def run():
+        for args in calls:
+            func(*args)
+
+    timer = timeit.Timer(run)
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=loops))
+    return best / (loops * len(calls)) * 1e9
+
+
+def peak_bytes_per_call(func, calls):
+    """Average peak traced memory (bytes) a single call allocates."""
+    tracemalloc.start()
+    try:
+        total = 0
+        for args in calls:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func(*args)
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / len(calls)
+
+
+def bench(variants, corpus, repeat=5):
+    """Benchmark every variant; returns {name: [{'variant', 'ns_per_call', 'bytes_per_call', 'matches'}]}."""
+    results = {}
+    for name, funcs in variants.items():
+        calls = [BENCHMARKS[name](job) for job in corpus]
+        reference = None
+        rows = []
+        for label, func in funcs:
+            outputs = [func(*args) for args in calls]
+            if reference is None:
+                reference = outputs
+            rows.append({
+                'variant': label,
+                'ns_per_call': round(time_per_call(func, calls, repeat), 1),
+                'bytes_per_call': round(peak_bytes_per_call(func, calls), 1),
+                'matches': outputs == reference,
+            })
+        results[name] = rows
+    return results
+
+
+def print_results(results):
+    for name, rows in results.items():
+        fastest = min(row['ns_per_call'] for row in rows)
+        print(f"\n  {name}")
+        for row in rows:
+            note = '' if row['matches'] else '  (output differs from first variant)'
+            print(f"    {row['variant']:<24} {row['ns_per_call']:>12,.0f} ns/call  "
+                  f"{row['ns_per_call'] / fastest:>5.2f}x  {row['bytes_per_call']:>10,.0f} B/call{note}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Micro-benchmark the per-job hot functions")
+    parser.add_argument("--jobs", default=JOBS_FILE, help=f"Job store to draw the corpus from (default: {JOBS_FILE})")
+    parser.add_argument("--corpus", type=int, default=CORPUS_SIZE, help="Number of jobs in the corpus")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="Benchmark only this function")
+    parser.add_argument("--compare", action="append", default=[], metavar="FILE",
+                        help="Python file with alternative implementations to benchmark alongside")
+    parser.add_argument("--repeat", type=int, default=5, help="timeit repeats (best is reported)")
+    parser.add_argument("--output", "-o", default=RESULTS_FILE, help="Results JSON path")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - FUNCTION BENCHMARKS")
+    print("=" * 60)
+
+    corpus = load_corpus(args.jobs, args.corpus)
+    print(f"  Corpus: {len(corpus)} jobs from {args.jobs}")
+
+    variants = find_variants(args.compare)
+    if args.only:
+        variants = {name: funcs for name, funcs in variants.items() if name in args.only}
+
+    results = bench(variants, corpus, args.repeat)
+    print_results(results)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'corpus': len(corpus), 'results': results}, f, indent=2)
+    print(f"\n  Saved: {args.output}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
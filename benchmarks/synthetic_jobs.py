@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic job data for Fractional Pulse benchmarks.
+
+Produces job records in the jobs.json export schema (and the equivalent
+JobSpy-style CSV rows read by export_jobs.import_from_csv) at any size.
+Every job is derived from (seed, index) alone, so a feed of a million jobs
+is streamed to disk without holding it in memory and two runs with the same
+seed give byte-identical files.
+
+The mix follows the real feed: mostly untyped roles with a tail of
+director/CFO/VP titles, description lengths spread around ~4k characters
+with paragraphs, bullet lists and bold headings, and clusters of reposted
+jobs (same slug) and near-duplicates (same company and title).
+"""
+
+import csv
+import json
+import os
+import random
+import sys
+from collections import Counter
+from datetime import date, timedelta
+
+# Add scripts directory to path
+script_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts')
+sys.path.insert(0, script_dir)
+
+from export_jobs import generate_job_slug
+from job_store import iter_jobs, write_similar_index
+
+DEFAULT_SEED = 42
+
+# Fixed "today" so generated dates do not depend on when the benchmark runs
+BUILD_DATE = date(2026, 1, 30)
+
+# (role_type, weight, title templates); weights follow the real feed's role mix
+ROLE_MIX = [
+    (None, 70, [
+        'Fractional {function} Advisor', 'Part-Time {function} Consultant', 'Interim {function} Lead',
+        'Senior {function} Manager (Contract)', 'Fractional {function} Partner', 'Advisory {function} Specialist',
+    ]),
+    ('director', 12, ['Director of {function}', 'Fractional {function} Director', 'Associate Director, {function}']),
+    ('cfo', 7, ['Fractional CFO', 'Part-Time CFO - {industry}', 'Interim Chief Financial Officer']),
+    ('vp', 6, ['VP of {function}', 'Vice President, {function}', 'Fractional VP {function}']),
+    ('cto', 1, ['Fractional CTO', 'Interim Chief Technology Officer']),
+    ('cmo', 1, ['Fractional CMO', 'Part-Time Chief Marketing Officer']),
+    ('head_of', 1, ['Head of {function}', 'Fractional Head of {function}']),
+    ('coo', 0.5, ['Fractional COO']),
+    ('cpo', 0.5, ['Fractional Chief Product Officer']),
+    ('cro', 0.5, ['Fractional CRO']),
+    ('ciso', 0.5, ['Fractional CISO']),
+]
+
+FUNCTIONS = [
+    ('sales', 'Sales', 24), ('finance', 'Finance', 12), ('operations', 'Operations', 6),
+    ('legal', 'Legal', 4), ('marketing', 'Marketing', 3), ('data', 'Data', 3),
+    ('engineering', 'Engineering', 1), ('people', 'People', 1), ('product', 'Product', 1),
+    ('other', 'Strategy', 45),
+]
+
+INDUSTRIES = ['SaaS', 'Healthcare', 'Construction', 'Manufacturing', 'Fintech', 'Retail', 'Logistics', 'Nonprofit']
+
+CITIES = [
+    'New York, NY, US', 'San Francisco, CA, US', 'Austin, TX, US', 'Chicago, IL, US', 'Atlanta, GA, US',
+    'Denver, CO, US', 'Boston, MA, US', 'Seattle, WA, US', 'Miami, FL, US', 'US',
+]
+
+COMPANY_PREFIXES = ['Blue', 'North', 'Summit', 'Clear', 'Bright', 'Iron', 'Silver', 'Harbor', 'Pine', 'Apex']
+COMPANY_SUFFIXES = ['Labs', 'Partners', 'Health', 'Systems', 'Capital', 'Works', 'Group', 'Analytics']
+
+WORDS = (
+    'strategy growth team leadership revenue finance operations build scale partner clients report '
+    'board investors forecast budget process systems hire manage drive support develop execute plan '
+    'market customer product data insight model quarterly annual experience remote flexible hours '
+    'company mission culture value impact results accountable collaborate communicate improve'
+).split()
+
+HEADINGS = ['Responsibilities', 'Qualifications', 'About Us', 'What We Offer', 'Requirements', 'Location']
+
+# Share of jobs that repost an earlier job (same slug) or reuse its company and title
+REPOST_RATE = 0.05
+NEAR_DUPLICATE_RATE = 0.10
+
+
+def _sentence(rng):
+    words = rng.choices(WORDS, k=rng.randint(8, 22))
+    return ' '.join(words).capitalize() + '.'
+
+
+def synthetic_description(rng):
+    """Markdown-ish description of roughly log-normal length (median ~4k characters)."""
+    target = min(int(rng.lognormvariate(8.3, 0.55)), 16000)
+    blocks = []
+    size = 0
+    while size < target:
+        kind = rng.random()
+        if kind < 0.2:
+            block = f'**{rng.choice(HEADINGS)}:**'
+        elif kind < 0.5:
+            block = '\n'.join(f'* {_sentence(rng)}' for _ in range(rng.randint(3, 8)))
+        else:
+            block = ' '.join(_sentence(rng) for _ in range(rng.randint(2, 6)))
+        blocks.append(block)
+        size += len(block) + 2
+    return '\n\n'.join(blocks)
+
+
+def _compensation(rng):
+    kind = rng.choices(['not_disclosed', 'annual', 'hourly', 'monthly'], weights=[43, 38, 17, 2])[0]
+    comp = {'type': kind, 'display': 'Not disclosed', 'min': None, 'max': None,
+            'hourly_min': None, 'hourly_max': None}
+    if kind == 'hourly':
+        low = float(rng.randrange(50, 250, 5))
+        high = low + rng.choice([0, 25, 50, 100])
+        comp.update(display=f'${low:.0f}/hr' if low == high else f'${low:.0f}-${high:.0f}/hr',
+                    min=low, max=high, hourly_min=low, hourly_max=high)
+    elif kind == 'annual':
+        low = float(rng.randrange(90000, 300000, 5000))
+        high = low + rng.choice([0, 20000, 50000])
+        comp.update(display=f'${low:,.0f}/yr' if low == high else f'${low:,.0f}-${high:,.0f}/yr',
+                    min=low, max=high, hourly_min=low / 1000, hourly_max=high / 1000)
+    elif kind == 'monthly':
+        low = float(rng.randrange(4000, 20000, 500))
+        high = low + rng.choice([0, 2000])
+        comp.update(display=f'${low:,.0f}/mo' if low == high else f'${low:,.0f}-${high:,.0f}/mo',
+                    min=low, max=high, hourly_min=low / 80, hourly_max=high / 80)
+    return comp
+
+
+def _hours(rng):
+    if rng.random() < 0.7:
+        return {'min': None, 'max': None, 'display': 'Not specified', 'bucket': None}
+    low = float(rng.choice([5, 10, 15, 20, 25, 30]))
+    high = low + rng.choice([0, 5, 10])
+    display = f'{low:.0f} hrs/week' if low == high else f'{low:.0f}-{high:.0f} hrs/week'
+    avg = (low + high) / 2
+    bucket = 'under_10' if avg < 10 else '10_20' if avg < 20 else '20_30' if avg < 30 else '30_plus'
+    return {'min': low, 'max': high, 'display': display, 'bucket': bucket}
+
+
+def _origin(index, seed):
+    """Index of the job that `index` reposts or near-duplicates (or itself) and the relation."""
+    if index:
+        roll = random.Random(f'{seed}:dup:{index}')
+        chance = roll.random()
+        if chance < REPOST_RATE:
+            return roll.randrange(index), 'repost'
+        if chance < REPOST_RATE + NEAR_DUPLICATE_RATE:
+            return roll.randrange(index), 'near'
+    return index, None
+
+
+def synthetic_job(index, seed=DEFAULT_SEED, with_description=True):
+    """Return job `index` of the synthetic feed for `seed` (jobs.json schema)."""
+    origin, relation = _origin(index, seed)
+    base = random.Random(f'{seed}:job:{origin}')
+    rng = base if relation is None else random.Random(f'{seed}:job:{index}')
+
+    role_type, _, templates = base.choices(ROLE_MIX, weights=[w for _, w, _ in ROLE_MIX])[0]
+    function, function_name, _ = base.choices(FUNCTIONS, weights=[w for _, _, w in FUNCTIONS])[0]
+    title = base.choice(templates).format(function=function_name, industry=base.choice(INDUSTRIES))
+    company = f'{base.choice(COMPANY_PREFIXES)} {base.choice(COMPANY_SUFFIXES)} {origin % 997}'
+
+    job_id = f'syn-{origin if relation == "repost" else index}'
+    location = base.choice(CITIES) if base.random() < 0.8 else 'Remote, US'
+    is_remote = 'Remote' in location
+    posted = BUILD_DATE - timedelta(days=rng.randrange(60))
+    compensation = _compensation(rng)
+    hours = _hours(rng)
+    # Drawn last, so skipping it leaves every other field unchanged
+    description = synthetic_description(base if relation == 'repost' else rng) if with_description else ''
+
+    return {
+        'job_id': job_id,
+        'slug': generate_job_slug(company, title, job_id),
+        'title': title,
+        'company': company,
+        'company_url': f'https://example.com/{origin}',
+        'location': location,
+        'location_type': 'remote' if is_remote else 'onsite',
+        'location_restriction': None,
+        'is_remote': is_remote,
+        'compensation': compensation,
+        'has_salary': compensation['min'] is not None,
+        'hours': hours,
+        'role_type': role_type,
+        'function_category': function,
+        'is_c_level': role_type in ('cfo', 'cmo', 'cto', 'coo', 'chro', 'cpo', 'cro', 'ciso', 'cio'),
+        'is_vp_level': role_type in ('vp', 'director', 'head_of'),
+        'seniority': 'C-Level' if role_type and len(role_type) <= 4 else '',
+        'date_posted': posted.isoformat(),
+        'date_scraped': BUILD_DATE.isoformat(),
+        'last_seen': BUILD_DATE.isoformat(),
+        'description': description,
+        'description_snippet': description[:500],
+        'source': 'indeed',
+        'source_url': f'https://www.indeed.com/viewjob?jk=syn{index:08x}',
+    }
+
+
+def iter_synthetic_jobs(count, seed=DEFAULT_SEED, with_description=True):
+    """Yield `count` synthetic jobs in feed order."""
+    for index in range(count):
+        yield synthetic_job(index, seed, with_description)
+
+
+def synthetic_stats(count, seed=DEFAULT_SEED):
+    """The jobs.json `stats` block for a synthetic feed (same keys as JobColumns.stats())."""
+    by_role, by_function, by_location = Counter(), Counter(), Counter()
+    with_salary = c_level = vp_level = 0
+    for job in iter_synthetic_jobs(count, seed, with_description=False):
+        by_role[job['role_type'] or 'other'] += 1
+        by_function[job['function_category'] or 'other'] += 1
+        by_location[job['location_type'] or 'remote'] += 1
+        with_salary += job['has_salary']
+        c_level += job['is_c_level']
+        vp_level += job['is_vp_level']
+    return {
+        'total_jobs': count,
+        'by_role_type': dict(by_role),
+        'by_function': dict(by_function),
+        'by_location_type': dict(by_location),
+        'with_salary': with_salary,
+        'c_level': c_level,
+        'vp_level': vp_level,
+    }
+
+
+def write_jobs_json(path, count, seed=DEFAULT_SEED):
+    """Stream a synthetic jobs.json (plus its similar_jobs.json side index) to `path`."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    header = {
+        'last_updated': BUILD_DATE.isoformat(),
+        'total_jobs': count,
+        'stats': synthetic_stats(count, seed),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(header, ensure_ascii=False)[:-1])
+        f.write(', "jobs": [')
+        for i, job in enumerate(iter_synthetic_jobs(count, seed)):
+            f.write(',\n' if i else '\n')
+            f.write(json.dumps(job, ensure_ascii=False))
+        f.write('\n]}\n')
+
+    write_similar_index(os.path.join(os.path.dirname(path), 'similar_jobs.json'), iter_jobs(path), path)
+
+
+CSV_FIELDS = [
+    'id', 'site', 'job_url', 'title', 'company', 'company_url', 'location', 'is_remote',
+    'interval', 'min_amount', 'max_amount', 'job_level', 'job_function', 'date_posted', 'description',
+]
+
+_CSV_INTERVALS = {'hourly': 'hourly', 'annual': 'yearly', 'monthly': 'monthly'}
+
+
+def write_jobs_csv(path, count, seed=DEFAULT_SEED):
+    """Write the same synthetic feed as JobSpy-style CSV rows for export_jobs.import_from_csv."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for job in iter_synthetic_jobs(count, seed):
+            comp = job['compensation']
+            writer.writerow({
+                'id': job['job_id'],
+                'site': job['source'],
+                'job_url': job['source_url'],
+                'title': job['title'],
+                'company': job['company'],
+                'company_url': job['company_url'],
+                'location': job['location'],
+                'is_remote': str(job['is_remote']),
+                'interval': _CSV_INTERVALS.get(comp['type'], ''),
+                'min_amount': comp['min'] if comp['min'] is not None else '',
+                'max_amount': comp['max'] if comp['max'] is not None else '',
+                'job_level': job['seniority'],
+                'job_function': job['function_category'],
+                'date_posted': job['date_posted'],
+                'description': job['description'],
+            })
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic Fractional Pulse job feed")
+    parser.add_argument("count", type=int, help="Number of jobs")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--output", "-o", default="data/jobs.json", help="Output jobs.json path")
+    parser.add_argument("--csv", help="Also write the feed as CSV to this path")
+    args = parser.parse_args()
+
+    write_jobs_json(args.output, args.count, args.seed)
+    print(f"Wrote {args.count} synthetic jobs to {args.output}")
+    if args.csv:
+        write_jobs_csv(args.csv, args.count, args.seed)
+        print(f"Wrote CSV feed to {args.csv}")
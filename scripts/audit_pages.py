@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Page-weight audit for the generated site.
+
+Scans every HTML page under site/ in parallel and reports, per page type
+(home, board, job, other), the HTML bytes, inline CSS bytes, inline JS
+bytes (JSON-LD excluded) and DOM element count, plus the largest pages.
+Each page is checked against PAGE_BUDGETS; any page over budget fails the
+run (exit status 1) unless --warn-only is given.
+
+Run after the page generators and post-processing (prune_css.py, minify)
+so the numbers match what is deployed. The full result is also written to
+build/audit.json.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from site_output import page_type_for
+from build_report import current_stage, worker_span
+
+SITE_DIR = 'site'
+AUDIT_FILE = 'build/audit.json'
+
+# Per-page limits by page type; a page type without an entry is not checked
+PAGE_BUDGETS = {
+    'home': {'html_bytes': 64 * 1024, 'css_bytes': 24 * 1024, 'js_bytes': 8 * 1024, 'dom_nodes': 600},
+    'board': {'html_bytes': 128 * 1024, 'css_bytes': 24 * 1024, 'js_bytes': 32 * 1024, 'dom_nodes': 1500},
+    'job': {'html_bytes': 96 * 1024, 'css_bytes': 32 * 1024, 'js_bytes': 8 * 1024, 'dom_nodes': 1000},
+    'other': {'html_bytes': 64 * 1024, 'css_bytes': 24 * 1024, 'js_bytes': 8 * 1024, 'dom_nodes': 600},
+}
+
+METRICS = ('html_bytes', 'css_bytes', 'js_bytes', 'dom_nodes')
+
+# Largest pages listed per page type
+LARGEST_PAGES = 5
+
+_STYLE_RE = re.compile(r'<style\b[^>]*>(.*?)</style\s*>', re.S | re.I)
+_SCRIPT_RE = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.S | re.I)
+_JSON_LD_RE = re.compile(r'type=["\']application/ld\+json["\']', re.I)
+_RAW_TEXT_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+_ELEMENT_RE = re.compile(r'<[A-Za-z]')
+
+
+def audit_page(site_dir, rel_path):
+    """Measure one page; returns its metrics dict."""
+    with open(f'{site_dir}/{rel_path}', 'rb') as f:
+        raw = f.read()
+    html = raw.decode('utf-8')
+
+    css_bytes = sum(len(css.encode('utf-8')) for css in _STYLE_RE.findall(html))
+    js_bytes = sum(len(js.encode('utf-8')) for attrs, js in _SCRIPT_RE.findall(html)
+                   if not _JSON_LD_RE.search(attrs))
+    # <script>/<style> count as one element each; their contents are not markup
+    markup = _RAW_TEXT_RE.sub(lambda m: '<x>' if m.group(1) else '', html)
+
+    return {
+        'path': rel_path,
+        'type': page_type_for(rel_path),
+        'html_bytes': len(raw),
+        'css_bytes': css_bytes,
+        'js_bytes': js_bytes,
+        'dom_nodes': len(_ELEMENT_RE.findall(markup)),
+    }
+
+
+def _audit_batch(site_dir, rel_paths):
+    start_us = time.time_ns() // 1000
+    return [audit_page(site_dir, rel_path) for rel_path in rel_paths], worker_span(start_us)
+
+
+def iter_html_pages(site_dir=SITE_DIR):
+    """Yield site-relative paths of every HTML page."""
+    for root, dirs, files in os.walk(site_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith('.html'):
+                yield os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+
+
+def audit_site(site_dir=SITE_DIR, workers=None, batch_size=64):
+    """Measure every page under `site_dir` using a process pool; returns a list of page metrics."""
+    rel_paths = list(iter_html_pages(site_dir))
+    batches = [rel_paths[i:i + batch_size] for i in range(0, len(rel_paths), batch_size)]
+    pages = []
+    stage = current_stage()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch, (start_us, end_us, pid, tid) in pool.map(_audit_batch, [site_dir] * len(batches), batches):
+            pages.extend(batch)
+            stage.event('audit batch', start_us, end_us, 'audit', {'pages': len(batch)}, pid=pid, tid=tid)
+    return pages
+
+
+def summarize(pages, largest=LARGEST_PAGES):
+    """Per page type: page count, total/average/max of each metric and the largest pages."""
+    summary = {}
+    for page in pages:
+        summary.setdefault(page['type'], []).append(page)
+    result = {}
+    for page_type, typed in summary.items():
+        entry = {'pages': len(typed)}
+        for metric in METRICS:
+            values = [page[metric] for page in typed]
+            entry[metric] = {'total': sum(values), 'avg': round(sum(values) / len(values)), 'max': max(values)}
+        entry['largest'] = [
+            {'path': page['path'], 'html_bytes': page['html_bytes']}
+            for page in sorted(typed, key=lambda p: p['html_bytes'], reverse=True)[:largest]
+        ]
+        result[page_type] = entry
+    return result
+
+
+def check_budgets(pages, budgets=PAGE_BUDGETS):
+    """Return (path, metric, value, limit) for every page metric over its type's budget."""
+    violations = []
+    for page in pages:
+        for metric, limit in budgets.get(page['type'], {}).items():
+            if page[metric] > limit:
+                violations.append((page['path'], metric, page[metric], limit))
+    return violations
+
+
+def main(warn_only=False, budgets_file=None):
+    """Run the audit; returns the number of budget violations."""
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - PAGE WEIGHT AUDIT")
+    print("=" * 60)
+
+    budgets = {page_type: dict(limits) for page_type, limits in PAGE_BUDGETS.items()}
+    if budgets_file:
+        with open(budgets_file, encoding='utf-8') as f:
+            for page_type, limits in json.load(f).items():
+                budgets.setdefault(page_type, {}).update(limits)
+
+    pages = audit_site()
+    summary = summarize(pages)
+    violations = check_budgets(pages, budgets)
+
+    stage = current_stage()
+    stage.count('records', len(pages))
+    stage.count('budget_violations', len(violations))
+
+    for page_type, entry in summary.items():
+        print(f"  {page_type}: {entry['pages']} pages")
+        for metric in METRICS:
+            limit = budgets.get(page_type, {}).get(metric)
+            budget = f"  (budget {limit:,})" if limit else ''
+            print(f"    {metric:<11} avg {entry[metric]['avg']:>9,}  max {entry[metric]['max']:>9,}{budget}")
+        for page in entry['largest']:
+            print(f"    largest: {page['path']} ({page['html_bytes']:,} bytes)")
+
+    os.makedirs(os.path.dirname(AUDIT_FILE), exist_ok=True)
+    with open(AUDIT_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'summary': summary,
+            'budgets': budgets,
+            'violations': [dict(zip(('path', 'metric', 'value', 'limit'), v)) for v in violations],
+            'pages': pages,
+        }, f, indent=1)
+    print(f"  Saved: {AUDIT_FILE}")
+
+    if violations:
+        label = 'WARNING' if warn_only else 'ERROR'
+        print(f"  {label}: {len(violations)} budget violation(s)")
+        for path, metric, value, limit in violations[:20]:
+            print(f"    {path}: {metric} {value:,} > {limit:,}")
+        if len(violations) > 20:
+            print(f"    ... and {len(violations) - 20} more (see {AUDIT_FILE})")
+    else:
+        print("  All pages within budget")
+    print("=" * 60)
+    return len(violations)
+
+
+if __name__ == "__main__":
+    import argparse
+    from profiling import add_profile_arguments, run_main
+
+    parser = argparse.ArgumentParser(description="Audit generated page weight against budgets")
+    parser.add_argument("--warn-only", action="store_true", help="Report budget violations without failing")
+    parser.add_argument("--budgets", help="JSON file of per-page-type budgets overriding the defaults")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    violations = run_main(main, 'audit', args, warn_only=args.warn_only, budgets_file=args.budgets)
+    if violations and not args.warn_only:
+        sys.exit(1)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Build-time indexes for the job board's client script.
+
+Writes compact JSON files under /assets/search/ so the board can search
+without scanning every card in the DOM:
+- meta.json: job count, shard names and document chunk size
+- <prefix>.json: inverted index shards (token -> delta-encoded job ordinals)
+- docs/<n>.json: job card fields for a range of ordinals, one array per column
+- facets.json: base64 bitsets per facet value for instant filtering and counts
+- sort/<key>.bin: job ordinals in sorted order as a little-endian typed array,
+  described by sorts.json
+
+Job ordinals are positions in jobs.json, the same order as /jobs/.
+"""
+
+import base64
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+# Tokens are grouped into shards by their first SHARD_PREFIX_LENGTH characters
+SHARD_PREFIX_LENGTH = 2
+
+# Jobs per document chunk
+DOCS_CHUNK_SIZE = 200
+
+# Letters and digits; mirrored by /[\p{L}\p{N}]+/gu in the board script
+_TOKEN_RE = re.compile(r'[^\W_]+')
+_SAFE_NAME_RE = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    """Split text into lowercase search tokens (queries need at least two characters)."""
+    return [t for t in _TOKEN_RE.findall((text or '').lower()) if len(t) >= SHARD_PREFIX_LENGTH]
+
+
+def shard_name(prefix):
+    """File name for a token prefix; non-ASCII prefixes are hex-encoded."""
+    if _SAFE_NAME_RE.fullmatch(prefix):
+        return prefix
+    return 'x' + prefix.encode('utf-8').hex()
+
+
+def build_search_index(jobs):
+    """Map each token in a job's company and title to the ordinals that contain it."""
+    index = {}
+    for ordinal, job in enumerate(jobs):
+        text = f"{job.get('company') or ''} {job.get('title') or ''}"
+        for token in set(tokenize(text)):
+            index.setdefault(token, []).append(ordinal)
+    return index
+
+
+def _delta_encode(ordinals):
+    """Encode ascending ordinals as gaps, which keeps shard files small."""
+    previous = 0
+    deltas = []
+    for ordinal in ordinals:
+        deltas.append(ordinal - previous)
+        previous = ordinal
+    return deltas
+
+
+def _write_json(path, data):
+    """Write compact JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    return os.path.getsize(path)
+
+
+def write_search_index(jobs, doc_columns, output_dir):
+    """
+    Write search shards, document chunks and meta.json to `output_dir`.
+
+    Args:
+        jobs: Job records in board order
+        doc_columns: Mapping of column name -> function(job) giving the value
+            the client needs to render a result card
+        output_dir: Directory for the index (replaced on each build)
+
+    Returns:
+        Build statistics (shards, chunks, bytes)
+    """
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(f"{output_dir}/docs", exist_ok=True)
+
+    # Inverted index, split into prefix shards
+    shards = {}
+    for token, ordinals in build_search_index(jobs).items():
+        name = shard_name(token[:SHARD_PREFIX_LENGTH])
+        shards.setdefault(name, {})[token] = _delta_encode(ordinals)
+
+    total_bytes = 0
+    for name, tokens in shards.items():
+        total_bytes += _write_json(f"{output_dir}/{name}.json", dict(sorted(tokens.items())))
+
+    # Card fields in fixed-size chunks, one array per column
+    chunks = 0
+    for start in range(0, len(jobs), DOCS_CHUNK_SIZE):
+        chunk = jobs[start:start + DOCS_CHUNK_SIZE]
+        columns = {column: [value(job) for job in chunk] for column, value in doc_columns.items()}
+        total_bytes += _write_json(f"{output_dir}/docs/{chunks}.json", columns)
+        chunks += 1
+
+    meta = {
+        'count': len(jobs),
+        'prefix_length': SHARD_PREFIX_LENGTH,
+        'docs_chunk_size': DOCS_CHUNK_SIZE,
+        'shards': sorted(shards),
+    }
+    total_bytes += _write_json(f"{output_dir}/meta.json", meta)
+
+    return {'shards': len(shards), 'chunks': chunks, 'bytes': total_bytes}
+
+
+def build_facet_masks(columns):
+    """
+    Build a boolean mask per facet value from a JobColumns view.
+
+    Returns:
+        {facet: {value: mask}} for role, remote, salary, hours and function
+    """
+    def by_category(field):
+        return {value: columns.mask(field, value) for value in columns.categories[field]}
+
+    return {
+        'role': by_category('role_type'),
+        'remote': {'remote': columns.is_remote, 'onsite': ~columns.is_remote},
+        'salary': {'disclosed': columns.has_salary, 'not_disclosed': ~columns.has_salary},
+        'hours': by_category('hours_bucket'),
+        'function': by_category('function_category'),
+    }
+
+
+def encode_bitset(mask):
+    """Pack a boolean mask into a base64 bitset (bit i of byte i // 8 is ordinal i)."""
+    return base64.b64encode(np.packbits(mask, bitorder='little').tobytes()).decode('ascii')
+
+
+def write_facet_bitsets(facet_masks, count, output_dir):
+    """
+    Write facets.json next to the search index.
+
+    The client ANDs bitsets across facets and ORs them within one, then
+    popcounts the result for exact per-button counts under any combination.
+
+    Args:
+        facet_masks: Output of build_facet_masks()
+        count: Number of jobs (bitset length in bits)
+        output_dir: Directory of the search index
+
+    Returns:
+        Size of facets.json in bytes
+    """
+    facets = {
+        facet: {value: encode_bitset(mask) for value, mask in values.items() if mask.any()}
+        for facet, values in facet_masks.items()
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    return _write_json(f"{output_dir}/facets.json", {'count': count, 'facets': facets})
+
+
+def write_sort_orders(orders, count, output_dir):
+    """
+    Write one binary permutation of job ordinals per sort key, plus sorts.json.
+
+    The client loads each file straight into a Uint16Array (Uint32Array for
+    feeds over 65,535 jobs) and walks it to list matches in that order.
+
+    Args:
+        orders: Mapping of sort key -> array of ordinals in sorted order
+        count: Number of jobs
+        output_dir: Directory of the search index
+
+    Returns:
+        Total size of the sort files in bytes
+    """
+    dtype = '<u2' if count <= 0xFFFF else '<u4'
+    os.makedirs(f"{output_dir}/sort", exist_ok=True)
+
+    total_bytes = 0
+    for key, order in orders.items():
+        path = f"{output_dir}/sort/{key}.bin"
+        np.asarray(order, dtype=dtype).tofile(path)
+        total_bytes += os.path.getsize(path)
+
+    meta = {'count': count, 'type': 'uint16' if dtype == '<u2' else 'uint32', 'keys': list(orders)}
+    return total_bytes + _write_json(f"{output_dir}/sorts.json", meta)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Build manifest for Fractional Pulse.
+
+Records a content hash for every generated file under site/ and the build
+date on which that hash last changed, so later stages (sitemap lastmod,
+incremental post-processing) can tell which pages really changed. The
+manifest lives in data/build_manifest.json and is committed with the site.
+
+Run after the page generators and before generate_sitemap.py.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+
+from build_report import current_stage
+
+DATA_DIR = 'data'
+SITE_DIR = 'site'
+MANIFEST_FILE = f'{DATA_DIR}/build_manifest.json'
+
+TODAY = datetime.now().strftime('%Y-%m-%d')
+
+# Files written by the sitemap stage itself (tracked in the "sitemaps" section)
+EXCLUDED_PREFIXES = ('sitemaps/', 'sitemap.xml', 'sitemap_index.xml')
+
+# Precompressed siblings and temporary files
+EXCLUDED_SUFFIXES = ('.gz', '.br', '.tmp')
+
+HASH_CHUNK_SIZE = 1 << 16
+
+
+def file_hash(path):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """Load the manifest, or an empty one if it does not exist yet."""
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    else:
+        manifest = {}
+    manifest.setdefault('files', {})
+    manifest.setdefault('sitemaps', {})
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    """Write the manifest with sorted keys, so unchanged builds give an identical file."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def iter_site_files(site_dir=SITE_DIR):
+    """Yield site-relative paths (with / separators) of tracked files."""
+    for root, dirs, files in os.walk(site_dir):
+        dirs.sort()
+        for name in sorted(files):
+            rel_path = os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+            if not rel_path.startswith(EXCLUDED_PREFIXES) and not rel_path.endswith(EXCLUDED_SUFFIXES):
+                yield rel_path
+
+
+def record(entries, key, content_hash, today=TODAY):
+    """
+    Store `content_hash` for `key`, keeping its lastmod unless the hash changed.
+
+    Returns:
+        'added', 'changed' or 'unchanged'
+    """
+    entry = entries.get(key)
+    if entry and entry.get('hash') == content_hash:
+        return 'unchanged'
+    entries[key] = {'hash': content_hash, 'lastmod': today}
+    return 'changed' if entry else 'added'
+
+
+def update_manifest(site_dir=SITE_DIR, manifest_path=MANIFEST_FILE, today=TODAY):
+    """
+    Hash every tracked file under `site_dir` and update the manifest.
+
+    Files that no longer exist are dropped from the manifest.
+
+    Returns:
+        (manifest, counts) where counts maps added/changed/unchanged/removed
+        to a number of files
+    """
+    manifest = load_manifest(manifest_path)
+    previous = manifest['files']
+    files = {}
+    counts = {'added': 0, 'changed': 0, 'unchanged': 0, 'removed': 0}
+
+    for rel_path in iter_site_files(site_dir):
+        if rel_path in previous:
+            files[rel_path] = previous[rel_path]
+        status = record(files, rel_path, file_hash(f'{site_dir}/{rel_path}'), today)
+        counts[status] += 1
+
+    counts['removed'] = len(set(previous) - set(files))
+    manifest['files'] = files
+    manifest['updated'] = today
+    save_manifest(manifest, manifest_path)
+    return manifest, counts
+
+
+def page_file(url_path):
+    """Map a site URL path such as /jobs/x/ to its manifest key (jobs/x/index.html)."""
+    rel_path = url_path.lstrip('/')
+    if not rel_path or rel_path.endswith('/'):
+        rel_path += 'index.html'
+    return rel_path
+
+
+def page_lastmod(manifest, url_path, default=TODAY):
+    """Date the page at `url_path` last changed, or `default` if it is not tracked."""
+    entry = manifest['files'].get(page_file(url_path))
+    return entry['lastmod'] if entry else default
+
+
+def main():
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - UPDATING BUILD MANIFEST")
+    print("=" * 60)
+
+    if not os.path.isdir(SITE_DIR):
+        print(f"  ERROR: {SITE_DIR}/ not found")
+        sys.exit(1)
+
+    manifest, counts = update_manifest()
+    stage = current_stage()
+    stage.count('records', len(manifest['files']))
+    stage.count('skipped_unchanged', counts['unchanged'])
+    print(f"  Tracked files: {len(manifest['files'])}")
+    print(f"  Added: {counts['added']}, changed: {counts['changed']}, "
+          f"unchanged: {counts['unchanged']}, removed: {counts['removed']}")
+    print(f"  Saved: {MANIFEST_FILE}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    from profiling import run_main
+
+    run_main(main, 'build_manifest')
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Structured build telemetry for Fractional Pulse.
+
+Each pipeline stage runs as its own process. While it runs, the stage
+collects metrics on a Stage object (records processed, pages rendered,
+bytes written, files skipped as unchanged, per-page render times) and
+timed spans. When it finishes, it merges them into two files next to site/:
+
+    build/report.json   per-stage metrics, peak RSS (of the stage and of its
+                        largest worker process) and render-time histograms
+    build/trace.json    Chrome trace events (open in chrome://tracing or
+                        https://ui.perfetto.dev) with stages, phases and
+                        worker processes and threads on a shared timeline
+
+Re-running a stage replaces only that stage's entries. Compare two builds
+with:
+
+    python scripts/build_report.py diff old/report.json build/report.json
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from site_archive import archived_size
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BUILD_DIR = 'build'
+REPORT_FILE = f'{BUILD_DIR}/report.json'
+TRACE_FILE = f'{BUILD_DIR}/trace.json'
+
+# Render-time histogram bucket upper bounds, in milliseconds
+RENDER_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100)
+
+# Cap on per-item trace events a stage records (stage and phase spans are always kept)
+MAX_TRACE_EVENTS = 20000
+
+
+def _now_us():
+    return time.time_ns() // 1000
+
+
+def peak_rss_mb(children=False):
+    """
+    Peak resident set size of this process in MB, or with `children` of its
+    largest terminated child process (pool workers); None where unsupported.
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return round(usage / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def worker_span(start_us):
+    """
+    (start_us, end_us, pid, tid) for work a pool worker began at `start_us`;
+    workers return it so the stage can record the span with Stage.event().
+    """
+    return start_us, _now_us(), os.getpid(), threading.get_ident()
+
+
+def render_histogram(times_ms):
+    """Summarize per-page render times: count, p50/p95/max and bucket counts."""
+    if not times_ms:
+        return {'count': 0}
+    ordered = sorted(times_ms)
+    buckets = {f'<{bound}ms': 0 for bound in RENDER_BUCKETS_MS}
+    buckets[f'>={RENDER_BUCKETS_MS[-1]}ms'] = 0
+    for value in ordered:
+        for bound in RENDER_BUCKETS_MS:
+            if value < bound:
+                buckets[f'<{bound}ms'] += 1
+                break
+        else:
+            buckets[f'>={RENDER_BUCKETS_MS[-1]}ms'] += 1
+    return {
+        'count': len(ordered),
+        'p50_ms': round(ordered[len(ordered) // 2], 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        'max_ms': round(ordered[-1], 3),
+        'total_ms': round(sum(ordered), 1),
+        'histogram': buckets,
+    }
+
+
+class Stage:
+    """Metrics and trace spans for one pipeline stage (see start_stage())."""
+
+    def __init__(self, name):
+        self.name = name
+        self.pid = os.getpid()
+        self.start_us = _now_us()
+        self.counters = {'records': 0, 'pages': 0, 'bytes_written': 0, 'skipped_unchanged': 0}
+        self.phases = {}
+        self.render_ms = []
+        self.events = []
+        self._dropped_events = 0
+        self._lock = threading.Lock()
+
+    def count(self, key, n=1):
+        """Add `n` to a counter (records, pages, bytes_written, skipped_unchanged or any other)."""
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    def page(self, path, seconds=None):
+        """Record one rendered page: its size on disk (or in SITE_ARCHIVE) and, if given, its render time."""
+        size = archived_size(path)
+        if size is None:
+            size = os.path.getsize(path)
+        with self._lock:
+            self.counters['pages'] += 1
+            self.counters['bytes_written'] += size
+            if seconds is not None:
+                self.render_ms.append(seconds * 1000)
+
+    def event(self, name, start_us, end_us, category='work', args=None, pid=None, tid=None):
+        """
+        Add a trace span (worker activity, individual files) on the calling
+        thread, or on the worker process and thread given by `pid` and `tid`.
+        """
+        with self._lock:
+            if len(self.events) >= MAX_TRACE_EVENTS:
+                self._dropped_events += 1
+                return
+            self.events.append(self._trace_event(name, start_us, end_us, category, args, pid, tid))
+
+    def span(self, name):
+        """Context manager timing a phase of the stage (e.g. 'load'); phases also appear in the trace."""
+        return _Span(self, name)
+
+    def _trace_event(self, name, start_us, end_us, category, args=None, pid=None, tid=None):
+        return {
+            'name': name, 'cat': category, 'ph': 'X',
+            'ts': start_us, 'dur': max(end_us - start_us, 1),
+            'pid': pid or self.pid, 'tid': tid or threading.get_ident(),
+            'args': {'stage': self.name, **(args or {})},
+        }
+
+    def metrics(self, wall_seconds):
+        """The report.json entry for this stage."""
+        phases = {name: round(seconds, 3) for name, seconds in self.phases.items()}
+        return {
+            'started': datetime.fromtimestamp(self.start_us / 1e6).isoformat(timespec='seconds'),
+            'wall_seconds': round(wall_seconds, 3),
+            'load_seconds': phases.get('load', 0.0),
+            'phases': phases,
+            **self.counters,
+            'peak_rss_mb': peak_rss_mb(),
+            'peak_rss_children_mb': peak_rss_mb(children=True),
+            'render_time': render_histogram(self.render_ms),
+            'dropped_trace_events': self._dropped_events,
+        }
+
+    def finish(self, report_path=REPORT_FILE, trace_path=TRACE_FILE):
+        """Merge this stage's metrics and trace events into the build report files."""
+        end_us = _now_us()
+        wall_seconds = (end_us - self.start_us) / 1e6
+
+        report = _load_json(report_path, {'stages': {}})
+        report['stages'][self.name] = self.metrics(wall_seconds)
+        report['updated'] = datetime.now().isoformat(timespec='seconds')
+        _save_json(report_path, report)
+
+        stage_event = self._trace_event(self.name, self.start_us, end_us, 'stage')
+        trace = _load_json(trace_path, {'traceEvents': []})
+        events = [e for e in trace['traceEvents'] if e.get('args', {}).get('stage') != self.name]
+        events.append({'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                       'args': {'name': self.name, 'stage': self.name}})
+        for pid in sorted({event['pid'] for event in self.events} - {self.pid}):
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid,
+                           'args': {'name': f'{self.name} worker {pid}', 'stage': self.name}})
+        events.append(stage_event)
+        events.extend(self.events)
+        trace['traceEvents'] = events
+        _save_json(trace_path, trace)
+        return report['stages'][self.name]
+
+
+class _Span:
+    def __init__(self, stage, name):
+        self.stage = stage
+        self.name = name
+
+    def __enter__(self):
+        self.start_us = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_us = _now_us()
+        stage = self.stage
+        with stage._lock:
+            stage.phases[self.name] = stage.phases.get(self.name, 0.0) + (end_us - self.start_us) / 1e6
+            stage.events.append(stage._trace_event(self.name, self.start_us, end_us, 'phase'))
+
+
+def _load_json(path, default):
+    if os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError:
+            pass
+    return default
+
+
+def _save_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    os.replace(f'{path}.tmp', path)
+
+
+_current = None
+
+
+def start_stage(name):
+    """Begin collecting telemetry for stage `name`; it becomes current_stage()."""
+    global _current
+    _current = Stage(name)
+    return _current
+
+
+def current_stage():
+    """
+    The running stage. Outside a stage (e.g. when a generator is imported by
+    a benchmark), returns a detached Stage that is never written.
+    """
+    global _current
+    if _current is None:
+        _current = Stage(None)
+    return _current
+
+
+def finish_stage():
+    """Write the running stage to the report files; returns its metrics (None if detached)."""
+    global _current
+    stage, _current = _current, None
+    if stage is None or stage.name is None:
+        return None
+    return stage.finish()
+
+
+DIFF_METRICS = ('wall_seconds', 'load_seconds', 'records', 'pages', 'bytes_written',
+                'skipped_unchanged', 'peak_rss_mb', 'peak_rss_children_mb')
+
+
+def diff_reports(old, new):
+    """Yield (stage, metric, old, new) for every metric that differs between two reports."""
+    for name in list(new['stages']) + [n for n in old['stages'] if n not in new['stages']]:
+        old_stage = old['stages'].get(name, {})
+        new_stage = new['stages'].get(name, {})
+        for metric in DIFF_METRICS:
+            before, after = old_stage.get(metric), new_stage.get(metric)
+            if before != after:
+                yield name, metric, before, after
+        before = old_stage.get('render_time', {}).get('p95_ms')
+        after = new_stage.get('render_time', {}).get('p95_ms')
+        if before != after:
+            yield name, 'render_p95_ms', before, after
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect Fractional Pulse build reports")
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('show', help="Print a build report")
+    show.add_argument('report', nargs='?', default=REPORT_FILE)
+    diff = sub.add_parser('diff', help="Compare two build reports")
+    diff.add_argument('old')
+    diff.add_argument('new', nargs='?', default=REPORT_FILE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - BUILD REPORT")
+    print("=" * 60)
+
+    if args.command == 'show':
+        report = _load_json(args.report, {'stages': {}})
+        for name, stage in report['stages'].items():
+            render = stage.get('render_time', {})
+            p95 = f", p95 render {render['p95_ms']} ms" if render.get('count') else ''
+            children = f" (children {stage['peak_rss_children_mb']} MB)" if stage.get('peak_rss_children_mb') else ''
+            print(f"  {name:<15} {stage['wall_seconds']:>8.2f}s  {stage['records']:>7,} records  {stage['pages']:>7,} pages  "
+                  f"{stage['bytes_written']:>13,} bytes  {stage['skipped_unchanged']:>6,} unchanged  "
+                  f"{stage['peak_rss_mb']} MB{children}{p95}")
+    else:
+        old = _load_json(args.old, {'stages': {}})
+        new = _load_json(args.new, {'stages': {}})
+        changes = list(diff_reports(old, new))
+        for name, metric, before, after in changes:
+            delta = ''
+            if isinstance(before, (int, float)) and isinstance(after, (int, float)) and before:
+                delta = f" ({(after - before) / before:+.0%})"
+            print(f"  {name:<15} {metric:<18} {before} -> {after}{delta}")
+        if not changes:
+            print("  No differences")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
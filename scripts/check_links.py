@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Internal link checker for the generated site.
+
+Extracts every <a href> from the HTML pages under site/ (pages are fed to
+html.parser in chunks, across a process pool), resolves the internal ones
+to files in site/ and builds the link graph in memory. Reports:
+
+    broken targets   internal links to files the build did not produce
+    orphan pages     pages no other page links to (the homepage excepted)
+    inbound links    pages ranked by how many distinct pages link to them
+
+Links found in each page are cached in build/cache/links.json under the
+page's content hash from the build manifest, so only pages whose hash
+changed are parsed again. Run after build_manifest.py. The full graph
+summary is written to build/links.json.
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import unquote, urljoin, urlsplit
+
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from nav_config import BASE_URL
+from build_manifest import load_manifest, page_file
+from build_report import current_stage, worker_span
+
+SITE_DIR = 'site'
+LINKS_FILE = 'build/links.json'
+LINK_CACHE_FILE = 'build/cache/links.json'
+
+READ_CHUNK_SIZE = 1 << 16
+
+# Non-navigational link schemes
+SKIPPED_PREFIXES = ('#', 'mailto:', 'tel:', 'javascript:', 'data:')
+
+# Entries printed per report section (build/links.json has them all)
+REPORT_LIMIT = 20
+
+# Source pages kept per broken target in build/links.json
+BROKEN_SAMPLE_SIZE = 5
+
+_SITE = urlsplit(BASE_URL)
+
+
+class _LinkParser(HTMLParser):
+    """Collects <a href> values; markup inside <script> is not parsed as tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            for name, value in attrs:
+                if name == 'href' and value:
+                    self.links.append(value)
+
+
+def extract_links(path):
+    """Return the href of every <a> in the HTML file at `path`, in order."""
+    parser = _LinkParser()
+    with open(path, encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), ''):
+            parser.feed(chunk)
+    parser.close()
+    return parser.links
+
+
+def _extract_batch(site_dir, rel_paths):
+    start_us = time.time_ns() // 1000
+    return [(rel_path, extract_links(f'{site_dir}/{rel_path}')) for rel_path in rel_paths], worker_span(start_us)
+
+
+def page_url(rel_path):
+    """URL path a page is served at (jobs/x/index.html -> /jobs/x/)."""
+    if rel_path == 'index.html':
+        return '/'
+    if rel_path.endswith('/index.html'):
+        return '/' + rel_path[:-len('index.html')]
+    return '/' + rel_path
+
+
+def resolve_link(href, base_url):
+    """
+    Site-relative file an internal link points at, or None for external and
+    non-navigational links. Query strings and fragments are ignored.
+    """
+    href = href.strip()
+    if not href or href.startswith(SKIPPED_PREFIXES):
+        return None
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc:
+        if parts.netloc != _SITE.netloc or parts.scheme not in ('http', 'https', ''):
+            return None
+        path = parts.path or '/'
+    else:
+        path = urlsplit(urljoin(base_url, parts.path or base_url)).path
+    path = unquote(path)
+    last = path.rsplit('/', 1)[-1]
+    if last and '.' not in last:
+        # Extensionless paths are served as directories (/jobs -> /jobs/)
+        path += '/'
+    return page_file(path)
+
+
+def iter_site_files(site_dir=SITE_DIR):
+    """Yield site-relative paths of every file under `site_dir`."""
+    for root, dirs, files in os.walk(site_dir):
+        dirs.sort()
+        for name in sorted(files):
+            yield os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+
+
+def _load_cache(path=LINK_CACHE_FILE):
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def _save_cache(cache, path=LINK_CACHE_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(f'{path}.tmp', path)
+
+
+def collect_links(site_dir=SITE_DIR, pages=(), workers=None, batch_size=64):
+    """
+    Return ({page: [href, ...]}, parsed_count) for `pages`, parsing only those
+    whose manifest hash differs from the cached one.
+    """
+    hashes = {path: entry.get('hash') for path, entry in load_manifest()['files'].items()}
+    cached = _load_cache()
+
+    links = {}
+    stale = []
+    for rel_path in pages:
+        entry = cached.get(rel_path)
+        content_hash = hashes.get(rel_path)
+        if entry and content_hash and entry['hash'] == content_hash:
+            links[rel_path] = entry['links']
+        else:
+            stale.append(rel_path)
+
+    batches = [stale[i:i + batch_size] for i in range(0, len(stale), batch_size)]
+    if batches:
+        stage = current_stage()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch, (start_us, end_us, pid, tid) in pool.map(_extract_batch, [site_dir] * len(batches), batches):
+                links.update(batch)
+                stage.event('parse batch', start_us, end_us, 'links', {'pages': len(batch)}, pid=pid, tid=tid)
+
+    _save_cache({
+        rel_path: {'hash': hashes[rel_path], 'links': hrefs}
+        for rel_path, hrefs in links.items() if hashes.get(rel_path)
+    })
+    return links, len(stale)
+
+
+def build_graph(links, files):
+    """
+    Resolve raw hrefs into a link graph.
+
+    Returns:
+        (inbound, broken) where inbound maps each page to the set of other
+        pages linking to it and broken maps each missing target to the set
+        of pages linking to it
+    """
+    inbound = {}
+    broken = {}
+    for source, hrefs in links.items():
+        base_url = page_url(source)
+        for href in hrefs:
+            target = resolve_link(href, base_url)
+            if target is None or target == source:
+                continue
+            if target in files:
+                inbound.setdefault(target, set()).add(source)
+            else:
+                broken.setdefault(target, set()).add(source)
+    return inbound, broken
+
+
+def main():
+    """Check the site's internal links; returns the number of broken targets."""
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - CHECKING INTERNAL LINKS")
+    print("=" * 60)
+
+    files = set(iter_site_files())
+    pages = sorted(path for path in files if path.endswith('.html'))
+    links, parsed = collect_links(SITE_DIR, pages)
+    inbound, broken = build_graph(links, files)
+
+    orphans = [path for path in pages if path != 'index.html' and not inbound.get(path)]
+    ranked = sorted(inbound.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    stage = current_stage()
+    stage.count('records', len(pages))
+    stage.count('skipped_unchanged', len(pages) - parsed)
+    stage.count('broken_links', len(broken))
+
+    total_links = sum(len(hrefs) for hrefs in links.values())
+    print(f"  Pages: {len(pages)} ({parsed} parsed, {len(pages) - parsed} unchanged)")
+    print(f"  Links: {total_links:,}")
+
+    print(f"  Broken targets: {len(broken)}")
+    for target, sources in sorted(broken.items(), key=lambda item: (-len(item[1]), item[0]))[:REPORT_LIMIT]:
+        print(f"    /{target} <- {len(sources)} page(s), e.g. /{min(sources)}")
+
+    print(f"  Orphan pages: {len(orphans)}")
+    for path in orphans[:REPORT_LIMIT]:
+        print(f"    /{path}")
+
+    print("  Most linked pages:")
+    for path, sources in ranked[:10]:
+        print(f"    /{path} <- {len(sources)} page(s)")
+
+    os.makedirs(os.path.dirname(LINKS_FILE), exist_ok=True)
+    with open(LINKS_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'pages': len(pages),
+            'links': total_links,
+            'broken': {
+                target: {'pages': len(sources), 'examples': sorted(sources)[:BROKEN_SAMPLE_SIZE]}
+                for target, sources in sorted(broken.items())
+            },
+            'orphans': orphans,
+            'inbound': {path: len(sources) for path, sources in ranked},
+        }, f, indent=1)
+    print(f"  Saved: {LINKS_FILE}")
+    print("=" * 60)
+    return len(broken)
+
+
+if __name__ == "__main__":
+    import argparse
+    from profiling import add_profile_arguments, run_main
+
+    parser = argparse.ArgumentParser(description="Check internal links in the generated site")
+    parser.add_argument("--fail-on-broken", action="store_true", help="Exit with status 1 if any link is broken")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    broken = run_main(main, 'links', args)
+    if broken and args.fail_on_broken:
+        sys.exit(1)
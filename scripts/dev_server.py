@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Local preview server for Fractional Pulse.
+
+Serves the homepage, the job board listings and every /jobs/<slug>/ page
+from memory, rendered on request with the generators' own render functions.
+The board's search index (/assets/search/) is built from the same in-memory
+jobs; everything else (assets, robots.txt, ...) is served from site/.
+jobs.json is loaded once and rendered pages are kept in an LRU cache.
+
+data/jobs.json, the scripts pages are rendered with and the static assets
+under site/assets/ (CSS, JS, images) are polled for changes. An edited
+jobs.json drops only the cached job pages whose inputs (the job and its
+similar jobs) changed, plus the board listings and search index. An edited
+script is reloaded and drops only the page kinds it renders. Every HTML
+page served carries a small live-reload script listening on
+/__livereload (server-sent events), so open pages reload themselves after
+any of these changes without running a build.
+
+    python scripts/dev_server.py [--port 8000] [--virtual-list]
+"""
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from functools import partial
+from html import escape
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+import board_index
+import generate_homepage
+import generate_job_board
+import generate_job_pages
+import job_columns
+import job_store
+import minify
+import site_output
+from render_cache import cache_key
+
+DATA_DIR = 'data'
+SITE_DIR = 'site'
+JOBS_FILE = f'{DATA_DIR}/jobs.json'
+
+# Served from the index built over the in-memory jobs, never from the last build in site/
+SEARCH_URL = '/assets/search/'
+
+# Rendered pages kept in memory
+PAGE_CACHE_SIZE = 512
+
+# Seconds between checks for changed files
+POLL_INTERVAL = 0.5
+
+# Static files served from site/ whose edits trigger a live reload (the
+# search index under it is served from memory and not watched)
+ASSET_DIRS = (f'{SITE_DIR}/assets',)
+
+# Server-sent events stream that tells open pages to reload
+LIVE_RELOAD_URL = '/__livereload'
+
+# Seconds between keep-alive comments on an idle live-reload stream
+LIVE_RELOAD_KEEPALIVE = 15
+
+# Injected before </body> of every HTML page served; reloads once the build
+# version differs from the one the page was served with
+LIVE_RELOAD_SNIPPET = '''<script>
+(function() {
+    let version = null;
+    new EventSource('%s').onmessage = event => {
+        if (version !== null && event.data !== version) location.reload();
+        version = event.data;
+    };
+})();
+</script>
+''' % LIVE_RELOAD_URL
+
+# Modules pages are rendered with, in import order; all are reloaded when any changes
+RELOAD_ORDER = (
+    'nav_config', 'tracking_config', 'minify', 'templates', 'site_output', 'build_report', 'render_cache',
+    'job_store', 'job_columns', 'board_index', 'generate_job_pages', 'generate_job_board', 'generate_homepage',
+)
+
+PAGE_KINDS = frozenset({'home', 'board', 'job'})
+
+# Page kinds a module renders; a change to any other module in RELOAD_ORDER affects every page
+MODULE_PAGES = {
+    'generate_homepage': {'home'},
+    'generate_job_board': {'board'},
+    'board_index': {'board'},
+    'job_columns': {'board'},
+    'generate_job_pages': {'job'},
+    'render_cache': {'job'},
+}
+
+
+class PreviewSite:
+    """The job feed held in memory and an LRU cache of pages rendered from it."""
+
+    def __init__(self, jobs_file=JOBS_FILE, cache_size=PAGE_CACHE_SIZE, virtual_list=False):
+        self.jobs_file = jobs_file
+        self.cache_size = cache_size
+        self.virtual_list = virtual_list
+        # URL path -> (page kind, inputs key, HTML bytes)
+        self.pages = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+        # Temporary directory holding the board's search index; built on first use
+        self._search_dir = None
+        # Bumped after every reload; live-reload streams wait on it
+        self.version = 0
+        self.changed = threading.Condition()
+        self.load_jobs()
+
+    def load_jobs(self):
+        """(Re)read the job feed and rebuild the indexes pages are rendered from."""
+        with self.lock:
+            self.jobs = list(job_store.iter_jobs(self.jobs_file))
+            # Later duplicates win, as they overwrite earlier pages in a full build
+            self.by_slug = {job['slug']: job for job in self.jobs if job.get('slug')}
+            self.similar_index = job_store.build_similar_index(self.jobs)
+            self._listings = None
+            self.drop_search_index()
+
+    def listings(self):
+        """Map each board listing URL to (listing, page, get_page_bounds() of the listing); built on first use."""
+        if self._listings is None:
+            columns = job_columns.JobColumns(self.jobs)
+            facet_counts = generate_job_board.count_facets(board_index.build_facet_masks(columns))
+            urls = {}
+            for listing in generate_job_board.iter_listings(columns, facet_counts):
+                bounds = generate_job_board.get_page_bounds(len(listing['ordinals']), self.virtual_list)
+                for page in range(1, len(bounds) + 1):
+                    urls[generate_job_board.get_page_path(listing['base_path'], page)] = (listing, page, bounds)
+            self._listings = urls
+        return self._listings
+
+    def search_file(self, url):
+        """Bytes of the /assets/search/ file at `url` for the current jobs, or None if there is none."""
+        with self.lock:
+            if self._search_dir is None:
+                search_dir = tempfile.mkdtemp(prefix='fractional-search-')
+                columns = job_columns.JobColumns(self.jobs)
+                facet_masks = board_index.build_facet_masks(columns)
+                generate_job_board.write_board_index(self.jobs, columns, facet_masks, search_dir)
+                self._search_dir = search_dir
+
+            path = os.path.normpath(os.path.join(self._search_dir, url[len(SEARCH_URL):]))
+            if not path.startswith(self._search_dir + os.sep) or not os.path.isfile(path):
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+
+    def drop_search_index(self):
+        """Remove the built search index; the next request rebuilds it."""
+        with self.lock:
+            if self._search_dir is not None:
+                shutil.rmtree(self._search_dir, ignore_errors=True)
+                self._search_dir = None
+
+    def job_inputs(self, url):
+        """Key over everything a job page is rendered from (None if the job is gone)."""
+        job = self.by_slug.get(url[len('/jobs/'):-1])
+        if job is None:
+            return None
+        similar = job_store.get_similar_jobs(self.similar_index, job)
+        return cache_key(json.dumps(job, sort_keys=True), json.dumps(similar, sort_keys=True))
+
+    def _render(self, url):
+        """Return (kind, inputs key, HTML) for `url`, or None if it is not a rendered page."""
+        if url == '/':
+            return 'home', None, generate_homepage.render_homepage()
+
+        slug = url[len('/jobs/'):-1] if url.startswith('/jobs/') else None
+        if slug in self.by_slug:
+            job = self.by_slug[slug]
+            similar = job_store.get_similar_jobs(self.similar_index, job)
+            return 'job', self.job_inputs(url), generate_job_pages.render_job_page(job, similar)
+
+        if url in self.listings():
+            listing, page, bounds = self.listings()[url]
+            ordinals = listing['ordinals']
+            start, end = bounds[page - 1]
+            html = generate_job_board.render_listing_page(
+                [self.jobs[i] for i in ordinals[start:end]],
+                listing['heading'], listing['subtitle'], listing['base_path'], page, len(bounds),
+                len(ordinals), listing['filters'], role=listing.get('role'),
+                remote_only=listing.get('remote_only', False), virtual_list=self.virtual_list,
+            )
+            return 'board', None, html
+        return None
+
+    def page(self, url):
+        """HTML bytes for `url` from the cache or freshly rendered; None if `url` is not a page."""
+        with self.lock:
+            entry = self.pages.get(url)
+            if entry is not None:
+                self.pages.move_to_end(url)
+                self.hits += 1
+                return entry[2]
+
+            rendered = self._render(url)
+            if rendered is None:
+                return None
+            kind, inputs, html = rendered
+            if site_output.MINIFY_HTML:
+                html = minify.minify_html(html)
+            body = html.encode('utf-8')
+
+            self.misses += 1
+            self.pages[url] = (kind, inputs, body)
+            while len(self.pages) > self.cache_size:
+                self.pages.popitem(last=False)
+            return body
+
+    def invalidate(self, kinds):
+        """Drop cached pages of the given kinds; returns how many were dropped."""
+        with self.lock:
+            stale = [url for url, (kind, _, _) in self.pages.items() if kind in kinds]
+            for url in stale:
+                del self.pages[url]
+            return len(stale)
+
+    def bump_version(self):
+        """Tell open pages (through their live-reload streams) to reload."""
+        with self.changed:
+            self.version += 1
+            self.changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """Block until the version differs from `version` or `timeout` passes; returns the version."""
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def reload_jobs(self):
+        """Re-read jobs.json, dropping the board and the job pages whose inputs changed."""
+        with self.lock:
+            self.load_jobs()
+            stale = [
+                url for url, (kind, inputs, _) in self.pages.items()
+                if kind == 'board' or (kind == 'job' and self.job_inputs(url) != inputs)
+            ]
+            for url in stale:
+                del self.pages[url]
+            return len(stale)
+
+    def reload_modules(self, names):
+        """Reload the render modules after `names` changed; returns the number of pages dropped."""
+        with self.lock:
+            for name in RELOAD_ORDER:
+                if name in sys.modules:
+                    importlib.reload(sys.modules[name])
+
+            kinds = set()
+            for name in names:
+                kinds |= MODULE_PAGES.get(name, PAGE_KINDS)
+            if 'job_store' in names:
+                return self.reload_jobs() + self.invalidate(kinds)
+            if 'board' in kinds:
+                self._listings = None
+                self.drop_search_index()
+            return self.invalidate(kinds)
+
+
+def _asset_paths():
+    """Files under ASSET_DIRS, except the search index (served from memory)."""
+    search_dir = os.path.normpath(SITE_DIR + SEARCH_URL)
+    for asset_dir in ASSET_DIRS:
+        for root, dirs, files in os.walk(asset_dir):
+            if os.path.normpath(root) == search_dir:
+                dirs.clear()
+                continue
+            for name in files:
+                yield os.path.join(root, name)
+
+
+def _snapshot(jobs_file):
+    """Modification times of the job feed, every module in RELOAD_ORDER and the static assets."""
+    paths = [jobs_file] + [os.path.join(script_dir, f'{name}.py') for name in RELOAD_ORDER]
+    snapshot = {path: os.path.getmtime(path) for path in paths if os.path.exists(path)}
+    for path in _asset_paths():
+        try:
+            snapshot[path] = os.path.getmtime(path)
+        except OSError:
+            # Removed between listing and stat
+            pass
+    return snapshot
+
+
+def watch(site, interval=POLL_INTERVAL):
+    """
+    Poll for changed data, scripts and assets, invalidate the affected pages
+    and signal open pages to reload (runs forever).
+    """
+    seen = _snapshot(site.jobs_file)
+    while True:
+        time.sleep(interval)
+        current = _snapshot(site.jobs_file)
+        changed = {path for path in current.keys() | seen.keys() if current.get(path) != seen.get(path)}
+        seen = current
+        if not changed:
+            continue
+
+        modules = {os.path.basename(path)[:-3] for path in changed if path.startswith(script_dir + os.sep)}
+        assets = {path for path in changed if path != site.jobs_file and not path.startswith(script_dir + os.sep)}
+        try:
+            if modules:
+                dropped = site.reload_modules(modules)
+                print(f"  Reloaded {', '.join(sorted(modules))}: {dropped} cached pages dropped")
+            if site.jobs_file in changed:
+                dropped = site.reload_jobs()
+                print(f"  Reloaded {site.jobs_file} ({len(site.jobs)} jobs): {dropped} cached pages dropped")
+            if assets:
+                print(f"  Changed {len(assets)} asset(s) under {', '.join(ASSET_DIRS)}")
+        except Exception:
+            # Keep serving the last good code and data until the next edit
+            traceback.print_exc()
+            continue
+        site.bump_version()
+
+
+def inject_live_reload(body):
+    """Add LIVE_RELOAD_SNIPPET before the closing </body> of an HTML page (bytes)."""
+    snippet = LIVE_RELOAD_SNIPPET.encode('utf-8')
+    index = body.rfind(b'</body>')
+    if index == -1:
+        return body + snippet
+    return body[:index] + snippet + body[index:]
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """
+    Serves rendered pages from a PreviewSite and every other file from
+    site/; HTML pages get the live-reload script.
+    """
+
+    def __init__(self, *args, site=None, **kwargs):
+        self.site = site
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        url = urlsplit(self.path).path
+        if url == LIVE_RELOAD_URL:
+            return self._live_reload() if send_body else self.send_error(405)
+        if url.endswith('/index.html'):
+            url = url[:-len('index.html')]
+        elif not url.endswith('/') and '.' not in url.rsplit('/', 1)[-1]:
+            # Extensionless paths are served as directories (/jobs -> /jobs/)
+            self.send_response(301)
+            self.send_header('Location', url + '/')
+            self.end_headers()
+            return
+
+        status, content_type = 200, 'text/html; charset=utf-8'
+        try:
+            if url.startswith(SEARCH_URL):
+                body = self.site.search_file(url)
+                if body is None:
+                    self.send_error(404)
+                    return
+                content_type = self.guess_type(url)
+            else:
+                body = self.site.page(url) or self._static_page()
+                if body is not None:
+                    body = inject_live_reload(body)
+        except Exception:
+            # An HTML error page, so the live-reload script picks up the fix
+            status = 500
+            body = inject_live_reload(f'<pre>{escape(traceback.format_exc())}</pre>'.encode('utf-8'))
+
+        if body is None:
+            return super().do_GET() if send_body else super().do_HEAD()
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _static_page(self):
+        """Bytes of a static HTML page under site/ (e.g. /about/), or None for other files."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        if not path.endswith('.html') or not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def _live_reload(self):
+        """Stream the site version as server-sent events until the page goes away."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        version = self.site.version
+        try:
+            self.wfile.write(f'data: {version}\n\n'.encode('utf-8'))
+            self.wfile.flush()
+            while True:
+                current = self.site.wait_for_change(version, LIVE_RELOAD_KEEPALIVE)
+                if current == version:
+                    self.wfile.write(b': keep-alive\n\n')
+                else:
+                    version = current
+                    self.wfile.write(f'data: {version}\n\n'.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def main(host='127.0.0.1', port=8000, virtual_list=False):
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - DEV SERVER")
+    print("=" * 60)
+
+    if not os.path.exists(JOBS_FILE):
+        print(f"  ERROR: {JOBS_FILE} not found")
+        sys.exit(1)
+
+    site = PreviewSite(virtual_list=virtual_list)
+    print(f"  Loaded {len(site.jobs)} jobs from {JOBS_FILE}")
+    threading.Thread(target=watch, args=(site,), daemon=True).start()
+
+    server = ThreadingHTTPServer((host, port), partial(PreviewHandler, site=site, directory=SITE_DIR))
+    print(f"  Serving http://{host}:{port}/ with live reload (Ctrl+C to stop)")
+    print("=" * 60)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        site.drop_search_index()
+        print(f"\n  Page cache: {site.hits} hits, {site.misses} misses")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Preview the Fractional Pulse site with on-demand rendering and live reload")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--virtual-list", action="store_true",
+                        help="Render board listings as generate_job_board.py --virtual-list does")
+    args = parser.parse_args()
+
+    main(args.host, args.port, args.virtual_list)
@@ -13,6 +13,12 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from job_columns import JobColumns, hourly_rate_summary
+from job_store import write_similar_index
+from build_report import current_stage
+
 # Add scraper project to path (for database exports)
 SCRAPER_PATH = "/Users/rome/Documents/projects/scrapers/fractional"
 
@@ -226,44 +232,18 @@ def export_jobs(output_dir: str = None, db_path: str = None) -> dict:
     from models.database import FractionalJob
 
     # Query active jobs
-    jobs = session.query(FractionalJob).filter(
-        FractionalJob.is_active == True
-    ).order_by(FractionalJob.date_posted.desc()).all()
+    stage = current_stage()
+    with stage.span('load'):
+        jobs = session.query(FractionalJob).filter(
+            FractionalJob.is_active == True
+        ).order_by(FractionalJob.date_posted.desc()).all()
 
     # Convert to export format
     jobs_data = [job_to_dict(job) for job in jobs]
+    stage.count('records', len(jobs_data))
 
     # Calculate statistics
-    stats = {
-        "total_jobs": len(jobs_data),
-        "by_role_type": {},
-        "by_function": {},
-        "by_location_type": {},
-        "with_salary": 0,
-        "c_level": 0,
-        "vp_level": 0,
-    }
-
-    for job in jobs_data:
-        # Count by role type
-        role = job["role_type"] or "other"
-        stats["by_role_type"][role] = stats["by_role_type"].get(role, 0) + 1
-
-        # Count by function
-        func = job["function_category"] or "other"
-        stats["by_function"][func] = stats["by_function"].get(func, 0) + 1
-
-        # Count by location type
-        loc = job["location_type"] or "remote"
-        stats["by_location_type"][loc] = stats["by_location_type"].get(loc, 0) + 1
-
-        # Other stats
-        if job["has_salary"]:
-            stats["with_salary"] += 1
-        if job["is_c_level"]:
-            stats["c_level"] += 1
-        if job["is_vp_level"]:
-            stats["vp_level"] += 1
+    stats = JobColumns(jobs_data).stats()
 
     # Write jobs.json
     output_data = {
@@ -277,6 +257,10 @@ def export_jobs(output_dir: str = None, db_path: str = None) -> dict:
     with open(jobs_file, "w", encoding="utf-8") as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+    # Side index so page generation can stream jobs.json in one pass
+    write_similar_index(os.path.join(output_dir, "similar_jobs.json"), jobs_data, jobs_file)
+    stage.count('bytes_written', os.path.getsize(jobs_file))
+
     print(f"Exported {len(jobs_data)} jobs to {jobs_file}")
     print(f"  C-Level roles: {stats['c_level']}")
     print(f"  VP-Level roles: {stats['vp_level']}")
@@ -311,15 +295,15 @@ def export_market_stats(output_dir: str = None, db_path: str = None) -> dict:
         FractionalJob.is_active == True
     ).count()
 
-    # Get compensation stats for jobs with hourly rates
-    jobs_with_comp = session.query(FractionalJob).filter(
+    # Get compensation stats for jobs with hourly rates (only the rate column is loaded)
+    rate_rows = session.query(FractionalJob.hourly_rate_min).filter(
         FractionalJob.is_active == True,
         FractionalJob.hourly_rate_min.isnot(None)
     ).all()
 
-    hourly_rates = [j.hourly_rate_min for j in jobs_with_comp if j.hourly_rate_min]
-    avg_hourly = sum(hourly_rates) / len(hourly_rates) if hourly_rates else 0
-    median_hourly = sorted(hourly_rates)[len(hourly_rates) // 2] if hourly_rates else 0
+    sample_size, avg_hourly, median_hourly = hourly_rate_summary(
+        np.fromiter((row[0] for row in rate_rows), dtype=np.float64, count=len(rate_rows))
+    )
 
     # Get recent snapshot for trends
     latest_snapshot = session.query(ListingSnapshot).filter(
@@ -330,10 +314,10 @@ def export_market_stats(output_dir: str = None, db_path: str = None) -> dict:
         "last_updated": datetime.now().strftime("%Y-%m-%d"),
         "total_active_listings": active_count,
         "compensation": {
-            "sample_size": len(hourly_rates),
+            "sample_size": sample_size,
             "avg_hourly_rate": round(avg_hourly, 0) if avg_hourly else None,
             "median_hourly_rate": round(median_hourly, 0) if median_hourly else None,
-            "disclosure_rate": round(len(hourly_rates) / active_count * 100, 1) if active_count else 0,
+            "disclosure_rate": round(sample_size / active_count * 100, 1) if active_count else 0,
         },
         "trends": {},
     }
@@ -373,10 +357,12 @@ def import_from_csv(csv_path: str, output_dir: str = None) -> dict:
     os.makedirs(output_dir, exist_ok=True)
 
     jobs_data = []
+    stage = current_stage()
 
     with open(csv_path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
+            stage.count('records')
             # Skip non-fractional jobs
             title_lower = (row.get("title") or "").lower()
             if not any(term in title_lower for term in [
@@ -492,32 +478,8 @@ def import_from_csv(csv_path: str, output_dir: str = None) -> dict:
             jobs_data.append(job_data)
 
     # Calculate statistics
-    stats = {
-        "total_jobs": len(jobs_data),
-        "by_role_type": {},
-        "by_function": {},
-        "by_location_type": {},
-        "with_salary": 0,
-        "c_level": 0,
-        "vp_level": 0,
-    }
-
-    for job in jobs_data:
-        role = job["role_type"] or "other"
-        stats["by_role_type"][role] = stats["by_role_type"].get(role, 0) + 1
-
-        func = job["function_category"] or "other"
-        stats["by_function"][func] = stats["by_function"].get(func, 0) + 1
-
-        loc = job["location_type"] or "remote"
-        stats["by_location_type"][loc] = stats["by_location_type"].get(loc, 0) + 1
-
-        if job["has_salary"]:
-            stats["with_salary"] += 1
-        if job["is_c_level"]:
-            stats["c_level"] += 1
-        if job["is_vp_level"]:
-            stats["vp_level"] += 1
+    columns = JobColumns(jobs_data)
+    stats = columns.stats()
 
     # Write jobs.json
     output_data = {
@@ -531,6 +493,10 @@ def import_from_csv(csv_path: str, output_dir: str = None) -> dict:
     with open(jobs_file, "w", encoding="utf-8") as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+    # Side index so page generation can stream jobs.json in one pass
+    write_similar_index(os.path.join(output_dir, "similar_jobs.json"), jobs_data, jobs_file)
+    stage.count('bytes_written', os.path.getsize(jobs_file))
+
     print(f"Imported {len(jobs_data)} jobs from CSV to {jobs_file}")
     print(f"  C-Level roles: {stats['c_level']}")
     print(f"  VP-Level roles: {stats['vp_level']}")
@@ -538,18 +504,16 @@ def import_from_csv(csv_path: str, output_dir: str = None) -> dict:
     print(f"  By role type: {stats['by_role_type']}")
 
     # Write market stats
-    hourly_rates = [j["compensation"]["hourly_min"] for j in jobs_data if j["compensation"]["hourly_min"]]
-    avg_hourly = sum(hourly_rates) / len(hourly_rates) if hourly_rates else 0
-    median_hourly = sorted(hourly_rates)[len(hourly_rates) // 2] if hourly_rates else 0
+    sample_size, avg_hourly, median_hourly = hourly_rate_summary(columns.hourly_min)
 
     market_stats = {
         "last_updated": datetime.now().strftime("%Y-%m-%d"),
         "total_active_listings": len(jobs_data),
         "compensation": {
-            "sample_size": len(hourly_rates),
+            "sample_size": sample_size,
             "avg_hourly_rate": round(avg_hourly, 0) if avg_hourly else None,
             "median_hourly_rate": round(median_hourly, 0) if median_hourly else None,
-            "disclosure_rate": round(len(hourly_rates) / len(jobs_data) * 100, 1) if jobs_data else 0,
+            "disclosure_rate": round(sample_size / len(jobs_data) * 100, 1) if jobs_data else 0,
         },
         "trends": {},
     }
@@ -563,8 +527,27 @@ def import_from_csv(csv_path: str, output_dir: str = None) -> dict:
     return stats
 
 
+def main(output_dir: str, db_path: str = None, csv_path: str = None):
+    """Export jobs (and market stats) from the database, or import them from CSV."""
+    print("Exporting job data for Fractional Pulse...")
+    print("=" * 50)
+
+    if csv_path:
+        # Import from CSV
+        import_from_csv(csv_path, output_dir)
+    else:
+        # Export from database
+        export_jobs(output_dir, db_path)
+        print()
+        export_market_stats(output_dir, db_path)
+
+    print()
+    print("Export complete!")
+
+
 if __name__ == "__main__":
     import argparse
+    from profiling import add_profile_arguments, run_main
 
     parser = argparse.ArgumentParser(description="Export jobs for Fractional Pulse")
     parser.add_argument("--output", "-o", default="/Users/rome/Documents/Fractional/data",
@@ -572,19 +555,7 @@ if __name__ == "__main__":
     parser.add_argument("--db", help="Database path")
     parser.add_argument("--csv", help="Import from CSV file instead of database")
 
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    print("Exporting job data for Fractional Pulse...")
-    print("=" * 50)
-
-    if args.csv:
-        # Import from CSV
-        import_from_csv(args.csv, args.output)
-    else:
-        # Export from database
-        export_jobs(args.output, args.db)
-        print()
-        export_market_stats(args.output, args.db)
-
-    print()
-    print("Export complete!")
+    run_main(main, 'export', args, output_dir=args.output, db_path=args.db, csv_path=args.csv)
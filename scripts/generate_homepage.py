@@ -6,14 +6,17 @@ Creates site/index.html with market stats, featured jobs, and role categories.
 
 import os
 import sys
+import time
 from datetime import datetime
 
 # Add scripts directory to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from nav_config import SITE_NAME, BASE_URL, ROLE_CATEGORIES
+from nav_config import SITE_NAME, BASE_URL, ROLE_CATEGORIES, JOBS_ROLE_PATH
 from templates import get_full_page
+from site_output import open_page, print_output_report
+from build_report import current_stage
 
 # Paths
 SITE_DIR = os.path.join(os.path.dirname(script_dir), 'site')
@@ -117,7 +120,7 @@ def generate_stats_section(stats):
 
 def generate_roles_section(role_categories):
     """Generate browse by role section HTML."""
-    role_cards = ""
+    cards = []
     for role in role_categories:
         # Placeholder job counts - will be dynamic
         job_count = {
@@ -125,12 +128,13 @@ def generate_roles_section(role_categories):
             'chro': 21, 'cro': 18, 'cpo': 12, 'other': 24
         }.get(role['id'], 0)
 
-        role_cards += f'''
-                <a href="/jobs/?role={role['id']}" class="card role-card">
+        cards.append(f'''
+                <a href="{JOBS_ROLE_PATH.format(role=role['id'])}" class="card role-card">
                     <div class="role-card__icon">{role['icon']}</div>
                     <div class="role-card__title">{role['title']}</div>
                     <div class="role-card__count">{job_count} jobs</div>
-                </a>'''
+                </a>''')
+    role_cards = ''.join(cards)
 
     return f'''
         <section class="section" style="max-width: 1200px; margin: 0 auto;">
@@ -147,12 +151,12 @@ def generate_roles_section(role_categories):
 
 def generate_featured_jobs_section(jobs):
     """Generate featured jobs section HTML."""
-    job_cards = ""
+    cards = []
     for job in jobs:
         remote_class = 'job-card__tag--remote' if job['is_remote'] else ''
         location_text = 'Remote' if job['is_remote'] else job['location']
 
-        job_cards += f'''
+        cards.append(f'''
                 <div class="card job-card">
                     <div class="job-card__header">
                         <div>
@@ -166,7 +170,8 @@ def generate_featured_jobs_section(jobs):
                         <span class="job-card__tag">{job['hours']}</span>
                         <span class="job-card__tag">{job['stage']}</span>
                     </div>
-                </div>'''
+                </div>''')
+    job_cards = ''.join(cards)
 
     return f'''
         <section class="section" style="max-width: 1200px; margin: 0 auto;">
@@ -192,43 +197,47 @@ def generate_cta_section():
 '''
 
 
-def generate_homepage():
-    """Generate the complete homepage."""
-    print("=" * 70)
-    print("  FRACTIONAL PULSE - GENERATING HOMEPAGE")
-    print("=" * 70)
-
-    # Build body content
+def render_homepage(out=None):
+    """Render the homepage (streamed into `out` when given, else returned as a string)."""
+    # Body sections are streamed into the page in order
     body_content = (
-        generate_hero_section() +
-        generate_stats_section(STATS) +
-        generate_roles_section(ROLE_CATEGORIES) +
-        generate_featured_jobs_section(FEATURED_JOBS) +
-        generate_cta_section()
+        generate_hero_section(),
+        generate_stats_section(STATS),
+        generate_roles_section(ROLE_CATEGORIES),
+        generate_featured_jobs_section(FEATURED_JOBS),
+        generate_cta_section(),
     )
-
-    # Generate full page
-    html = get_full_page(
+    return get_full_page(
         title="Fractional Executive Jobs & Salary Data",
         description="Find fractional CFO, CMO, CTO, COO and other C-suite executive opportunities. Browse 247+ jobs with salary data and market insights.",
         body_content=body_content,
-        canonical_path="/"
+        canonical_path="/",
+        out=out,
     )
 
-    # Ensure output directory exists
-    os.makedirs(SITE_DIR, exist_ok=True)
+
+def generate_homepage():
+    """Generate the complete homepage."""
+    print("=" * 70)
+    print("  FRACTIONAL PULSE - GENERATING HOMEPAGE")
+    print("=" * 70)
 
     # Write homepage
     output_path = os.path.join(SITE_DIR, 'index.html')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    start = time.perf_counter()
+    with open_page(output_path, 'home') as f:
+        render_homepage(out=f)
+    current_stage().page(output_path, time.perf_counter() - start)
 
     print(f"\n✓ Homepage generated: {output_path}")
     print(f"  - Stats: {STATS['total_jobs']} jobs, {STATS['avg_salary']} avg salary")
     print(f"  - Featured jobs: {len(FEATURED_JOBS)}")
     print(f"  - Role categories: {len(ROLE_CATEGORIES)}")
+    print_output_report()
     print("\n" + "=" * 70)
 
 
 if __name__ == "__main__":
-    generate_homepage()
+    from profiling import run_main
+
+    run_main(generate_homepage, 'homepage')
@@ -8,19 +8,36 @@ import os
 import sys
 import hashlib
 import re
+import shutil
+import time
 from datetime import datetime
 
+import numpy as np
+
 # Add scripts directory to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
 from templates import get_full_page, get_all_css
-from nav_config import BASE_URL, SITE_NAME
+from site_output import open_page, print_output_report
+from nav_config import BASE_URL, SITE_NAME, JOBS_REMOTE_PATH, JOBS_ROLE_PATH, FOOTER_COLUMNS, ROLE_CATEGORIES
+from job_columns import JobColumns
+from board_index import write_search_index, build_facet_masks, write_facet_bitsets, write_sort_orders
+from build_report import current_stage
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
 JOBS_DIR = f'{SITE_DIR}/jobs'
 
+SEARCH_INDEX_DIR = f'{SITE_DIR}/assets/search'
+
+# Cards per listing page (/jobs/, /jobs/page/2/, ...)
+JOBS_PER_PAGE = 50
+
+# Cards embedded in the first page in --virtual-list mode; /jobs/page/2/
+# then continues from the next position
+JOBS_PER_SCREEN = 12
+
 
 def escape_html(text):
     """Escape HTML special characters."""
@@ -59,6 +76,27 @@ def get_role_display(role_type):
     return role_map.get(role_type, role_type.upper() if role_type else 'Other')
 
 
+def get_linked_roles():
+    """Roles whose listing the site links to from nav_config (footer links, homepage role cards)."""
+    prefix, suffix = JOBS_ROLE_PATH.split('{role}')
+    roles = [category['id'] for category in ROLE_CATEGORIES]
+    for column in FOOTER_COLUMNS:
+        for link in column['links']:
+            href = link['href']
+            if href.startswith(prefix) and href.endswith(suffix):
+                roles.append(href[len(prefix):len(href) - len(suffix)])
+    return list(dict.fromkeys(roles))
+
+# Sort options: key -> (label, JobColumns column, descending). The first one
+# is the feed order (exports are newest first), so it keeps the static page.
+SORT_ORDERS = {
+    'date': ('Newest', 'date_posted', True),
+    'hourly_max': ('Highest rate', 'hourly_max', True),
+    'hourly_min': ('Lowest rate', 'hourly_min', False),
+    'hours': ('Fewest hours', 'hours_min', False),
+}
+
+
 # Additional CSS for job board page
 JOB_BOARD_CSS = """
 /* Job Board Specific Styles */
@@ -159,6 +197,20 @@ JOB_BOARD_CSS = """
     color: white;
 }
 
+.filters__facets {
+    margin-top: var(--space-md);
+}
+
+.filter-select {
+    background: var(--bg-card);
+    border: 1px solid var(--border);
+    border-radius: var(--radius-full);
+    color: var(--text-secondary);
+    padding: var(--space-sm) var(--space-md);
+    font-size: 0.9rem;
+    cursor: pointer;
+}
+
 /* Job List */
 .jobs-list {
     max-width: 1200px;
@@ -184,6 +236,10 @@ JOB_BOARD_CSS = """
     gap: var(--space-sm);
 }
 
+.jobs-list__sort[hidden] {
+    display: none;
+}
+
 .jobs-list__sort select {
     background: var(--bg-card);
     border: 1px solid var(--border);
@@ -272,6 +328,48 @@ JOB_BOARD_CSS = """
     color: var(--text-muted);
 }
 
+/* Virtual list (rows are positioned by the board script) */
+.jobs-list__virtual {
+    position: relative;
+}
+
+.jobs-list__virtual .job-item {
+    position: absolute;
+    left: 0;
+    right: 0;
+    overflow: hidden;
+}
+
+/* Pagination */
+.pagination {
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    flex-wrap: wrap;
+    gap: var(--space-sm);
+    margin-top: var(--space-xl);
+}
+
+.pagination__link {
+    padding: var(--space-sm) var(--space-md);
+    background: var(--bg-card);
+    border: 1px solid var(--border);
+    border-radius: var(--radius-sm);
+    color: var(--text-secondary);
+    font-size: 0.9rem;
+    transition: all var(--transition-fast);
+}
+
+.pagination__link:hover, .pagination__link--current {
+    background: var(--teal);
+    border-color: var(--teal);
+    color: white;
+}
+
+.pagination__gap {
+    color: var(--text-muted);
+}
+
 /* No results */
 .no-results {
     text-align: center;
@@ -314,75 +412,62 @@ JOB_BOARD_CSS = """
 """
 
 
-def main():
-    print("=" * 60)
-    print("  FRACTIONAL PULSE - GENERATING JOB BOARD")
-    print("=" * 60)
-
-    os.makedirs(JOBS_DIR, exist_ok=True)
-
-    # Load job data
-    jobs_file = f"{DATA_DIR}/jobs.json"
-    if not os.path.exists(jobs_file):
-        print(f"  ERROR: {jobs_file} not found")
-        sys.exit(1)
-
-    with open(jobs_file) as f:
-        data = json.load(f)
-
-    jobs = data.get('jobs', [])
-    stats = data.get('stats', {})
-    print(f"  Loaded {len(jobs)} jobs from jobs.json")
-
-    # Calculate stats
-    total_jobs = len(jobs)
-    remote_jobs = sum(1 for j in jobs if j.get('is_remote'))
-    with_salary = sum(1 for j in jobs if j.get('has_salary'))
-    c_level = sum(1 for j in jobs if j.get('is_c_level'))
-
-    # Role type counts for filters
-    role_counts = {}
-    for job in jobs:
-        role = job.get('role_type') or 'other'
-        role_counts[role] = role_counts.get(role, 0) + 1
-
-    # Generate filter buttons
-    filter_buttons = '<button class="filter-btn active" data-filter="all">All Roles</button>\n'
-    for role, count in sorted(role_counts.items(), key=lambda x: -x[1]):
-        display = get_role_display(role)
-        filter_buttons += f'<button class="filter-btn" data-filter="{role}">{display} ({count})</button>\n'
-
-    # Generate job cards HTML
-    job_cards_html = ""
-    for job in jobs:
-        company = escape_html(job.get('company', 'Confidential'))
-        title = escape_html(job.get('title', 'Fractional Executive'))
-        location = escape_html(job.get('location', ''))
-        comp_display = job.get('compensation', {}).get('display', 'Not disclosed')
-        role_type = job.get('role_type') or 'other'
-        is_remote = job.get('is_remote', False)
-        slug = job.get('slug', '')
-        date_posted = format_date(job.get('date_posted'))
-
-        # Tags
-        tags_html = ""
-        if is_remote:
-            tags_html += '<span class="job-item__tag job-item__tag--remote">Remote</span>'
-        elif location:
-            tags_html += f'<span class="job-item__tag">{location}</span>'
-
-        if role_type and role_type != 'other':
-            tags_html += f'<span class="job-item__tag job-item__tag--role">{get_role_display(role_type)}</span>'
-
-        if date_posted:
-            tags_html += f'<span class="job-item__date">{date_posted}</span>'
-
-        job_cards_html += f'''
-        <a href="/jobs/{slug}/" class="job-item"
-           data-role="{role_type}"
-           data-remote="{str(is_remote).lower()}"
-           data-company="{company.lower()}"
-           data-title="{title.lower()}">
+def get_listing_title(role_type):
+    """Get page heading for a role listing."""
+    titles = {
+        'vp': 'VP-Level Jobs',
+        'director': 'Director-Level Jobs',
+        'head_of': 'Head of Department Jobs',
+        'other': 'Other Fractional & Contract Jobs',
+    }
+    return titles.get(role_type, f'Fractional {get_role_display(role_type)} Jobs')
+
+
+def get_page_path(base_path, page):
+    """Get the URL path of page `page` of a paginated listing."""
+    return base_path if page == 1 else f'{base_path}page/{page}/'
+
+
+def get_page_bounds(listing_total, virtual_list=False):
+    """
+    (start, end) listing positions of each page of a listing with
+    `listing_total` jobs. With `virtual_list`, page 1 holds only
+    JOBS_PER_SCREEN cards and page 2 starts right after them, so every
+    position is on some server-rendered page.
+    """
+    first = JOBS_PER_SCREEN if virtual_list else JOBS_PER_PAGE
+    bounds = [(0, min(first, listing_total))]
+    for start in range(first, listing_total, JOBS_PER_PAGE):
+        bounds.append((start, min(start + JOBS_PER_PAGE, listing_total)))
+    return bounds
+
+
+def render_job_card(job):
+    """Render one job card for the board listing."""
+    company = escape_html(job.get('company', 'Confidential'))
+    title = escape_html(job.get('title', 'Fractional Executive'))
+    location = escape_html(job.get('location', ''))
+    comp_display = job.get('compensation', {}).get('display', 'Not disclosed')
+    role_type = job.get('role_type') or 'other'
+    is_remote = job.get('is_remote', False)
+    slug = job.get('slug', '')
+    date_posted = format_date(job.get('date_posted'))
+
+    # Tags
+    tags_html = ""
+    if is_remote:
+        tags_html += '<span class="job-item__tag job-item__tag--remote">Remote</span>'
+    elif location:
+        tags_html += f'<span class="job-item__tag">{location}</span>'
+
+    if role_type and role_type != 'other':
+        tags_html += f'<span class="job-item__tag job-item__tag--role">{get_role_display(role_type)}</span>'
+
+    if date_posted:
+        tags_html += f'<span class="job-item__date">{date_posted}</span>'
+
+    return f'''
+        <a href="/jobs/{slug}/" class="job-item">
             <div class="job-item__header">
                 <div>
                     <div class="job-item__company">{company}</div>
@@ -396,61 +481,555 @@ def main():
         </a>
         '''
 
-    # Search and filter JavaScript
-    search_js = '''
+
+# Fields the search script needs to render a result card (see renderCard in BOARD_JS)
+SEARCH_DOC_COLUMNS = {
+    'slug': lambda job: job.get('slug', ''),
+    'company': lambda job: job.get('company', 'Confidential'),
+    'title': lambda job: job.get('title', 'Fractional Executive'),
+    'location': lambda job: job.get('location', ''),
+    'salary': lambda job: job.get('compensation', {}).get('display', 'Not disclosed'),
+    'role': lambda job: job.get('role_type') or 'other',
+    'role_display': lambda job: get_role_display(job.get('role_type') or 'other'),
+    'remote': lambda job: 1 if job.get('is_remote') else 0,
+    'date': lambda job: format_date(job.get('date_posted')),
+}
+
+
+def render_pagination(base_path, page, total_pages):
+    """Render numbered pagination links (first, last and a window around the current page)."""
+    if total_pages <= 1:
+        return ''
+
+    links = []
+    if page > 1:
+        links.append(f'<a href="{get_page_path(base_path, page - 1)}" class="pagination__link" rel="prev">&larr; Previous</a>')
+
+    shown = {1, total_pages} | set(range(max(1, page - 2), min(total_pages, page + 2) + 1))
+    previous = 0
+    for number in sorted(shown):
+        if number - previous > 1:
+            links.append('<span class="pagination__gap">&hellip;</span>')
+        if number == page:
+            links.append(f'<span class="pagination__link pagination__link--current" aria-current="page">{number}</span>')
+        else:
+            links.append(f'<a href="{get_page_path(base_path, number)}" class="pagination__link">{number}</a>')
+        previous = number
+
+    if page < total_pages:
+        links.append(f'<a href="{get_page_path(base_path, page + 1)}" class="pagination__link" rel="next">Next &rarr;</a>')
+
+    return f'''
+            <nav class="pagination" aria-label="Job listing pages">
+                {"".join(links)}
+            </nav>'''
+
+
+# Labels for the hours-per-week facet
+HOURS_BUCKET_LABELS = {
+    'under_10': 'Under 10 hrs/week',
+    '10_20': '10-20 hrs/week',
+    '20_30': '20-30 hrs/week',
+    '30_plus': '30+ hrs/week',
+    'unspecified': 'Hours not specified',
+}
+
+
+def get_function_display(function_category):
+    """Get display name for a function category."""
+    return function_category.replace('_', ' ').title()
+
+
+def render_filters(facet_counts, active_role=None, remote_only=False):
+    """
+    Render the facet filter controls as (role links, other facet controls),
+    the contents of the listing's two filter rows.
+
+    Role and remote filters are links to the static listings, so they work
+    without JavaScript; the board script turns every control into an
+    instant facet filter and keeps the counts current.
+    """
+    def count_span(count):
+        return f' <span class="filter-btn__count">({count})</span>'
+
+    def select_options(facet, labels):
+        return ''.join(
+            f'<option value="{value}" data-label="{escape_html(labels(value))}">{escape_html(labels(value))} ({count})</option>'
+            for value, count in sorted(facet_counts[facet].items(), key=lambda x: -x[1])
+        )
+
+    role_links = [
+        f'<a href="/jobs/" class="filter-btn{"" if active_role else " active"}" data-facet="role" data-value="">All Roles</a>'
+    ]
+    for role, count in sorted(facet_counts['role'].items(), key=lambda x: -x[1]):
+        active = ' active' if role == active_role else ''
+        role_links.append(
+            f'<a href="{JOBS_ROLE_PATH.format(role=role)}" class="filter-btn{active}" data-facet="role" '
+            f'data-value="{role}">{get_role_display(role)}{count_span(count)}</a>'
+        )
+
+    role_html = '\n'.join(role_links)
+    remote_active = ' active' if remote_only else ''
+    facets_html = f'''
+                <a href="{JOBS_REMOTE_PATH}" class="filter-btn{remote_active}" data-facet="remote" data-value="remote">Remote{count_span(facet_counts['remote'].get('remote', 0))}</a>
+                <button type="button" class="filter-btn" data-facet="salary" data-value="disclosed" hidden>Salary disclosed{count_span(facet_counts['salary'].get('disclosed', 0))}</button>
+                <select class="filter-select" data-facet="hours" aria-label="Hours per week" hidden>
+                    <option value="">Any hours</option>{select_options('hours', HOURS_BUCKET_LABELS.get)}
+                </select>
+                <select class="filter-select" data-facet="function" aria-label="Function" hidden>
+                    <option value="">Any function</option>{select_options('function', get_function_display)}
+                </select>'''
+    return role_html, facets_html
+
+
+# Search and filtering run against the prebuilt index in /assets/search/ (see
+# board_index.py): only the shards for the typed prefixes, the facet bitsets
+# and the document chunks for the jobs shown are fetched, so cost follows the
+# results, not the job count.
+BOARD_JS = '''
     <script>
     (function() {
+        const INDEX_URL = '/assets/search/';
+        const MAX_RESULTS = 100;
+        const DEBOUNCE_MS = 150;
+        const NO_RESULTS_HTML = '<div class="no-results"><h2 class="no-results__title">No matching jobs</h2>' +
+            '<p>Try a different search or fewer filters.</p></div>';
+
         const searchInput = document.getElementById('job-search');
-        const filterBtns = document.querySelectorAll('.filter-btn');
-        const jobItems = document.querySelectorAll('.job-item');
+        const list = document.querySelector('.jobs-list');
+        const itemsEl = list.querySelector('.jobs-list__items');
+        const pagination = list.querySelector('.pagination');
         const countEl = document.getElementById('job-count');
-        let activeFilter = 'all';
+        const controls = document.querySelectorAll('[data-facet]');
+        const virtualEl = list.querySelector('.jobs-list__virtual');
+        const sortSelect = document.getElementById('job-sort');
+        const defaultSort = sortSelect.value;
+        const listingRole = list.dataset.role || '';
+        const remoteOnly = list.dataset.remote === 'true';
+        const defaultHtml = itemsEl.innerHTML;
+        const defaultCount = countEl.textContent;
+        const cache = {};
+        let facetsPromise = null;
+        let sortsPromise = null;
+        let searchBits = null;
+        let timer = null;
+        let generation = 0;
+
+        // Selected values per facet (OR within a facet, AND across facets);
+        // a role or remote listing starts with its own constraint selected
+        const selected = {
+            role: new Set(listingRole ? [listingRole] : []),
+            remote: new Set(remoteOnly ? ['remote'] : []),
+            salary: new Set(),
+            hours: new Set(),
+            function: new Set(),
+        };
+        const initialState = stateKey();
+
+        const POPCOUNT = new Uint8Array(256);
+        for (let i = 1; i < 256; i++) POPCOUNT[i] = POPCOUNT[i >> 1] + (i & 1);
+
+        function stateKey() {
+            return JSON.stringify(Object.keys(selected).map(f => [...selected[f]].sort()));
+        }
 
-        function filterJobs() {
-            const query = searchInput.value.toLowerCase();
-            let visible = 0;
+        function fetchJson(path) {
+            if (!cache[path]) {
+                cache[path] = fetch(INDEX_URL + path).then(r => r.ok ? r.json() : null);
+            }
+            return cache[path];
+        }
 
-            jobItems.forEach(item => {
-                const role = item.dataset.role;
-                const company = item.dataset.company;
-                const title = item.dataset.title;
+        function decodeBits(base64) {
+            const binary = atob(base64);
+            const bits = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bits[i] = binary.charCodeAt(i);
+            return bits;
+        }
 
-                const matchesFilter = activeFilter === 'all' || role === activeFilter;
-                const matchesSearch = !query ||
-                    company.includes(query) ||
-                    title.includes(query);
+        function loadFacets() {
+            if (!facetsPromise) {
+                facetsPromise = fetchJson('facets.json').then(data => {
+                    const bits = {};
+                    for (const facet in data.facets) {
+                        bits[facet] = {};
+                        for (const value in data.facets[facet]) {
+                            bits[facet][value] = decodeBits(data.facets[facet][value]);
+                        }
+                    }
+                    return { count: data.count, size: Math.ceil(data.count / 8), bits: bits };
+                });
+            }
+            return facetsPromise;
+        }
 
-                if (matchesFilter && matchesSearch) {
-                    item.style.display = '';
-                    visible++;
-                } else {
-                    item.style.display = 'none';
+        // Sort permutations: job ordinals in sorted order, one typed array per key
+        function loadOrder(key) {
+            if (!sortsPromise) sortsPromise = fetchJson('sorts.json');
+            return sortsPromise.then(sorts => {
+                if (!sorts || !sorts.keys.includes(key)) return null;
+                const path = 'sort/' + key + '.bin';
+                if (!cache[path]) {
+                    const ArrayType = sorts.type === 'uint32' ? Uint32Array : Uint16Array;
+                    cache[path] = fetch(INDEX_URL + path).then(r => r.ok ? r.arrayBuffer() : null)
+                        .then(buffer => buffer && new ArrayType(buffer));
+                }
+                return cache[path];
+            });
+        }
+
+        function allBits(facets) {
+            const bits = new Uint8Array(facets.size).fill(255);
+            if (facets.count % 8) bits[facets.size - 1] = (1 << (facets.count % 8)) - 1;
+            return bits;
+        }
+
+        // Jobs matching the search and every facet except `except`
+        function matchBits(facets, except) {
+            const bits = allBits(facets);
+            for (const facet in selected) {
+                if (facet === except || !selected[facet].size) continue;
+                const group = new Uint8Array(facets.size);
+                for (const value of selected[facet]) {
+                    const valueBits = (facets.bits[facet] || {})[value];
+                    if (valueBits) for (let i = 0; i < facets.size; i++) group[i] |= valueBits[i];
+                }
+                for (let i = 0; i < facets.size; i++) bits[i] &= group[i];
+            }
+            if (searchBits) for (let i = 0; i < facets.size; i++) bits[i] &= searchBits[i];
+            return bits;
+        }
+
+        function countBits(bits, mask) {
+            let count = 0;
+            if (mask) {
+                for (let i = 0; i < bits.length; i++) count += POPCOUNT[bits[i] & mask[i]];
+            } else {
+                for (let i = 0; i < bits.length; i++) count += POPCOUNT[bits[i]];
+            }
+            return count;
+        }
+
+        function ordinalsOf(bits, limit) {
+            const ordinals = [];
+            for (let i = 0; i < bits.length && ordinals.length < limit; i++) {
+                let byte = bits[i];
+                while (byte && ordinals.length < limit) {
+                    const low = byte & -byte;
+                    ordinals.push(i * 8 + 31 - Math.clz32(low));
+                    byte ^= low;
+                }
+            }
+            return ordinals;
+        }
+
+        // Matching ordinals in the order of a sort permutation (feed order without one)
+        function sortedOrdinals(bits, order, limit) {
+            if (!order) return ordinalsOf(bits, limit);
+            const ordinals = [];
+            for (let i = 0; i < order.length && ordinals.length < limit; i++) {
+                const o = order[i];
+                if (bits[o >> 3] & (1 << (o & 7))) ordinals.push(o);
+            }
+            return ordinals;
+        }
+
+        function updateControls(facets) {
+            const bases = {};
+            controls.forEach(control => {
+                const facet = control.dataset.facet;
+                if (!bases[facet]) bases[facet] = matchBits(facets, facet);
+                const valueBits = facets.bits[facet] || {};
+                if (control.tagName === 'SELECT') {
+                    for (const option of control.options) {
+                        if (option.value) {
+                            option.textContent = option.dataset.label + ' (' +
+                                countBits(bases[facet], valueBits[option.value] || new Uint8Array(facets.size)) + ')';
+                        }
+                    }
+                    control.value = [...selected[facet]][0] || '';
+                    return;
+                }
+                const value = control.dataset.value;
+                const countSpan = control.querySelector('.filter-btn__count');
+                if (value && countSpan) {
+                    countSpan.textContent = '(' +
+                        countBits(bases[facet], valueBits[value] || new Uint8Array(facets.size)) + ')';
                 }
+                control.classList.toggle('active', value ? selected[facet].has(value) : !selected[facet].size);
             });
+        }
+
+        function tokenize(text) {
+            return (text.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || []);
+        }
+
+        function shardName(prefix) {
+            if (/^[a-z0-9]+$/.test(prefix)) return prefix;
+            return 'x' + Array.from(new TextEncoder().encode(prefix),
+                b => b.toString(16).padStart(2, '0')).join('');
+        }
 
-            countEl.textContent = visible + ' jobs found';
+        function escapeHtml(text) {
+            return String(text || '').replace(/&/g, '&amp;').replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;').replace(/"/g, '&quot;');
         }
 
-        searchInput.addEventListener('input', filterJobs);
+        async function matchTerm(meta, term) {
+            const name = shardName(Array.from(term).slice(0, meta.prefix_length).join(''));
+            const matches = new Set();
+            if (!meta.shards.includes(name)) return matches;
+            const shard = await fetchJson(name + '.json');
+            for (const token in shard) {
+                if (!token.startsWith(term)) continue;
+                let ordinal = 0;
+                for (const delta of shard[token]) {
+                    ordinal += delta;
+                    matches.add(ordinal);
+                }
+            }
+            return matches;
+        }
 
-        filterBtns.forEach(btn => {
-            btn.addEventListener('click', () => {
-                filterBtns.forEach(b => b.classList.remove('active'));
-                btn.classList.add('active');
-                activeFilter = btn.dataset.filter;
-                filterJobs();
+        // Bitset of jobs whose company/title tokens start with every query term
+        async function searchBitsFor(query) {
+            const terms = tokenize(query).filter(t => Array.from(t).length >= 2);
+            if (!terms.length) return null;
+            const meta = await fetchJson('meta.json');
+            const sets = (await Promise.all(terms.map(t => matchTerm(meta, t))))
+                .sort((a, b) => a.size - b.size);
+            const bits = new Uint8Array(Math.ceil(meta.count / 8));
+            for (const ordinal of sets[0]) {
+                if (sets.every(s => s.has(ordinal))) bits[ordinal >> 3] |= 1 << (ordinal & 7);
+            }
+            return bits;
+        }
+
+        async function loadDocs(ordinals) {
+            const meta = await fetchJson('meta.json');
+            const size = meta.docs_chunk_size;
+            const chunks = [...new Set(ordinals.map(o => Math.floor(o / size)))];
+            const loaded = await Promise.all(chunks.map(c => fetchJson('docs/' + c + '.json')));
+            const byChunk = {};
+            chunks.forEach((c, i) => { byChunk[c] = loaded[i]; });
+            return ordinals.map(o => {
+                const chunk = byChunk[Math.floor(o / size)];
+                const doc = {};
+                for (const column in chunk) doc[column] = chunk[column][o % size];
+                return doc;
             });
+        }
+
+        function renderCard(doc, style) {
+            let tags = '';
+            if (doc.remote) {
+                tags += '<span class="job-item__tag job-item__tag--remote">Remote</span>';
+            } else if (doc.location) {
+                tags += '<span class="job-item__tag">' + escapeHtml(doc.location) + '</span>';
+            }
+            if (doc.role && doc.role !== 'other') {
+                tags += '<span class="job-item__tag job-item__tag--role">' + escapeHtml(doc.role_display) + '</span>';
+            }
+            if (doc.date) {
+                tags += '<span class="job-item__date">' + escapeHtml(doc.date) + '</span>';
+            }
+            return '<a href="/jobs/' + encodeURIComponent(doc.slug) + '/" class="job-item"' +
+                (style ? ' style="' + style + '"' : '') + '>' +
+                '<div class="job-item__header"><div>' +
+                '<div class="job-item__company">' + escapeHtml(doc.company) + '</div>' +
+                '<div class="job-item__title">' + escapeHtml(doc.title) + '</div>' +
+                '</div><div class="job-item__salary">' + escapeHtml(doc.salary) + '</div></div>' +
+                '<div class="job-item__meta">' + tags + '</div></a>';
+        }
+
+        // Windowed list: only the rows near the viewport exist in the DOM
+        function createVirtualList(container) {
+            const OVERSCAN = 6;
+            const firstCard = itemsEl.querySelector('.job-item');
+            const gap = firstCard ? parseFloat(getComputedStyle(firstCard).marginBottom) || 0 : 16;
+            const rowHeight = firstCard ? firstCard.offsetHeight + gap : 150;
+            let ordinals = [];
+            let version = 0;
+            let drawn = '';
+            let scheduled = false;
+
+            async function draw() {
+                scheduled = false;
+                const top = container.getBoundingClientRect().top;
+                const start = Math.max(0, Math.floor(-top / rowHeight) - OVERSCAN);
+                const end = Math.min(ordinals.length, Math.ceil((window.innerHeight - top) / rowHeight) + OVERSCAN);
+                const key = version + ':' + start + ':' + end;
+                if (key === drawn) return;
+                drawn = key;
+                const docs = start < end ? await loadDocs(ordinals.slice(start, end)) : [];
+                if (drawn !== key) return;
+                container.innerHTML = docs.map((doc, i) => renderCard(doc,
+                    'top:' + (start + i) * rowHeight + 'px;height:' + (rowHeight - gap) + 'px')).join('');
+            }
+
+            function schedule() {
+                if (!scheduled) {
+                    scheduled = true;
+                    requestAnimationFrame(() => draw().catch(() => {}));
+                }
+            }
+
+            window.addEventListener('scroll', schedule, { passive: true });
+            window.addEventListener('resize', schedule);
+
+            return {
+                show(list) {
+                    ordinals = list;
+                    version++;
+                    container.style.height = list.length * rowHeight + 'px';
+                    schedule();
+                },
+            };
+        }
+
+        const virtual = virtualEl ? createVirtualList(virtualEl) : null;
+
+        function showDefault() {
+            itemsEl.innerHTML = defaultHtml;
+            countEl.textContent = defaultCount;
+            if (virtual) {
+                // Continue the listing after the embedded first screenful
+                const offset = Number(virtualEl.dataset.offset);
+                if (pagination) pagination.style.display = 'none';
+                loadFacets().then(facets => {
+                    virtual.show(ordinalsOf(matchBits(facets, null), Infinity).slice(offset));
+                });
+            } else if (pagination) {
+                pagination.style.display = '';
+            }
+        }
+
+        async function update() {
+            const current = ++generation;
+            const facets = await loadFacets();
+            const bits = await searchBitsFor(searchInput.value);
+            const order = sortSelect.value === defaultSort ? null : await loadOrder(sortSelect.value);
+            if (current !== generation) return;
+            searchBits = bits;
+            updateControls(facets);
+
+            // Nothing beyond the listing's own filter: keep the server-rendered page
+            if (!searchBits && stateKey() === initialState && !order) {
+                showDefault();
+                return;
+            }
+
+            const matches = matchBits(facets, null);
+            const total = countBits(matches);
+            if (virtual) {
+                itemsEl.innerHTML = total ? '' : NO_RESULTS_HTML;
+                countEl.textContent = total + ' jobs found';
+                virtual.show(sortedOrdinals(matches, order, Infinity));
+                return;
+            }
+
+            const docs = await loadDocs(sortedOrdinals(matches, order, MAX_RESULTS));
+            if (current !== generation) return;
+
+            itemsEl.innerHTML = docs.map(doc => renderCard(doc)).join('') || NO_RESULTS_HTML;
+            countEl.textContent = total + ' jobs found' +
+                (total > MAX_RESULTS ? ' (showing first ' + MAX_RESULTS + ')' : '');
+            if (pagination) pagination.style.display = 'none';
+        }
+
+        function run() {
+            update().catch(showDefault);
+        }
+
+        sortSelect.addEventListener('change', run);
+        sortSelect.closest('.jobs-list__sort').hidden = false;
+
+        searchInput.addEventListener('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(run, DEBOUNCE_MS);
         });
+
+        controls.forEach(control => {
+            const facet = control.dataset.facet;
+            control.hidden = false;
+            if (control.tagName === 'SELECT') {
+                control.addEventListener('change', () => {
+                    selected[facet] = new Set(control.value ? [control.value] : []);
+                    run();
+                });
+                return;
+            }
+            control.addEventListener('click', event => {
+                event.preventDefault();
+                const value = control.dataset.value;
+                if (!value) {
+                    selected[facet].clear();
+                } else if (selected[facet].has(value)) {
+                    selected[facet].delete(value);
+                } else {
+                    selected[facet].add(value);
+                }
+                run();
+            });
+        });
+
+        loadFacets().then(facets => {
+            updateControls(facets);
+            if (virtual) showDefault();
+        }).catch(() => {});
     })();
     </script>
-    '''
+'''
+
+# Old ?role= links (bookmarks, external sites) forward to the static role listing
+ROLE_REDIRECT_JS = '''
+    <script>
+    (function() {
+        const role = new URLSearchParams(window.location.search).get('role');
+        if (role && /^[a-z_]+$/.test(role)) {
+            window.location.replace(%s.replace('{role}', role));
+        }
+    })();
+    </script>
+''' % json.dumps(JOBS_ROLE_PATH)
+
+
+def render_listing_page(jobs, heading, subtitle, base_path, page, total_pages, listing_total, filters,
+                        role=None, remote_only=False, virtual_list=False, out=None):
+    """
+    Render one page of a job listing; `filters` is the render_filters() pair.
+
+    With `virtual_list`, the first page is passed only the first screenful
+    of cards (see get_page_bounds()); the board script renders the rest of
+    the listing from the JSON feed in a windowed list. Page 2 continues
+    right after those cards and is linked from the pagination, so every
+    position of the listing stays in server-rendered HTML for crawlers.
+
+    Cards are streamed into `out` when given (see templates.get_full_page);
+    otherwise the page is returned as a string.
+    """
+    page_path = get_page_path(base_path, page)
+    role_filters_html, facet_filters_html = filters
+    virtual_html = ''
+    if virtual_list and page == 1:
+        virtual_html = f'<div class="jobs-list__virtual" data-offset="{len(jobs)}"></div>'
+    sort_options = ''.join(
+        f'\n                        <option value="{key}">{label}</option>'
+        for key, (label, _, _) in SORT_ORDERS.items()
+    )
+    no_results_html = '''
+                <div class="no-results">
+                    <h2 class="no-results__title">No open roles right now</h2>
+                    <p>New fractional opportunities are added every week. <a href="/jobs/">Browse all jobs</a>.</p>
+                </div>'''
+
+    page_label = f' (Page {page} of {total_pages})' if page > 1 else ''
 
-    # Build page content
-    body_content = f'''
+    body_start = f'''
         <div class="page-header">
             <div class="page-header__inner">
-                <h1 class="page-header__title">Fractional Executive Jobs</h1>
-                <p class="page-header__subtitle">{total_jobs} opportunities from top companies seeking fractional CFOs, CMOs, CTOs, and more</p>
+                <h1 class="page-header__title">{heading}</h1>
+                <p class="page-header__subtitle">{subtitle}</p>
             </div>
         </div>
 
@@ -463,43 +1042,273 @@ def main():
                     </svg>
                     <input type="text" id="job-search" class="filter-search__input" placeholder="Search by company or title...">
                 </div>
-                {filter_buttons}
+                {role_filters_html}
+            </div>
+            <div class="filters__inner filters__facets">{facet_filters_html}
             </div>
         </div>
 
-        <div class="jobs-list">
+        <div class="jobs-list" data-role="{role or ''}" data-remote="{str(remote_only).lower()}">
             <div class="jobs-list__header">
-                <span class="jobs-list__count" id="job-count">{total_jobs} jobs found</span>
+                <span class="jobs-list__count" id="job-count">{listing_total} jobs found</span>
+                <label class="jobs-list__sort" hidden>
+                    Sort
+                    <select id="job-sort" aria-label="Sort jobs">{sort_options}
+                    </select>
+                </label>
             </div>
 
             <div class="jobs-list__items">
-                {job_cards_html}
+                '''
+    body_end = f'''
             </div>
+            {virtual_html}
+            {render_pagination(base_path, page, total_pages)}
         </div>
-        {search_js}
+        {BOARD_JS}
+        {ROLE_REDIRECT_JS if page_path == '/jobs/' else ''}
     '''
 
-    # Generate page
-    extra_css = f"<style>{JOB_BOARD_CSS}</style>"
-    html = get_full_page(
-        title=f"Fractional Executive Jobs ({total_jobs} Open Positions)",
-        description=f"Browse {total_jobs} fractional executive jobs. Find part-time CFO, CMO, CTO, COO roles with flexible hours and competitive rates.",
-        body_content=body_content,
-        canonical_path="/jobs/",
-        extra_head=extra_css
+    def body_content():
+        yield body_start
+        for job in jobs:
+            yield render_job_card(job)
+        if not jobs:
+            yield no_results_html
+        yield body_end
+
+    # Pagination hints for crawlers
+    extra_head = f"<style>{JOB_BOARD_CSS}</style>"
+    if page > 1:
+        extra_head += f'\n    <link rel="prev" href="{BASE_URL}{get_page_path(base_path, page - 1)}">'
+    if page < total_pages:
+        extra_head += f'\n    <link rel="next" href="{BASE_URL}{get_page_path(base_path, page + 1)}">'
+
+    return get_full_page(
+        title=f"{heading} ({listing_total} Open Positions){page_label}",
+        description=f"Browse {listing_total} {heading.lower()}. Find part-time CFO, CMO, CTO, COO roles with flexible hours and competitive rates.",
+        body_content=body_content(),
+        canonical_path=page_path,
+        extra_head=extra_head,
+        out=out,
     )
 
-    # Write file
-    output_file = f"{JOBS_DIR}/index.html"
-    with open(output_file, 'w') as f:
-        f.write(html)
 
-    print(f"  Generated: {output_file}")
+def write_listing(jobs, ordinals, heading, subtitle, base_path, filters, role=None, remote_only=False,
+                  virtual_list=False, touched=None):
+    """
+    Write every page of one listing; returns the paths written.
+
+    With `touched` (a boolean mask over job ordinals), only the pages that
+    list at least one touched job are rewritten. A full build also removes
+    page/N/ directories past the listing's last page, left over from
+    builds when the listing was longer.
+    """
+    listing_total = len(ordinals)
+    bounds = get_page_bounds(listing_total, virtual_list)
+    total_pages = len(bounds)
+    stage = current_stage()
+    written = []
+
+    for page, (start, end) in enumerate(bounds, 1):
+        page_ordinals = ordinals[start:end]
+        if touched is not None and not touched[page_ordinals].any():
+            continue
+        path = f"{SITE_DIR}{get_page_path(base_path, page)}index.html"
+        start = time.perf_counter()
+        with open_page(path, 'board') as f:
+            render_listing_page(
+                [jobs[i] for i in page_ordinals], heading, subtitle,
+                base_path, page, total_pages, listing_total, filters,
+                role=role, remote_only=remote_only, virtual_list=virtual_list, out=f,
+            )
+        stage.page(path, time.perf_counter() - start)
+        written.append(path)
+
+    if touched is None:
+        remove_stale_pages(base_path, total_pages)
+    return written
+
+
+def remove_stale_pages(base_path, total_pages):
+    """Delete page/N/ directories of a listing with N past `total_pages`; returns the count."""
+    pages_dir = f"{SITE_DIR}{base_path}page"
+    if not os.path.isdir(pages_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(pages_dir):
+        if name.isdigit() and int(name) > total_pages:
+            shutil.rmtree(os.path.join(pages_dir, name))
+            removed += 1
+    if not os.listdir(pages_dir):
+        os.rmdir(pages_dir)
+    return removed
+
+
+def count_facets(facet_masks):
+    """Filter counts per facet value (values no job has are left out)."""
+    return {
+        facet: {value: int(mask.sum()) for value, mask in values.items() if mask.any()}
+        for facet, values in facet_masks.items()
+    }
+
+
+def iter_listings(columns, facet_counts):
+    """
+    Yield every listing as write_listing() keyword arguments: all jobs, the
+    remote-only listing, then one per role that has jobs. Roles the site
+    navigation links to (get_linked_roles()) get a listing even when empty,
+    so those links never 404; other empty roles get none.
+    """
+    role_counts = columns.value_counts('role_type')
+
+    yield dict(
+        ordinals=np.arange(len(columns)),
+        heading="Fractional Executive Jobs",
+        subtitle=f"{len(columns)} opportunities from top companies seeking fractional CFOs, CMOs, CTOs, and more",
+        base_path='/jobs/',
+        filters=render_filters(facet_counts),
+    )
+
+    yield dict(
+        ordinals=np.flatnonzero(columns.is_remote),
+        heading="Remote Fractional Executive Jobs",
+        subtitle=f"{int(columns.is_remote.sum())} remote opportunities for fractional executives",
+        base_path=JOBS_REMOTE_PATH,
+        filters=render_filters(facet_counts, remote_only=True),
+        remote_only=True,
+    )
+
+    roles = list(role_counts) + [r for r in get_linked_roles() if r not in role_counts]
+    for role in roles:
+        heading = get_listing_title(role)
+        yield dict(
+            ordinals=np.flatnonzero(columns.mask('role_type', role)),
+            heading=heading,
+            subtitle=f"{role_counts.get(role, 0)} open {heading.lower()} from companies hiring fractional and part-time talent",
+            base_path=JOBS_ROLE_PATH.format(role=role),
+            filters=render_filters(facet_counts, active_role=role),
+            role=role,
+        )
+
+
+def write_listings(jobs, columns, facet_counts, virtual_list=False, touched=None):
+    """
+    Write every listing from iter_listings(). With `touched` (a boolean mask
+    over job ordinals) only pages listing a touched job are rewritten, for
+    partial rebuilds. Returns the paths written.
+
+    A full build also removes role listings left over from earlier builds
+    for roles that no longer get one.
+    """
+    written = []
+    roles = []
+    for listing in iter_listings(columns, facet_counts):
+        pages = write_listing(jobs, **listing, virtual_list=virtual_list, touched=touched)
+        written += pages
+        if listing.get('role'):
+            roles.append(listing['role'])
+        else:
+            print(f"  Generated: {listing['base_path']} ({len(pages)} pages)")
+    print(f"  Generated: {len(roles)} role listings under {JOBS_ROLE_PATH.format(role='*')}")
+    if touched is None:
+        removed = remove_stale_role_listings(roles)
+        if removed:
+            print(f"  Removed {removed} role listings without jobs")
+    return written
+
+
+def remove_stale_role_listings(roles):
+    """Delete role listing directories for roles not in `roles`; returns the count."""
+    role_dir = f"{SITE_DIR}{JOBS_ROLE_PATH.format(role='')}".rstrip('/')
+    if not os.path.isdir(role_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(role_dir):
+        path = os.path.join(role_dir, name)
+        if name not in roles and os.path.isdir(path):
+            shutil.rmtree(path)
+            removed += 1
+    return removed
+
+
+def write_board_index(jobs, columns, facet_masks, output_dir=SEARCH_INDEX_DIR):
+    """
+    Write everything the board script fetches from /assets/search/ (search
+    shards, document chunks, facet bitsets, sort orders) to `output_dir`.
+
+    Returns:
+        (search index stats, facets.json bytes, sort file bytes)
+    """
+    index_stats = write_search_index(jobs, SEARCH_DOC_COLUMNS, output_dir)
+    facets_bytes = write_facet_bitsets(facet_masks, len(columns), output_dir)
+    sort_orders = {
+        key: columns.sort_order(getattr(columns, column), descending=descending)
+        for key, (_, column, descending) in SORT_ORDERS.items()
+    }
+    sort_bytes = write_sort_orders(sort_orders, len(columns), output_dir)
+    return index_stats, facets_bytes, sort_bytes
+
+
+def main(virtual_list=False):
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - GENERATING JOB BOARD")
+    print("=" * 60)
+
+    os.makedirs(JOBS_DIR, exist_ok=True)
+
+    # Load job data
+    jobs_file = f"{DATA_DIR}/jobs.json"
+    if not os.path.exists(jobs_file):
+        print(f"  ERROR: {jobs_file} not found")
+        sys.exit(1)
+
+    stage = current_stage()
+    with stage.span('load'):
+        with open(jobs_file) as f:
+            data = json.load(f)
+
+        jobs = data.get('jobs', [])
+        stats = data.get('stats', {})
+        print(f"  Loaded {len(jobs)} jobs from jobs.json")
+
+        # Calculate stats
+        columns = JobColumns(jobs)
+    stage.count('records', len(jobs))
+    total_jobs = len(columns)
+    remote_jobs = int(columns.is_remote.sum())
+    with_salary = int(columns.has_salary.sum())
+    c_level = int(columns.is_c_level.sum())
+
+    # Facet masks drive both the filter counts and the client's bitsets
+    facet_masks = build_facet_masks(columns)
+    facet_counts = count_facets(facet_masks)
+
+    write_listings(jobs, columns, facet_counts, virtual_list=virtual_list)
+
+    # Client-side search index
+    index_stats, facets_bytes, sort_bytes = write_board_index(jobs, columns, facet_masks)
+    print(f"  Generated: search index ({index_stats['shards']} shards, "
+          f"{index_stats['chunks']} doc chunks, {index_stats['bytes']:,} bytes)")
+    print(f"  Generated: facet bitsets ({sum(len(v) for v in facet_counts.values())} values, {facets_bytes:,} bytes)")
+    print(f"  Generated: sort orders ({', '.join(SORT_ORDERS)}; {sort_bytes:,} bytes)")
+    stage.count('bytes_written', index_stats['bytes'] + facets_bytes + sort_bytes)
+
     print(f"  Total jobs: {total_jobs}")
     print(f"  Remote jobs: {remote_jobs}")
     print(f"  With salary: {with_salary}")
+    print_output_report()
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    from profiling import add_profile_arguments, run_main
+
+    parser = argparse.ArgumentParser(description="Generate the Fractional Pulse job board")
+    parser.add_argument("--virtual-list", action="store_true",
+                        help="Embed only the first screenful of cards and render the rest from the JSON feed")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    run_main(main, 'job_board', args, virtual_list=args.virtual_list)
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """
 Generate individual job pages at /jobs/{slug}/index.html
+
+With --only, rebuilds just the selected postings (by job id, slug, role or
+company), the job pages whose similar-job cards link to them, and the board
+listing pages and sitemap parts that include them.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import sys
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
 # Add scripts directory to path
@@ -14,11 +23,30 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
 from templates import get_full_page, get_all_css
+from site_output import open_page, open_output, print_output_report, record_minified, MINIFY_HTML
+from minify import minify_html
 from nav_config import BASE_URL, SITE_NAME
+from job_store import (iter_jobs, read_jobs_header, load_similar_index, build_similar_index, get_similar_jobs,
+                       parse_selectors, job_matches)
+from render_cache import RenderCache, cache_key
+from build_report import current_stage, worker_span
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
 JOBS_DIR = f'{SITE_DIR}/jobs'
+SIMILAR_JOBS_FILE = f'{DATA_DIR}/similar_jobs.json'
+
+# Render pipeline sizing (see run_pipeline())
+RENDER_BATCH_SIZE = 16
+QUEUED_BATCHES_PER_WORKER = 2
+WRITE_THREADS = 4
+WRITE_QUEUE_PAGES = 256
+
+# Cached job content is keyed on this generator's source, so any change here
+# re-renders every body; the shared layout (templates, nav, tracking) is not
+# part of the key and is re-applied on every build.
+with open(os.path.abspath(__file__), 'rb') as _source:
+    GENERATOR_HASH = hashlib.sha256(_source.read()).hexdigest()
 
 
 def escape_html(text):
@@ -39,41 +67,70 @@ def format_date(date_str):
         return date_str
 
 
+# Markdown patterns, compiled once
+_BOLD_STARS_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDERSCORES_RE = re.compile(r'__(.+?)__')
+_LIST_PREFIXES = ('* ', '- ', '• ')
+
+# Bump when markdown_to_html output changes, to invalidate cached renders
+MARKDOWN_VERSION = '1'
+
+
 def markdown_to_html(text):
-    """Convert basic markdown to HTML."""
+    """
+    Convert basic markdown to HTML.
+
+    The escaped text is split once into blank-line-separated blocks; a
+    block becomes a <ul> when every line is a bullet and a <p> otherwise.
+    Single-line blocks skip the per-line work.
+    """
     if not text:
         return ''
 
-    # Escape HTML
     text = escape_html(text)
 
-    # Convert markdown-style formatting
-    # Bold: **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'__(.+?)__', r'<strong>\1</strong>', text)
+    # Bold: **text** or __text__ (never spans lines, so blocks are unaffected)
+    if '**' in text:
+        text = _BOLD_STARS_RE.sub(r'<strong>\1</strong>', text)
+    if '__' in text:
+        text = _BOLD_UNDERSCORES_RE.sub(r'<strong>\1</strong>', text)
 
-    # Convert line breaks to paragraphs
-    paragraphs = text.split('\n\n')
     html_parts = []
-
-    for p in paragraphs:
+    for p in text.split('\n\n'):
         p = p.strip()
         if not p:
             continue
 
-        # Check if it's a list
-        lines = p.split('\n')
-        if all(line.strip().startswith(('* ', '- ', '• ')) for line in lines if line.strip()):
-            items = [re.sub(r'^[\*\-•]\s*', '', line.strip()) for line in lines if line.strip()]
-            html_parts.append('<ul>' + ''.join(f'<li>{item}</li>' for item in items) + '</ul>')
+        if '\n' not in p:
+            if p.startswith(_LIST_PREFIXES):
+                html_parts.append(f'<ul><li>{p[1:].lstrip()}</li></ul>')
+            else:
+                html_parts.append(f'<p>{p}</p>')
+            continue
+
+        lines = [line.strip() for line in p.split('\n')]
+        if all(line.startswith(_LIST_PREFIXES) for line in lines if line):
+            items = ''.join(f'<li>{line[1:].lstrip()}</li>' for line in lines if line)
+            html_parts.append(f'<ul>{items}</ul>')
         else:
             # Regular paragraph - convert single newlines to <br>
-            p = p.replace('\n', '<br>')
-            html_parts.append(f'<p>{p}</p>')
+            html_parts.append(f"<p>{p.replace(chr(10), '<br>')}</p>")
 
     return '\n'.join(html_parts)
 
 
+def markdown_key(text):
+    """Render cache key for a markdown render of `text`."""
+    return cache_key('markdown', MARKDOWN_VERSION, text)
+
+
+def cached_markdown_to_html(text, cache=None):
+    """markdown_to_html() through the persistent render cache, when one is given."""
+    if cache is None or not text:
+        return markdown_to_html(text)
+    return cache.get_or_render(markdown_key(text), lambda: markdown_to_html(text))
+
+
 def get_role_display(role_type):
     """Get display name for role type."""
     role_map = {
@@ -397,94 +454,82 @@ def generate_job_posting_schema(job):
     return json.dumps(schema, indent=2)
 
 
-def main():
-    print("=" * 60)
-    print("  FRACTIONAL PULSE - GENERATING JOB PAGES")
-    print("=" * 60)
-
-    os.makedirs(JOBS_DIR, exist_ok=True)
-
-    # Load job data
-    jobs_file = f"{DATA_DIR}/jobs.json"
-    if not os.path.exists(jobs_file):
-        print(f"  ERROR: {jobs_file} not found")
-        sys.exit(1)
-
-    with open(jobs_file) as f:
-        data = json.load(f)
-
-    jobs = data.get('jobs', [])
-    print(f"  Loaded {len(jobs)} jobs")
-
-    generated = 0
+def render_job_content(job, similar_jobs, cache=None, description_html=None):
+    """
+    Render everything on a job page that depends on the job itself.
 
-    for job in jobs:
-        slug = job.get('slug')
-        if not slug:
-            continue
-
-        company = escape_html(job.get('company', 'Confidential'))
-        title = escape_html(job.get('title', 'Fractional Executive'))
-        location = job.get('location', 'Remote')
-        comp = job.get('compensation', {})
-        comp_display = comp.get('display', 'Not disclosed')
-        role_type = job.get('role_type')
-        is_remote = job.get('is_remote', False)
-        date_posted = format_date(job.get('date_posted'))
-        source_url = job.get('source_url', '#')
-        description = job.get('description', '')
-        hours = job.get('hours', {})
-
-        # Format description
-        description_html = markdown_to_html(description) if description else '<p>No description available.</p>'
-
-        # Meta tags
-        tags_html = ""
-        if comp_display != 'Not disclosed':
-            tags_html += f'<span class="job-header__tag job-header__tag--salary">{comp_display}</span>'
-        if is_remote:
-            tags_html += '<span class="job-header__tag job-header__tag--remote">Remote</span>'
-        else:
-            tags_html += f'<span class="job-header__tag">{escape_html(location)}</span>'
-        if role_type and role_type != 'other':
-            tags_html += f'<span class="job-header__tag">{get_role_display(role_type)}</span>'
-        if hours.get('display') and hours.get('display') != 'Not specified':
-            tags_html += f'<span class="job-header__tag">{hours["display"]}</span>'
-
-        # Sidebar details
-        sidebar_items = []
-        sidebar_items.append(('Company', company))
-        sidebar_items.append(('Location', 'Remote' if is_remote else location))
-        if comp_display != 'Not disclosed':
-            sidebar_items.append(('Compensation', f'<span class="sidebar-card__value--highlight">{comp_display}</span>'))
-        if hours.get('display') and hours.get('display') != 'Not specified':
-            sidebar_items.append(('Hours', hours['display']))
-        if date_posted:
-            sidebar_items.append(('Posted', date_posted))
-
-        sidebar_html = ""
-        for label, value in sidebar_items:
-            sidebar_html += f'''
+    Returns the get_full_page() arguments (title, description, body_content,
+    canonical_path, extra_head); the site layout is applied separately.
+    Descriptions are rendered through `cache` (a RenderCache) when given,
+    unless their HTML is passed in as `description_html`.
+    """
+    slug = job.get('slug')
+    company = escape_html(job.get('company', 'Confidential'))
+    title = escape_html(job.get('title', 'Fractional Executive'))
+    location = job.get('location', 'Remote')
+    comp = job.get('compensation', {})
+    comp_display = comp.get('display', 'Not disclosed')
+    role_type = job.get('role_type')
+    is_remote = job.get('is_remote', False)
+    date_posted = format_date(job.get('date_posted'))
+    source_url = job.get('source_url', '#')
+    description = job.get('description', '')
+    hours = job.get('hours', {})
+
+    # Format description
+    if not description:
+        description_html = '<p>No description available.</p>'
+    elif description_html is None:
+        description_html = cached_markdown_to_html(description, cache)
+
+    # Meta tags
+    tags_html = ""
+    if comp_display != 'Not disclosed':
+        tags_html += f'<span class="job-header__tag job-header__tag--salary">{comp_display}</span>'
+    if is_remote:
+        tags_html += '<span class="job-header__tag job-header__tag--remote">Remote</span>'
+    else:
+        tags_html += f'<span class="job-header__tag">{escape_html(location)}</span>'
+    if role_type and role_type != 'other':
+        tags_html += f'<span class="job-header__tag">{get_role_display(role_type)}</span>'
+    if hours.get('display') and hours.get('display') != 'Not specified':
+        tags_html += f'<span class="job-header__tag">{hours["display"]}</span>'
+
+    # Sidebar details
+    sidebar_items = []
+    sidebar_items.append(('Company', company))
+    sidebar_items.append(('Location', 'Remote' if is_remote else location))
+    if comp_display != 'Not disclosed':
+        sidebar_items.append(('Compensation', f'<span class="sidebar-card__value--highlight">{comp_display}</span>'))
+    if hours.get('display') and hours.get('display') != 'Not specified':
+        sidebar_items.append(('Hours', hours['display']))
+    if date_posted:
+        sidebar_items.append(('Posted', date_posted))
+
+    sidebar_html = ''.join(
+        f'''
             <div class="sidebar-card__item">
                 <span class="sidebar-card__label">{label}</span>
                 <span class="sidebar-card__value">{value}</span>
             </div>'''
-
-        # Find similar jobs (same role type, different company)
-        similar_jobs = [j for j in jobs if j.get('role_type') == role_type and j.get('slug') != slug][:4]
-        similar_html = ""
-        if similar_jobs:
-            similar_cards = ""
-            for sj in similar_jobs:
-                sj_comp = sj.get('compensation', {}).get('display', '')
-                similar_cards += f'''
+        for label, value in sidebar_items
+    )
+
+    # Similar jobs (same role type, different company)
+    similar_html = ""
+    if similar_jobs:
+        cards = []
+        for sj in similar_jobs:
+            sj_comp = sj.get('compensation', {}).get('display', '')
+            cards.append(f'''
                 <a href="/jobs/{sj.get('slug')}/" class="similar-job">
                     <div class="similar-job__company">{escape_html(sj.get('company', ''))}</div>
                     <div class="similar-job__title">{escape_html(sj.get('title', ''))}</div>
                     {f'<div class="similar-job__salary">{sj_comp}</div>' if sj_comp and sj_comp != 'Not disclosed' else ''}
-                </a>'''
+                </a>''')
+        similar_cards = ''.join(cards)
 
-            similar_html = f'''
+        similar_html = f'''
             <div class="similar-jobs">
                 <h2 class="similar-jobs__title">Similar Opportunities</h2>
                 <div class="similar-jobs__grid">
@@ -492,11 +537,11 @@ def main():
                 </div>
             </div>'''
 
-        # JSON-LD Schema
-        schema_json = generate_job_posting_schema(job)
+    # JSON-LD Schema
+    schema_json = generate_job_posting_schema(job)
 
-        # Build page content
-        body_content = f'''
+    # Build page content
+    body_content = f'''
         <div class="job-detail">
             <div class="job-header">
                 <div class="job-header__inner">
@@ -547,34 +592,347 @@ def main():
         </div>
         '''
 
-        # Generate page
-        extra_head = f'''
+    # Generate page
+    extra_head = f'''
     <style>{JOB_DETAIL_CSS}</style>
     <script type="application/ld+json">
 {schema_json}
     </script>'''
 
-        html = get_full_page(
-            title=f"{title} at {company}",
-            description=f"{title} opportunity at {company}. {comp_display}. {location}. Apply now for this fractional executive role.",
-            body_content=body_content,
-            canonical_path=f"/jobs/{slug}/",
-            extra_head=extra_head
-        )
+    return {
+        'title': f"{title} at {company}",
+        'description': f"{title} opportunity at {company}. {comp_display}. {location}. Apply now for this fractional executive role.",
+        'body_content': body_content,
+        'canonical_path': f"/jobs/{slug}/",
+        'extra_head': extra_head,
+    }
+
+
+def job_content_key(job, similar_jobs):
+    """Render cache key for a job's content."""
+    return cache_key(
+        'job-content',
+        GENERATOR_HASH,
+        json.dumps(job, sort_keys=True, default=str),
+        json.dumps(similar_jobs, sort_keys=True, default=str),
+    )
+
+
+def cached_job_content(job, similar_jobs, cache=None):
+    """render_job_content() through the persistent render cache, when one is given."""
+    if cache is None:
+        return render_job_content(job, similar_jobs)
+    return json.loads(cache.get_or_render(
+        job_content_key(job, similar_jobs), lambda: json.dumps(render_job_content(job, similar_jobs, cache))
+    ))
+
+
+def render_job_page(job, similar_jobs, out=None, cache=None):
+    """
+    Render the full HTML page for one job (streamed into `out` when given).
+
+    The job content comes from `cache` when it holds a render for the same
+    inputs, so layout-only changes just re-wrap cached bodies.
+    """
+    return get_full_page(**cached_job_content(job, similar_jobs, cache), out=out)
+
+
+# =============================================================================
+# RENDER PIPELINE
+# =============================================================================
+
+def _render_batch(batch):
+    """
+    Process-pool render stage: turn one batch of (seq, path, cache key, job,
+    similar jobs, cached content JSON or None, cached description HTML or
+    None) into finished pages.
+
+    Returns (html, content JSON when rendered here, description HTML when
+    rendered here, render seconds, minify stats or None, (start_us, end_us)
+    of the page) per page, in batch order, and the worker_span() of the
+    batch. The page spans let the parent put each page on the worker's
+    trace timeline.
+    """
+    start_us = time.time_ns() // 1000
+    results = []
+    for _, _, _, job, similar_jobs, content_json, description_html in batch:
+        page_start_us = time.time_ns() // 1000
+        start = time.perf_counter()
+        rendered = None
+        rendered_description = None
+        if content_json is None:
+            description = job.get('description', '')
+            if description and description_html is None:
+                rendered_description = description_html = markdown_to_html(description)
+            rendered = content_json = json.dumps(
+                render_job_content(job, similar_jobs, description_html=description_html))
+        html = get_full_page(**json.loads(content_json))
+        minified = None
+        if MINIFY_HTML:
+            minify_start = time.perf_counter()
+            size = len(html.encode('utf-8'))
+            html = minify_html(html)
+            minified = (size, len(html.encode('utf-8')), time.perf_counter() - minify_start)
+        results.append((html, rendered, rendered_description, time.perf_counter() - start, minified,
+                        (page_start_us, time.time_ns() // 1000)))
+    return results, worker_span(start_us)
+
+
+class _PageWriter:
+    """
+    Thread-pool write stage. When several jobs share a slug, the page from
+    the latest job in feed order wins, as in a serial build.
+    """
+
+    def __init__(self, stage, stripes=64):
+        self.stage = stage
+        self.locks = [threading.Lock() for _ in range(stripes)]
+        self.latest = {}
+
+    def write(self, seq, path, html, seconds):
+        with self.locks[hash(path) % len(self.locks)]:
+            if self.latest.get(path, -1) < seq:
+                self.latest[path] = seq
+                with open_output(path) as f:
+                    f.write(html)
+        self.stage.page(path, seconds)
+
+
+async def run_pipeline(jobs, similar_index, cache, workers):
+    """
+    Render and write job pages through a staged pipeline:
+
+        producer (similar jobs, content and markdown cache lookups) -> render + minify in a
+        process pool -> write on a thread pool
+
+    Stages are connected by bounded queues, so rendering and disk writes
+    overlap while at most a few batches of pages are held in memory. Render
+    times and trace spans of each page come back from the workers with the
+    batch, so the build report covers the worker processes too.
+    Returns the number of pages generated.
+    """
+    loop = asyncio.get_running_loop()
+    stage = current_stage()
+    render_queue = asyncio.Queue(maxsize=workers * QUEUED_BATCHES_PER_WORKER)
+    write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_PAGES)
+    writer = _PageWriter(stage)
+    generated = 0
 
-        # Write file
-        job_dir = f"{JOBS_DIR}/{slug}"
-        os.makedirs(job_dir, exist_ok=True)
-        output_file = f"{job_dir}/index.html"
+    async def produce():
+        batch = []
+        for seq, job in enumerate(jobs):
+            stage.count('records')
+            slug = job.get('slug')
+            if not slug:
+                continue
+            path = f"{JOBS_DIR}/{slug}/index.html"
+            similar_jobs = get_similar_jobs(similar_index, job)
+            key = job_content_key(job, similar_jobs)
+            content_json = cache.get(key)
+            if content_json is None:
+                # The SQLite cache stays in this process, so workers get cached descriptions passed in
+                description = job.get('description', '')
+                description_html = cache.get(markdown_key(description)) if description else None
+                batch.append((seq, path, key, job, similar_jobs, None, description_html))
+            else:
+                # Cached content only needs the page chrome around it
+                batch.append((seq, path, key, None, None, content_json, None))
+            if len(batch) == RENDER_BATCH_SIZE:
+                await render_queue.put(batch)
+                batch = []
+        if batch:
+            await render_queue.put(batch)
+        for _ in range(workers):
+            await render_queue.put(None)
+
+    async def render(processes):
+        nonlocal generated
+        while (batch := await render_queue.get()) is not None:
+            results, (start_us, end_us, pid, tid) = await loop.run_in_executor(processes, _render_batch, batch)
+            stage.event('render batch', start_us, end_us, 'render', {'pages': len(batch)}, pid=pid, tid=tid)
+            for (seq, path, key, job, _, _, _), (html, rendered, description_html, seconds, minified, span) \
+                    in zip(batch, results):
+                stage.event(path, *span, 'page', {'cached': rendered is None}, pid=pid, tid=tid)
+                if rendered is not None:
+                    cache.put(key, rendered)
+                if description_html is not None:
+                    cache.put(markdown_key(job['description']), description_html)
+                if minified:
+                    record_minified('job', *minified)
+                generated += 1
+                await write_queue.put((seq, path, html, seconds))
+
+    async def write(threads):
+        while (item := await write_queue.get()) is not None:
+            await loop.run_in_executor(threads, writer.write, *item)
+
+    async def close_writes(upstream):
+        await asyncio.gather(*upstream)
+        for _ in range(WRITE_THREADS):
+            await write_queue.put(None)
+
+    with ProcessPoolExecutor(max_workers=workers) as processes, \
+            ThreadPoolExecutor(max_workers=WRITE_THREADS) as threads:
+        upstream = [asyncio.create_task(produce())]
+        upstream += [asyncio.create_task(render(processes)) for _ in range(workers)]
+        tasks = upstream + [asyncio.create_task(write(threads)) for _ in range(WRITE_THREADS)]
+        tasks.append(asyncio.create_task(close_writes(upstream)))
+
+        # A failure in any stage cancels the others and is raised here; otherwise a
+        # dead writer would leave the render stage blocked on a full queue
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return generated
+
+
+def rebuild_selected(jobs_file, selectors):
+    """
+    Partial rebuild: render the jobs matching `selectors` and the jobs whose
+    similar-job cards link to them, then refresh the board listing pages and
+    sitemap parts that include the selected jobs.
+
+    The feed is read once and held in memory, so this is meant for fixing or
+    previewing a few postings; a job that moves between listings (new role,
+    remote flag) needs a full build. The board's search index files and the
+    post-processing stages (prune_css.py, precompress_site.py) are not re-run.
+    """
+    import numpy as np
+    from board_index import build_facet_masks
+    from build_manifest import load_manifest, record, file_hash
+    from generate_job_board import write_listings, count_facets
+    from generate_sitemap import write_sitemaps
+    from job_columns import JobColumns
+
+    stage = current_stage()
+    with stage.span('load'):
+        jobs = list(iter_jobs(jobs_file))
+        similar_index = build_similar_index(jobs)
+    stage.count('records', len(jobs))
+
+    selected = [i for i, job in enumerate(jobs) if job.get('slug') and job_matches(job, selectors)]
+    if not selected:
+        print("  No jobs match --only")
+        return
+    selected_slugs = {jobs[i]['slug'] for i in selected}
+
+    # Pages showing a selected job as a similar job must pick up its new card
+    slugs = set(selected_slugs)
+    for job in jobs:
+        if job.get('slug') and any(c.get('slug') in selected_slugs for c in get_similar_jobs(similar_index, job)):
+            slugs.add(job['slug'])
+    print(f"  Selected {len(selected)} jobs; {len(slugs) - len(selected_slugs)} more pages link to them")
+
+    # Duplicate slugs are rendered in feed order, as in a full build
+    written = []
+    with RenderCache() as cache:
+        for job in jobs:
+            if job.get('slug') not in slugs:
+                continue
+            path = f"{JOBS_DIR}/{job['slug']}/index.html"
+            start = time.perf_counter()
+            with open_page(path, 'job') as f:
+                render_job_page(job, get_similar_jobs(similar_index, job), out=f, cache=cache)
+            stage.page(path, time.perf_counter() - start)
+            written.append(path)
+    print(f"  Generated {len(written)} job pages")
+
+    columns = JobColumns(jobs)
+    touched = np.zeros(len(jobs), dtype=bool)
+    touched[selected] = True
+    written += write_listings(jobs, columns, count_facets(build_facet_masks(columns)), touched=touched)
+
+    # Record the new hashes so the affected sitemap entries get a fresh lastmod
+    manifest = load_manifest()
+    for path in written:
+        record(manifest['files'], os.path.relpath(path, SITE_DIR).replace(os.sep, '/'), file_hash(path))
+    write_sitemaps(jobs, manifest)
+
+
+def main(only=None, workers=None):
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - GENERATING JOB PAGES")
+    print("=" * 60)
+
+    os.makedirs(JOBS_DIR, exist_ok=True)
+
+    # Stream job data
+    jobs_file = f"{DATA_DIR}/jobs.json"
+    if not os.path.exists(jobs_file):
+        print(f"  ERROR: {jobs_file} not found")
+        sys.exit(1)
+
+    if only:
+        rebuild_selected(jobs_file, parse_selectors(only))
+        print_output_report()
+        print("=" * 60)
+        return
+
+    stage = current_stage()
+    with stage.span('load'):
+        header = read_jobs_header(jobs_file)
+        print(f"  Streaming {header.get('total_jobs', 'all')} jobs from jobs.json")
+
+        # Similar jobs come from a precomputed side index, so one pass over the feed is enough
+        similar_index = load_similar_index(SIMILAR_JOBS_FILE, jobs_file)
+
+    generated = 0
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Rendered job content persists between builds in build/cache/
+    with RenderCache() as cache:
+        if workers > 0:
+            print(f"  Rendering with {workers} worker processes and {WRITE_THREADS} write threads")
+            generated = asyncio.run(run_pipeline(iter_jobs(jobs_file), similar_index, cache, workers))
+        else:
+            for job in iter_jobs(jobs_file):
+                stage.count('records')
+                slug = job.get('slug')
+                if not slug:
+                    continue
 
-        with open(output_file, 'w') as f:
-            f.write(html)
+                path = f"{JOBS_DIR}/{slug}/index.html"
+                start = time.perf_counter()
+                with open_page(path, 'job') as f:
+                    render_job_page(job, get_similar_jobs(similar_index, job), out=f, cache=cache)
+                stage.page(path, time.perf_counter() - start)
 
-        generated += 1
+                generated += 1
 
     print(f"  Generated {generated} job pages")
+    print(f"  Render cache: {cache.hits} hits, {cache.misses} misses")
+    stage.count('cache_hits', cache.hits)
+    stage.count('cache_misses', cache.misses)
+    print_output_report()
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    from profiling import add_profile_arguments, run_main
+
+    parser = argparse.ArgumentParser(description="Generate the Fractional Pulse job pages")
+    parser.add_argument("--only", action="append", metavar="SELECTOR",
+                        help="Rebuild only matching jobs: id:ID, slug:SLUG, role:ROLE, company:NAME "
+                             "or a bare slug / job id (repeatable)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Render processes (default: CPU count; 0 renders serially in-process). "
+                             "Workers send back per-page render times and trace spans for the build report")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    # cProfile and tracemalloc only see this process, so profiled builds render serially
+    workers = args.workers
+    if args.profile and workers != 0:
+        print("  --profile: rendering serially (--workers 0) so the profile covers page rendering")
+        workers = 0
+
+    run_main(main, 'job_pages', args, only=args.only, workers=workers)
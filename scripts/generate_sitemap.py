@@ -1,141 +1,294 @@
 #!/usr/bin/env python3
 """
 Generate XML sitemaps for Fractional Pulse.
+
+URLs are streamed into numbered sitemap files that roll over at the sitemap
+protocol limits (50,000 URLs or 50 MB uncompressed per file), each with a
+gzipped copy, and sitemap_index.xml lists the parts. Memory use does not
+depend on the number of URLs.
+
+Every lastmod comes from the build manifest (see build_manifest.py): the
+date a page's content hash last changed. Parts whose entries are unchanged
+are left untouched on disk. Output goes through site_output.py, so with
+SITE_ARCHIVE set every part is written into the archive instead.
 """
 
-import json
+import glob
+import gzip
+import hashlib
 import os
 import sys
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 # Add scripts directory to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-from nav_config import BASE_URL
+from nav_config import BASE_URL, JOBS_REMOTE_PATH, JOBS_ROLE_PATH
+from job_store import iter_jobs
+from site_output import write_fragments, open_binary_output
+from site_archive import is_archived
+from build_manifest import load_manifest, save_manifest, record, page_lastmod
+from build_report import current_stage
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
+SITEMAPS_DIR = f'{SITE_DIR}/sitemaps'
 
 TODAY = datetime.now().strftime('%Y-%m-%d')
 
+# Sitemap protocol limits per file
+MAX_SITEMAP_URLS = 50000
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+# Site-relative pattern of the parts SitemapWriter writes (each with its own
+# .gz copy, so precompress_site.py leaves them alone)
+SITEMAP_PART_PATTERN = 'sitemaps/sitemap-*.xml'
+
+URLSET_OPEN = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = '</urlset>'
+
+# Quotes are escaped too, as the sitemap protocol requires
+_XML_ENTITIES = {'"': '&quot;', "'": '&apos;'}
 
-def generate_sitemap_xml(urls):
-    """Generate sitemap XML from URL list."""
-    xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
 
-    for url in urls:
-        loc = url.get('loc', '')
-        lastmod = url.get('lastmod', TODAY)
-        changefreq = url.get('changefreq', 'weekly')
-        priority = url.get('priority', '0.5')
+def xml_escape(value):
+    """Escape a value for use as XML text."""
+    return escape(str(value), _XML_ENTITIES)
 
-        xml += '  <url>\n'
-        xml += f'    <loc>{loc}</loc>\n'
-        xml += f'    <lastmod>{lastmod}</lastmod>\n'
-        xml += f'    <changefreq>{changefreq}</changefreq>\n'
-        xml += f'    <priority>{priority}</priority>\n'
-        xml += '  </url>\n'
 
-    xml += '</urlset>'
-    return xml
+def render_url(loc, lastmod=TODAY, changefreq='weekly', priority='0.5'):
+    """Render one <url> entry."""
+    return (
+        '  <url>\n'
+        f'    <loc>{xml_escape(loc)}</loc>\n'
+        f'    <lastmod>{lastmod}</lastmod>\n'
+        f'    <changefreq>{changefreq}</changefreq>\n'
+        f'    <priority>{priority}</priority>\n'
+        '  </url>\n'
+    )
 
 
 def generate_sitemap_index(sitemaps):
-    """Generate sitemap index XML."""
-    xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml += '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    """Yield sitemap index XML, one fragment per sitemap."""
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
 
     for sitemap in sitemaps:
-        xml += '  <sitemap>\n'
-        xml += f'    <loc>{sitemap["loc"]}</loc>\n'
-        xml += f'    <lastmod>{sitemap.get("lastmod", TODAY)}</lastmod>\n'
-        xml += '  </sitemap>\n'
+        yield (
+            '  <sitemap>\n'
+            f'    <loc>{xml_escape(sitemap["loc"])}</loc>\n'
+            f'    <lastmod>{sitemap.get("lastmod", TODAY)}</lastmod>\n'
+            '  </sitemap>\n'
+        )
 
-    xml += '</sitemapindex>'
-    return xml
+    yield '</sitemapindex>'
 
 
-def main():
-    print("=" * 60)
-    print("  FRACTIONAL PULSE - GENERATING SITEMAPS")
-    print("=" * 60)
+class SitemapWriter:
+    """
+    Stream <url> entries into sitemap-<name>.xml, sitemap-<name>-2.xml, ...
 
-    os.makedirs(f"{SITE_DIR}/sitemaps", exist_ok=True)
+    A new part is started before a file would pass MAX_SITEMAP_URLS entries
+    or MAX_SITEMAP_BYTES bytes. Every part is written together with a
+    gzipped .xml.gz copy (with a fixed header timestamp, so unchanged parts
+    produce identical files).
+
+    Parts are written to temporary files and only replace the published
+    ones when their hash differs from the one in `manifest['sitemaps']`,
+    which also records the date each part last changed. Under SITE_ARCHIVE,
+    every part goes straight into the archive.
+    """
+
+    def __init__(self, name, manifest, directory=SITEMAPS_DIR):
+        self.name = name
+        self.manifest = manifest
+        self.directory = directory
+        self.parts = []
+        self.total_urls = 0
+        self._files = None
+        self._archived = False
+        self._digest = None
+        self._urls = 0
+        self._bytes = 0
+
+    def _part_name(self, number):
+        suffix = '' if number == 1 else f'-{number}'
+        return f'sitemap-{self.name}{suffix}.xml'
+
+    def _open_part(self):
+        name = self._part_name(len(self.parts) + 1)
+        path = f'{self.directory}/{name}'
+        self._archived = is_archived(path)
+        # Published parts are only replaced when their content changed (see _close_part)
+        tmp = '' if self._archived else '.tmp'
+        xml_file = open_binary_output(f'{path}{tmp}')
+        gz_raw = open_binary_output(f'{path}.gz{tmp}')
+        self._files = (xml_file, gz_raw, gzip.GzipFile(name, 'wb', fileobj=gz_raw, mtime=0))
+        self._digest = hashlib.sha256()
+        self._urls = 0
+        self._bytes = 0
+        self.parts.append({'name': name, 'path': path, 'urls': 0})
+        self._write(URLSET_OPEN.encode('utf-8'))
+
+    def _write(self, data):
+        self._files[0].write(data)
+        self._files[2].write(data)
+        self._digest.update(data)
+        self._bytes += len(data)
+
+    def _close_part(self):
+        self._write(URLSET_CLOSE.encode('utf-8'))
+        xml_file, gz_raw, gz_file = self._files
+        gz_file.close()
+        gz_raw.close()
+        xml_file.close()
+        self._files = None
+
+        part = self.parts[-1]
+        part['urls'] = self._urls
+        part['bytes'] = self._bytes
+        path = part['path']
+        status = record(self.manifest['sitemaps'], part['name'], self._digest.hexdigest())
+        if self._archived:
+            part['rewritten'] = True
+        elif status == 'unchanged' and os.path.exists(path) and os.path.exists(f'{path}.gz'):
+            os.remove(f'{path}.tmp')
+            os.remove(f'{path}.gz.tmp')
+        else:
+            os.replace(f'{path}.tmp', path)
+            os.replace(f'{path}.gz.tmp', f'{path}.gz')
+            part['rewritten'] = True
+        part['lastmod'] = self.manifest['sitemaps'][part['name']]['lastmod']
+
+    def add(self, loc, lastmod=TODAY, changefreq='weekly', priority='0.5'):
+        """Append one URL, rolling over to a new part at the protocol limits."""
+        entry = render_url(loc, lastmod, changefreq, priority).encode('utf-8')
+        if self._files and (self._urls >= MAX_SITEMAP_URLS or
+                            self._bytes + len(entry) + len(URLSET_CLOSE) > MAX_SITEMAP_BYTES):
+            self._close_part()
+        if not self._files:
+            self._open_part()
+        self._write(entry)
+        self._urls += 1
+        self.total_urls += 1
+
+    def close(self):
+        """Finish the current part and return the list of parts written."""
+        if self._files:
+            self._close_part()
+        return self.parts
 
-    # Load job data
-    jobs_file = f"{DATA_DIR}/jobs.json"
-    jobs = []
-    if os.path.exists(jobs_file):
-        with open(jobs_file) as f:
-            data = json.load(f)
-        jobs = data.get('jobs', [])
-
-    print(f"  Loaded {len(jobs)} jobs")
-
-    # Main sitemap (core pages)
-    main_urls = [
-        {'loc': f'{BASE_URL}/', 'priority': '1.0', 'changefreq': 'daily'},
-        {'loc': f'{BASE_URL}/jobs/', 'priority': '0.9', 'changefreq': 'daily'},
-        {'loc': f'{BASE_URL}/about/', 'priority': '0.6', 'changefreq': 'monthly'},
-    ]
-
-    main_xml = generate_sitemap_xml(main_urls)
-    with open(f'{SITE_DIR}/sitemaps/sitemap-main.xml', 'w') as f:
-        f.write(main_xml)
-    print(f"  Generated: sitemaps/sitemap-main.xml ({len(main_urls)} URLs)")
+
+def remove_stale_parts(written, manifest):
+    """Delete sitemap parts (and .gz copies) left over from larger earlier builds."""
+    keep = {part['path'] for part in written}
+    for path in glob.glob(f'{SITEMAPS_DIR}/sitemap-*.xml'):
+        if path not in keep:
+            os.remove(path)
+            if os.path.exists(f'{path}.gz'):
+                os.remove(f'{path}.gz')
+    names = {part['name'] for part in written}
+    for name in list(manifest['sitemaps']):
+        if name not in names:
+            del manifest['sitemaps'][name]
+
+
+def write_sitemaps(jobs, manifest):
+    """
+    Write the job and main sitemaps for `jobs` (any iterable of job records),
+    then the sitemap index. Only parts whose entries changed are rewritten;
+    the updated manifest is saved. Returns the sitemap parts.
+    """
+    stage = current_stage()
+
+    def lastmod(url_path):
+        return page_lastmod(manifest, url_path)
 
     # Jobs sitemap
-    job_urls = []
+    job_sitemap = SitemapWriter('jobs', manifest)
+    listed_roles = {}
+    has_remote = False
     for job in jobs:
+        stage.count('records')
         slug = job.get('slug')
         if slug:
-            job_urls.append({
-                'loc': f'{BASE_URL}/jobs/{slug}/',
-                'lastmod': job.get('date_posted', TODAY)[:10] if job.get('date_posted') else TODAY,
-                'priority': '0.7',
-                'changefreq': 'weekly'
-            })
-
-    if job_urls:
-        jobs_xml = generate_sitemap_xml(job_urls)
-        with open(f'{SITE_DIR}/sitemaps/sitemap-jobs.xml', 'w') as f:
-            f.write(jobs_xml)
-        print(f"  Generated: sitemaps/sitemap-jobs.xml ({len(job_urls)} URLs)")
+            job_sitemap.add(
+                f'{BASE_URL}/jobs/{slug}/',
+                lastmod=lastmod(f'/jobs/{slug}/'),
+                priority='0.7',
+                changefreq='weekly',
+            )
+        listed_roles[job.get('role_type') or 'other'] = True
+        has_remote = has_remote or bool(job.get('is_remote'))
+    job_parts = job_sitemap.close()
+    print(f"  Generated: {len(job_parts)} job sitemap(s) ({job_sitemap.total_urls} URLs)")
+
+    # Main sitemap (core pages and the non-empty static job listings)
+    main_sitemap = SitemapWriter('main', manifest)
+    main_pages = [('/', '1.0', 'daily'), ('/jobs/', '0.9', 'daily'), ('/about/', '0.6', 'monthly')]
+    if has_remote:
+        main_pages.append((JOBS_REMOTE_PATH, '0.8', 'daily'))
+    for role in listed_roles:
+        main_pages.append((JOBS_ROLE_PATH.format(role=role), '0.8', 'daily'))
+    for path, priority, changefreq in main_pages:
+        main_sitemap.add(f'{BASE_URL}{path}', lastmod=lastmod(path), priority=priority, changefreq=changefreq)
+    main_parts = main_sitemap.close()
+    print(f"  Generated: sitemaps/sitemap-main.xml ({main_sitemap.total_urls} URLs)")
+
+    parts = main_parts + job_parts
+    remove_stale_parts(parts, manifest)
+    save_manifest(manifest)
+    rewritten = sum(1 for part in parts if part.get('rewritten'))
+    print(f"  Rewrote {rewritten} of {len(parts)} sitemap parts")
+    stage.count('skipped_unchanged', len(parts) - rewritten)
+    stage.count('bytes_written', sum(part['bytes'] for part in parts if part.get('rewritten')))
 
     # Sitemap index
-    sitemaps = [
-        {'loc': f'{BASE_URL}/sitemaps/sitemap-main.xml', 'lastmod': TODAY},
-    ]
-    if job_urls:
-        sitemaps.append({'loc': f'{BASE_URL}/sitemaps/sitemap-jobs.xml', 'lastmod': TODAY})
-
-    index_xml = generate_sitemap_index(sitemaps)
-    with open(f'{SITE_DIR}/sitemap_index.xml', 'w') as f:
-        f.write(index_xml)
-    print(f"  Generated: sitemap_index.xml")
-
-    # Also create a simple sitemap.xml at root for compatibility
-    all_urls = main_urls + job_urls
-    all_xml = generate_sitemap_xml(all_urls)
-    with open(f'{SITE_DIR}/sitemap.xml', 'w') as f:
-        f.write(all_xml)
-    print(f"  Generated: sitemap.xml ({len(all_urls)} total URLs)")
+    sitemaps = [{'loc': f"{BASE_URL}/sitemaps/{part['name']}", 'lastmod': part['lastmod']} for part in parts]
+    write_fragments(f'{SITE_DIR}/sitemap_index.xml', generate_sitemap_index(sitemaps))
+    print(f"  Generated: sitemap_index.xml ({len(sitemaps)} sitemaps)")
+
+    # sitemap.xml stays a valid entry point for older references: it is a
+    # copy of the index rather than a second list of every URL
+    write_fragments(f'{SITE_DIR}/sitemap.xml', generate_sitemap_index(sitemaps))
+    print(f"  Generated: sitemap.xml (index copy)")
+    return parts
+
+
+def main():
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - GENERATING SITEMAPS")
+    print("=" * 60)
+
+    os.makedirs(SITEMAPS_DIR, exist_ok=True)
+
+    # Page lastmod dates come from the content hashes in the build manifest
+    stage = current_stage()
+    with stage.span('load'):
+        manifest = load_manifest()
+    if not manifest['files']:
+        print("  WARNING: build manifest is empty; run build_manifest.py first")
+
+    # Job data is streamed; records are never held in memory together
+    jobs_file = f"{DATA_DIR}/jobs.json"
+    jobs = iter_jobs(jobs_file) if os.path.exists(jobs_file) else []
+    write_sitemaps(jobs, manifest)
 
     # Update robots.txt with sitemap reference
     robots_content = f"""User-agent: *
 Allow: /
 
 Sitemap: {BASE_URL}/sitemap_index.xml
-Sitemap: {BASE_URL}/sitemap.xml
 """
-    with open(f'{SITE_DIR}/robots.txt', 'w') as f:
-        f.write(robots_content)
+    write_fragments(f'{SITE_DIR}/robots.txt', [robots_content])
     print(f"  Updated: robots.txt")
 
     print("=" * 60)
 
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+
+    run_main(main, 'sitemap')
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Columnar NumPy view of job records for Fractional Pulse.
+
+Built once from the job list so stats and page generators can count,
+average, take percentiles and build masks with vectorized operations
+instead of reading one job dict at a time.
+"""
+
+import numpy as np
+
+# Categorical fields and the label used when a job has no value
+# (matches how the exporters bucket missing values in their stats)
+CATEGORICAL_FIELDS = {
+    'role_type': 'other',
+    'function_category': 'other',
+    'location_type': 'remote',
+    'seniority': '',
+    'hours_bucket': 'unspecified',
+}
+
+# Categorical fields that are not top-level job keys
+_NESTED_FIELDS = {
+    'hours_bucket': lambda job: (job.get('hours') or {}).get('bucket'),
+}
+
+
+def _float_column(values):
+    """Build a float64 array, with NaN for missing values."""
+    return np.fromiter(
+        (np.nan if v is None else v for v in values),
+        dtype=np.float64,
+    )
+
+
+def _date_column(values):
+    """Build a datetime64[D] array from ISO date strings, with NaT for missing values."""
+    days = [v[:10] if v else 'NaT' for v in values]
+    try:
+        return np.array(days, dtype='datetime64[D]')
+    except ValueError:
+        column = np.full(len(days), np.datetime64('NaT'), dtype='datetime64[D]')
+        for i, day in enumerate(days):
+            try:
+                column[i] = np.datetime64(day, 'D')
+            except ValueError:
+                pass
+        return column
+
+
+def hourly_rate_summary(rates):
+    """
+    Summarize hourly rates the way market_stats.json reports them.
+
+    Zero and missing (NaN) rates are ignored. The median is the upper
+    median, matching the previous sorted(rates)[n // 2] behaviour.
+
+    Returns:
+        (sample_size, average, median) with 0 for average/median when empty
+    """
+    rates = np.asarray(rates, dtype=np.float64)
+    rates = rates[(rates != 0) & ~np.isnan(rates)]
+    if not rates.size:
+        return 0, 0, 0
+    median = np.partition(rates, rates.size // 2)[rates.size // 2]
+    return int(rates.size), float(rates.mean()), float(median)
+
+
+class JobColumns:
+    """
+    Column arrays for a list of job dicts (as stored in jobs.json).
+
+    Numeric fields are float64 arrays with NaN for missing values, flags are
+    bool arrays and categorical fields are int32 codes into `categories[field]`.
+    Codes are assigned in first-seen order, so counts come back in the same
+    order the old dict-based loops produced.
+    """
+
+    def __init__(self, jobs):
+        self.size = len(jobs)
+
+        compensation = [j.get('compensation') or {} for j in jobs]
+        hours = [j.get('hours') or {} for j in jobs]
+
+        # Numeric fields
+        self.comp_min = _float_column(c.get('min') for c in compensation)
+        self.comp_max = _float_column(c.get('max') for c in compensation)
+        self.hourly_min = _float_column(c.get('hourly_min') for c in compensation)
+        self.hourly_max = _float_column(c.get('hourly_max') for c in compensation)
+        self.hours_min = _float_column(h.get('min') for h in hours)
+        self.hours_max = _float_column(h.get('max') for h in hours)
+        self.date_posted = _date_column([j.get('date_posted') for j in jobs])
+
+        # Flags
+        self.is_remote = np.fromiter((bool(j.get('is_remote')) for j in jobs), dtype=bool, count=self.size)
+        self.has_salary = np.fromiter((bool(j.get('has_salary')) for j in jobs), dtype=bool, count=self.size)
+        self.is_c_level = np.fromiter((bool(j.get('is_c_level')) for j in jobs), dtype=bool, count=self.size)
+        self.is_vp_level = np.fromiter((bool(j.get('is_vp_level')) for j in jobs), dtype=bool, count=self.size)
+
+        # Categorical codes
+        self.codes = {}
+        self.categories = {}
+        for field, default in CATEGORICAL_FIELDS.items():
+            lookup = {}
+            get = _NESTED_FIELDS.get(field, lambda job, field=field: job.get(field))
+            self.codes[field] = np.fromiter(
+                (lookup.setdefault(get(j) or default, len(lookup)) for j in jobs),
+                dtype=np.int32,
+                count=self.size,
+            )
+            self.categories[field] = list(lookup)
+
+    def __len__(self):
+        return self.size
+
+    def mask(self, field, value):
+        """Boolean mask of jobs whose categorical `field` equals `value`."""
+        categories = self.categories[field]
+        if value not in categories:
+            return np.zeros(self.size, dtype=bool)
+        return self.codes[field] == categories.index(value)
+
+    def value_counts(self, field, mask=None):
+        """Count jobs per category label, in first-seen order."""
+        codes = self.codes[field] if mask is None else self.codes[field][mask]
+        counts = np.bincount(codes, minlength=len(self.categories[field]))
+        return {
+            label: int(count)
+            for label, count in zip(self.categories[field], counts)
+            if count
+        }
+
+    def group_mean(self, field, values):
+        """Mean of `values` per category label, ignoring NaN entries."""
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        codes = self.codes[field][present]
+        minlength = len(self.categories[field])
+        counts = np.bincount(codes, minlength=minlength)
+        totals = np.bincount(codes, weights=values[present], minlength=minlength)
+        return {
+            label: float(total / count)
+            for label, total, count in zip(self.categories[field], totals, counts)
+            if count
+        }
+
+    def percentile(self, values, q, mask=None):
+        """Percentile(s) `q` of `values`, ignoring NaN entries; None when empty."""
+        values = np.asarray(values, dtype=np.float64)
+        if mask is not None:
+            values = values[mask]
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return None
+        return np.percentile(values, q)
+
+    def sort_order(self, values, descending=False):
+        """
+        Ordinals that sort the jobs by `values` (a numeric or date column).
+
+        Missing values (NaN/NaT) go last and ties keep feed order.
+        """
+        values = np.asarray(values)
+        if np.issubdtype(values.dtype, np.datetime64):
+            missing = np.isnat(values)
+            keys = values.astype(np.int64).astype(np.float64)
+        else:
+            keys = values.astype(np.float64)
+            missing = np.isnan(keys)
+        keys = np.where(missing, 0, -keys if descending else keys)
+        return np.lexsort((np.arange(self.size), keys, missing))
+
+    def stats(self):
+        """Return the jobs.json `stats` block computed from the columns."""
+        return {
+            "total_jobs": self.size,
+            "by_role_type": self.value_counts('role_type'),
+            "by_function": self.value_counts('function_category'),
+            "by_location_type": self.value_counts('location_type'),
+            "with_salary": int(self.has_salary.sum()),
+            "c_level": int(self.is_c_level.sum()),
+            "vp_level": int(self.is_vp_level.sum()),
+        }
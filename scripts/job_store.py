@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Streaming access to the job store for Fractional Pulse.
+
+Yields job records one at a time from jobs.json (or a JSON Lines export,
+optionally gzipped) without loading the whole feed, and maintains the small
+side indexes that page generation needs alongside the stream.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+
+# Read size for the incremental JSON parser
+CHUNK_SIZE = 1 << 16
+
+# Similar jobs shown on each job page
+SIMILAR_JOBS_LIMIT = 4
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _open_text(path):
+    """Open a job store file for reading, transparently handling .gz."""
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+
+def _is_jsonl(path):
+    """Return True for JSON Lines job stores (one record per line)."""
+    return path.endswith(('.jsonl', '.jsonl.gz', '.ndjson', '.ndjson.gz'))
+
+
+class _JsonStream:
+    """
+    Minimal incremental JSON reader over a text file.
+
+    Holds at most one undecoded value plus one read chunk in memory, so a
+    record array of any length can be walked with a fixed memory ceiling.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Read more data, dropping the already-consumed prefix."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(CHUNK_SIZE, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """Consume `char`, raising ValueError if something else comes next."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed job store: expected {char!r}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def array_items(self):
+        """Yield the items of the array starting at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+    def object_items(self, stop_key=None):
+        """
+        Yield (key, value) pairs of the object starting at the current position.
+
+        When `stop_key` is reached, yields (stop_key, None) and leaves the
+        stream positioned at that key's value instead of decoding it.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            if key == stop_key:
+                yield key, None
+                return
+            yield key, self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect('}')
+            return
+
+
+def iter_jobs(path):
+    """
+    Yield job records one by one from a job store.
+
+    Supports the jobs.json export document ({"jobs": [...]}), a bare JSON
+    array of jobs, and JSON Lines files, each optionally gzipped.
+    """
+    with _open_text(path) as f:
+        if _is_jsonl(path):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
+
+        stream = _JsonStream(f)
+        if stream.peek() == '[':
+            yield from stream.array_items()
+            return
+
+        for key, _ in stream.object_items(stop_key='jobs'):
+            if key == 'jobs':
+                yield from stream.array_items()
+                return
+
+
+def read_jobs_header(path):
+    """
+    Return the top-level fields of a jobs.json document that precede "jobs"
+    (last_updated, total_jobs, stats) without reading the job records.
+    """
+    if _is_jsonl(path):
+        return {}
+    with _open_text(path) as f:
+        stream = _JsonStream(f)
+        if stream.peek() != '{':
+            return {}
+        return {key: value for key, value in stream.object_items(stop_key='jobs') if key != 'jobs'}
+
+
+# =============================================================================
+# SELECTORS
+# =============================================================================
+
+# Selector prefixes accepted by --only, and the job field each one matches
+SELECTOR_FIELDS = {'id': 'job_id', 'slug': 'slug', 'role': 'role_type', 'company': 'company'}
+
+
+def parse_selectors(values):
+    """
+    Parse --only values ("slug:acme-cfo", "role:cfo", "company:Acme", "id:123"
+    or a bare slug / job id) into a list of (fields, value) pairs.
+    """
+    selectors = []
+    for value in values:
+        prefix, sep, rest = value.partition(':')
+        if sep and prefix in SELECTOR_FIELDS:
+            selectors.append(((SELECTOR_FIELDS[prefix],), rest))
+        else:
+            selectors.append((('slug', 'job_id'), value))
+    return selectors
+
+
+def job_matches(job, selectors):
+    """True if `job` matches any selector (company names compare case-insensitively)."""
+    for fields, value in selectors:
+        for field in fields:
+            actual = job.get(field)
+            if field == 'role_type':
+                actual = actual or 'other'
+            elif field == 'company':
+                actual, value = (actual or '').casefold(), value.casefold()
+            if actual is not None and str(actual) == value:
+                return True
+    return False
+
+
+# =============================================================================
+# SIDE INDEXES
+# =============================================================================
+
+def similar_candidate(job):
+    """Reduce a job record to the fields a similar-job card needs."""
+    return {
+        'slug': job.get('slug'),
+        'company': job.get('company', ''),
+        'title': job.get('title', ''),
+        'compensation': {'display': job.get('compensation', {}).get('display', '')},
+    }
+
+
+def build_similar_index(jobs, limit=SIMILAR_JOBS_LIMIT):
+    """
+    Build the similar-jobs side index from an iterable of job records.
+
+    Keeps, per role type and in feed order, only the jobs that can appear in
+    some page's first `limit` similar jobs once that page's own slug is
+    excluded. Duplicate slugs are accounted for, so the result matches a
+    full scan of the feed while memory stays bounded by the number of roles.
+    """
+    index = {}
+    slug_counts = {}
+    for job in jobs:
+        role = job.get('role_type')
+        candidates = index.setdefault(role, [])
+        counts = slug_counts.setdefault(role, {})
+        slug = job.get('slug')
+
+        # Most candidates any other page would have to skip as its own slug
+        most_skipped = max((n for s, n in counts.items() if s != slug), default=0)
+        if len(candidates) - most_skipped < limit:
+            candidates.append(similar_candidate(job))
+            counts[slug] = counts.get(slug, 0) + 1
+    return index
+
+
+def get_similar_jobs(index, job, limit=SIMILAR_JOBS_LIMIT):
+    """Return similar jobs for `job`: same role type, excluding the job itself."""
+    slug = job.get('slug')
+    candidates = index.get(job.get('role_type'), [])
+    return [c for c in candidates if c.get('slug') != slug][:limit]
+
+
+def _source_fingerprint(jobs_path):
+    """
+    Identify a job store revision by a hash of its bytes, so any edit to a
+    record (even one that keeps the file size and header) is noticed.
+    """
+    digest = hashlib.sha256()
+    with open(jobs_path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return {
+        'bytes': os.path.getsize(jobs_path),
+        'sha256': digest.hexdigest(),
+    }
+
+
+def write_similar_index(index_path, jobs, jobs_path):
+    """Precompute the similar-jobs index for `jobs` and save it next to the job store."""
+    index = build_similar_index(jobs)
+    data = {
+        'source': _source_fingerprint(jobs_path),
+        'limit': SIMILAR_JOBS_LIMIT,
+        # Stored as pairs so a null role type survives the round trip
+        'roles': [[role, candidates] for role, candidates in index.items()],
+    }
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    return index
+
+
+def load_similar_index(index_path, jobs_path):
+    """
+    Load the precomputed similar-jobs index for `jobs_path`.
+
+    Falls back to building it with one streaming pass over the job store
+    when the saved index is missing or was built from a different export.
+    """
+    if os.path.exists(index_path):
+        with open(index_path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('limit') == SIMILAR_JOBS_LIMIT and data.get('source') == _source_fingerprint(jobs_path):
+            return {role: candidates for role, candidates in data.get('roles', [])}
+    return build_similar_index(iter_jobs(jobs_path))
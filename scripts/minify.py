@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+HTML minification for generated pages.
+
+Conservative by design: every whitespace run outside preserved blocks
+becomes a single space (or newline), which renders identically, while
+<pre>, <textarea> and job description markup are copied untouched.
+Inline CSS is compacted, inline JS loses indentation and comment lines,
+and JSON-LD is re-serialized without indentation.
+"""
+
+import json
+import re
+
+# Blocks handled separately from the surrounding markup
+_BLOCK_RE = re.compile(
+    r'<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>|<div class="job-description">',
+    re.S | re.I,
+)
+_BLOCK_PARTS_RE = re.compile(r'(<[^>]*>)(.*)(</[^>]*>)', re.S)
+_DIV_TAG_RE = re.compile(r'<(/?)div\b', re.I)
+_JSON_LD_RE = re.compile(r'type=["\']application/ld\+json["\']', re.I)
+
+_TAG_SPLIT_RE = re.compile(r'(<[^>]*>)')
+_QUOTED_RE = re.compile(r'("[^"]*"|\'[^\']*\')')
+_NEWLINE_WS_RE = re.compile(r'\s*\n\s*')
+_SPACE_RUN_RE = re.compile(r'[ \t\r\f\v]{2,}')
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_WS_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON_RE = re.compile(r':\s+')
+
+
+def _collapse(text):
+    return _SPACE_RUN_RE.sub(' ', _NEWLINE_WS_RE.sub('\n', text))
+
+
+def collapse_whitespace(html):
+    """
+    Reduce whitespace runs to one newline (if the run had one) or one space.
+
+    Quoted attribute values are left as they are.
+    """
+    pieces = _TAG_SPLIT_RE.split(html)
+    for i in range(1, len(pieces), 2):
+        if '"' in pieces[i] or "'" in pieces[i]:
+            values = _QUOTED_RE.split(pieces[i])
+            pieces[i] = ''.join(v if j % 2 else _collapse(v) for j, v in enumerate(values))
+        else:
+            pieces[i] = _collapse(pieces[i])
+    for i in range(0, len(pieces), 2):
+        pieces[i] = _collapse(pieces[i])
+    return ''.join(pieces)
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_WS_RE.sub(' ', css)
+    css = _CSS_PUNCT_RE.sub(r'\1', css)
+    css = _CSS_COLON_RE.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """Drop indentation, blank lines and whole-line // comments (line breaks are kept for ASI)."""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def minify_json_ld(text):
+    """Re-serialize JSON-LD compactly; leaves unparseable content as it was."""
+    try:
+        return json.dumps(json.loads(text), separators=(',', ':'))
+    except ValueError:
+        return text.strip()
+
+
+def _closing_div_end(html, pos):
+    """Index just past the </div> that closes a <div> opened before `pos`."""
+    depth = 1
+    for match in _DIV_TAG_RE.finditer(html, pos):
+        depth += -1 if match.group(1) else 1
+        if not depth:
+            return html.index('>', match.end()) + 1
+    return len(html)
+
+
+def _minify_block(tag, block):
+    """Minify the contents of a <style> or <script> block, keeping its tags."""
+    parts = _BLOCK_PARTS_RE.match(block)
+    if not parts:
+        return block
+    open_tag, content, close_tag = parts.groups()
+    if tag == 'style':
+        content = minify_css(content)
+    elif _JSON_LD_RE.search(open_tag):
+        content = minify_json_ld(content)
+    else:
+        content = minify_js(content)
+    return f'{collapse_whitespace(open_tag)}{content}{close_tag}'
+
+
+def minify_html(html):
+    """Minify a complete HTML page."""
+    out = []
+    pos = 0
+    while True:
+        match = _BLOCK_RE.search(html, pos)
+        if not match:
+            out.append(collapse_whitespace(html[pos:]))
+            break
+        out.append(collapse_whitespace(html[pos:match.start()]))
+        tag = (match.group(1) or '').lower()
+        if tag in ('style', 'script'):
+            out.append(_minify_block(tag, match.group(0)))
+            pos = match.end()
+        elif tag:
+            out.append(match.group(0))
+            pos = match.end()
+        else:
+            # Job description: copied verbatim up to its matching </div>
+            end = _closing_div_end(html, match.end())
+            out.append(html[match.start():end])
+            pos = end
+    return ''.join(out).strip()
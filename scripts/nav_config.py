@@ -25,16 +25,20 @@ HEADER_CTA = {
     "href": "/jobs/",
 }
 
+# Static job board listings (generated by generate_job_board.py)
+JOBS_REMOTE_PATH = "/jobs/remote/"
+JOBS_ROLE_PATH = "/jobs/role/{role}/"
+
 # Footer configuration
 FOOTER_COLUMNS = [
     {
         "title": "Jobs",
         "links": [
             {"label": "All Jobs", "href": "/jobs/"},
-            {"label": "Fractional CFO", "href": "/jobs/?role=cfo"},
-            {"label": "Fractional CMO", "href": "/jobs/?role=cmo"},
-            {"label": "Fractional CTO", "href": "/jobs/?role=cto"},
-            {"label": "Fractional COO", "href": "/jobs/?role=coo"},
+            {"label": "Fractional CFO", "href": JOBS_ROLE_PATH.format(role="cfo")},
+            {"label": "Fractional CMO", "href": JOBS_ROLE_PATH.format(role="cmo")},
+            {"label": "Fractional CTO", "href": JOBS_ROLE_PATH.format(role="cto")},
+            {"label": "Fractional COO", "href": JOBS_ROLE_PATH.format(role="coo")},
         ]
     },
     {
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Precompress generated site files for Fractional Pulse.
+
+Writes a .gz sibling (and .br when the brotli module is installed) next to
+every HTML, XML, CSS, JS and JSON file under site/, so static hosts and
+CDNs can serve compressed responses without compressing on the fly.
+
+Files are compressed in parallel. The content hash each sibling was built
+from is kept in build/cache/precompress.json, and the siblings themselves
+are stored by content hash under build/cache/precompressed/, so unchanged
+files are skipped (or their siblings restored from the cache on a fresh
+checkout) instead of compressed again. The cache directory is restored
+between CI runs. Sitemap parts (SITEMAP_PART_PATTERN) are left alone:
+generate_sitemap.py writes their .gz copies itself. Run as the last step
+that writes to site/; the workflow runs it after the site is committed, so
+the siblings only reach the deploy artifact.
+"""
+
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from build_report import current_stage
+from generate_sitemap import SITEMAP_PART_PATTERN
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_DIR = 'site'
+HASHES_FILE = 'build/cache/precompress.json'
+SIBLING_CACHE_DIR = 'build/cache/precompressed'
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.xml', '.css', '.js', '.json')
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def compressed_suffixes():
+    """Sibling suffixes this build can produce."""
+    return ('.gz', '.br') if brotli else ('.gz',)
+
+
+def is_external(rel_path):
+    """True for files whose .gz copy an earlier stage writes (the sitemap parts)."""
+    return fnmatch.fnmatch(rel_path, SITEMAP_PART_PATTERN)
+
+
+def iter_compressible(site_dir=SITE_DIR):
+    """Yield site-relative paths of files that get compressed siblings."""
+    for root, dirs, files in os.walk(site_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                yield os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+
+
+def load_hashes(path=HASHES_FILE):
+    """Content hash per site-relative path from the last run, or {}."""
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_hashes(hashes, path=HASHES_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(hashes, f, indent=1, sort_keys=True)
+    os.replace(f'{path}.tmp', path)
+
+
+def cached_sibling(content_hash, suffix, cache_dir=SIBLING_CACHE_DIR):
+    """Cache path of the `suffix` sibling built from content with `content_hash`."""
+    return f'{cache_dir}/{content_hash[:2]}/{content_hash}{suffix}'
+
+
+def compress_file(site_dir, rel_path, previous_hash, cache_dir=SIBLING_CACHE_DIR):
+    """
+    Write compressed siblings for one file unless its content is unchanged.
+
+    The file is read once; the same bytes are hashed and fed to each encoder.
+    Siblings already in the cache for this content hash are copied instead
+    of compressed again.
+
+    Returns:
+        (rel_path, content_hash, original_bytes, {suffix: compressed_bytes},
+        restored), with an empty dict when the file was skipped and restored
+        True when the siblings came from the cache
+    """
+    start_us = time.time_ns() // 1000
+    path = f'{site_dir}/{rel_path}'
+    with open(path, 'rb') as f:
+        data = f.read()
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    suffixes = compressed_suffixes()
+    if content_hash == previous_hash and all(os.path.exists(path + s) for s in suffixes):
+        return rel_path, content_hash, len(data), {}, False
+
+    cached = {s: cached_sibling(content_hash, s, cache_dir) for s in suffixes}
+    if all(os.path.exists(p) for p in cached.values()):
+        for suffix, cache_path in cached.items():
+            shutil.copyfile(cache_path, path + suffix)
+        return rel_path, content_hash, len(data), {}, True
+
+    # mtime=0 keeps .gz output identical for identical input
+    encoded = {'.gz': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli:
+        encoded['.br'] = brotli.compress(data, quality=BROTLI_QUALITY)
+
+    sizes = {}
+    os.makedirs(os.path.dirname(cached['.gz']), exist_ok=True)
+    for suffix, payload in encoded.items():
+        for target in (path + suffix, cached[suffix]):
+            with open(target, 'wb') as f:
+                f.write(payload)
+        sizes[suffix] = len(payload)
+    current_stage().event(rel_path, start_us, time.time_ns() // 1000, 'compress')
+    return rel_path, content_hash, len(data), sizes, False
+
+
+def prune_sibling_cache(hashes, cache_dir=SIBLING_CACHE_DIR):
+    """Delete cached siblings for content no current file has; returns the count."""
+    keep = set(hashes.values())
+    removed = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.split('.', 1)[0] not in keep:
+                os.remove(os.path.join(root, name))
+                removed += 1
+    return removed
+
+
+def remove_orphans(site_dir, sources):
+    """Delete .gz/.br siblings whose source file no longer exists; returns the count."""
+    removed = 0
+    for root, _, files in os.walk(site_dir):
+        for name in files:
+            base, suffix = os.path.splitext(name)
+            if suffix not in ('.gz', '.br') or not base.endswith(COMPRESSIBLE_EXTENSIONS):
+                continue
+            rel_path = os.path.relpath(os.path.join(root, base), site_dir).replace(os.sep, '/')
+            if rel_path not in sources:
+                os.remove(os.path.join(root, name))
+                removed += 1
+    return removed
+
+
+def precompress_site(site_dir=SITE_DIR, workers=None, hashes_path=HASHES_FILE,
+                     cache_dir=SIBLING_CACHE_DIR):
+    """
+    Compress every changed file under `site_dir` and record the content hashes.
+
+    Returns:
+        Build statistics (files, compressed, skipped, restored, external,
+        removed, original and compressed byte totals per suffix for the files
+        compressed this run)
+    """
+    previous = load_hashes(hashes_path)
+    sources = list(iter_compressible(site_dir))
+    rel_paths = [p for p in sources if not is_external(p)]
+
+    stats = {'files': len(rel_paths), 'compressed': 0, 'skipped': 0, 'restored': 0, 'bytes': 0,
+             'external': len(sources) - len(rel_paths),
+             'compressed_bytes': {s: 0 for s in compressed_suffixes()}}
+    hashes = {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = pool.map(lambda p: compress_file(site_dir, p, previous.get(p), cache_dir), rel_paths)
+        for rel_path, content_hash, size, sizes, restored in results:
+            hashes[rel_path] = content_hash
+            if not sizes:
+                stats['restored' if restored else 'skipped'] += 1
+                continue
+            stats['compressed'] += 1
+            stats['bytes'] += size
+            for suffix, compressed in sizes.items():
+                stats['compressed_bytes'][suffix] += compressed
+
+    stats['removed'] = remove_orphans(site_dir, set(sources))
+    prune_sibling_cache(hashes, cache_dir)
+    save_hashes(hashes, hashes_path)
+    return stats
+
+
+def main():
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - PRECOMPRESSING SITE")
+    print("=" * 60)
+
+    if not brotli:
+        print("  brotli not installed; writing .gz only")
+
+    stats = precompress_site()
+    stage = current_stage()
+    stage.count('records', stats['files'])
+    stage.count('skipped_unchanged', stats['skipped'] + stats['restored'])
+    stage.count('bytes_written', sum(stats['compressed_bytes'].values()))
+    print(f"  Files: {stats['files']} ({stats['compressed']} compressed, {stats['skipped']} unchanged, "
+          f"{stats['restored']} restored from cache)")
+    if stats['external']:
+        print(f"  Left {stats['external']} sitemap parts gzipped by generate_sitemap.py")
+    for suffix, compressed in stats['compressed_bytes'].items():
+        if stats['bytes']:
+            print(f"  {suffix}: {stats['bytes']:,} -> {compressed:,} bytes "
+                  f"({compressed / stats['bytes']:.0%})")
+    if stats['removed']:
+        print(f"  Removed {stats['removed']} orphaned siblings")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    from profiling import run_main
+
+    run_main(main, 'precompress')
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the Fractional Pulse build scripts.
+
+Every generator (and the exporter) accepts --profile. With it, the script's
+main function runs under cProfile and tracemalloc, a .pstats file and an
+allocation report are written to build/profiles/, and the hottest
+functions are printed at the end. Without it, main() is called directly and
+the profilers are never imported.
+
+    python scripts/generate_job_pages.py --profile
+    python -m pstats build/profiles/job_pages-<timestamp>.pstats
+
+tracemalloc slows allocation-heavy code noticeably, so compare timings
+between profiled runs rather than against unprofiled builds. Only the main
+process is profiled, so generate_job_pages.py renders serially (as with
+--workers 0) under --profile.
+
+run_main() is also where each stage's build telemetry (build_report.py)
+is started and written, profiled or not.
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from build_report import start_stage, finish_stage
+
+PROFILE_DIR = 'build/profiles'
+
+# Functions / allocation sites listed in the reports
+PROFILE_TOP = 20
+
+# Traced memory is sampled this often; a new snapshot is kept whenever it
+# grows by PEAK_SNAPSHOT_GROWTH over the last one
+PEAK_SAMPLE_INTERVAL = 0.1
+PEAK_SNAPSHOT_GROWTH = 1.1
+
+
+def add_profile_arguments(parser):
+    """Add --profile and --profile-top to a script's argument parser."""
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Profile the run (cProfile + tracemalloc); reports go to {PROFILE_DIR}/")
+    parser.add_argument("--profile-top", type=int, default=PROFILE_TOP, metavar="N",
+                        help=f"Entries shown in the profile reports (default: {PROFILE_TOP})")
+    return parser
+
+
+def run_main(main, name, args=None, **kwargs):
+    """
+    Call main(**kwargs) as build stage `name`, profiled when --profile was given.
+
+    Scripts with their own argument parser pass its parsed `args` (see
+    add_profile_arguments); otherwise the command line is parsed here.
+    """
+    if args is None:
+        args = add_profile_arguments(argparse.ArgumentParser()).parse_args()
+    start_stage(name)
+    try:
+        if args.profile:
+            return profile_call(main, name, args.profile_top, **kwargs)
+        return main(**kwargs)
+    finally:
+        # Stages that raise or sys.exit() still get their report entry
+        finish_stage()
+
+
+class _PeakSnapshots(threading.Thread):
+    """Background sampler keeping a tracemalloc snapshot taken near peak memory."""
+
+    def __init__(self, tracemalloc):
+        super().__init__(daemon=True)
+        self.tracemalloc = tracemalloc
+        self.snapshot = None
+        self.size = 0
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(PEAK_SAMPLE_INTERVAL):
+            current = self.tracemalloc.get_traced_memory()[0]
+            if current > self.size * PEAK_SNAPSHOT_GROWTH:
+                self.snapshot = self.tracemalloc.take_snapshot()
+                self.size = current
+
+    def stop(self):
+        self.done.set()
+        self.join()
+
+
+def profile_call(main, name, top=PROFILE_TOP, **kwargs):
+    """Run main(**kwargs) under cProfile and tracemalloc and write the reports."""
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    prefix = f"{PROFILE_DIR}/{name}-{time.strftime('%Y%m%d-%H%M%S')}"
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    sampler = _PeakSnapshots(tracemalloc)
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        return profiler.runcall(main, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.stop()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = sampler.snapshot or tracemalloc.take_snapshot()
+        snapshot_size = sampler.size or current
+        tracemalloc.stop()
+
+        profiler.dump_stats(f'{prefix}.pstats')
+        with open(f'{prefix}-alloc.txt', 'w', encoding='utf-8') as f:
+            f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MB "
+                    f"(still allocated at exit: {current / 1024 / 1024:.1f} MB)\n\n")
+            f.write(f"Top {top} allocation sites when {snapshot_size / 1024 / 1024:.1f} MB was allocated "
+                    f"(largest sampled snapshot):\n")
+            for stat in snapshot.statistics('lineno')[:top]:
+                f.write(f"  {stat}\n")
+
+        print("=" * 60)
+        print(f"  PROFILE: {name} ({elapsed:.2f}s, peak traced memory {peak / 1024 / 1024:.1f} MB)")
+        print("=" * 60)
+        pstats.Stats(profiler).sort_stats('tottime').print_stats(top)
+        print(f"  Saved: {prefix}.pstats")
+        print(f"  Saved: {prefix}-alloc.txt")
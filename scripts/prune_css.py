@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Remove unused CSS from generated pages, per page type.
+
+Every page inlines the full shared stylesheet (templates.get_all_css()) plus
+its generator's own CSS. This stage collects the class names each page type
+(home, board, job) actually uses across all of its rendered pages, drops
+the rules whose selectors need a class that never appears, and rewrites the
+<style> blocks so every page of a type carries the same pruned stylesheet.
+
+Classes referenced from inline scripts (cards rendered client-side, toggled
+states such as "active") count as used. Run after the page generators and
+before build_manifest.py.
+"""
+
+import os
+import re
+import sys
+
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from site_output import open_output, page_type_for
+from build_report import current_stage
+
+SITE_DIR = 'site'
+
+# Page types whose stylesheets are pruned
+PRUNED_PAGE_TYPES = ('home', 'board', 'job')
+
+# Classes added at runtime without appearing as a literal class name
+ALWAYS_USED_CLASSES = {'active'}
+
+_STYLE_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style\s*>)', re.S | re.I)
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script\s*>', re.S | re.I)
+_CLASS_ATTR_RE = re.compile(r'class\s*=\s*["\']([^"\']*)["\']', re.I)
+_WORD_RE = re.compile(r'[A-Za-z_][\w-]*')
+_SELECTOR_CLASS_RE = re.compile(r'\.(-?[A-Za-z_][\w-]*)')
+_COMMENT_RE = re.compile(r'[ \t]*/\*.*?\*/([ \t]*\n)?', re.S)
+
+# At-rules whose blocks contain ordinary rules
+_GROUPING_AT_RULES = ('@media', '@supports')
+
+
+def used_classes(html):
+    """Class names a page uses in markup or may add from its inline scripts."""
+    classes = set(ALWAYS_USED_CLASSES)
+    for value in _CLASS_ATTR_RE.findall(html):
+        classes.update(value.split())
+    for script in _SCRIPT_RE.findall(html):
+        classes.update(_WORD_RE.findall(script))
+    return classes
+
+
+def _selector_used(selector, classes):
+    """A selector can match only if every class it requires is used."""
+    return all(name in classes for name in _SELECTOR_CLASS_RE.findall(selector))
+
+
+def _matching_brace(css, open_index):
+    """Index of the } closing the { at `open_index`."""
+    depth = 0
+    for i in range(open_index, len(css)):
+        if css[i] == '{':
+            depth += 1
+        elif css[i] == '}':
+            depth -= 1
+            if not depth:
+                return i
+    return len(css) - 1
+
+
+def prune_css(css, classes):
+    """
+    Return `css` without the rules that cannot match given the used `classes`.
+
+    Selector lists keep only their matching selectors; @media/@supports
+    blocks are pruned recursively and dropped when empty. Other at-rules
+    (@keyframes, @font-face) and the formatting of kept rules are untouched.
+    """
+    css = _COMMENT_RE.sub('', css)
+    out = []
+    pos = 0
+    while True:
+        open_index = css.find('{', pos)
+        if open_index < 0:
+            out.append(css[pos:])
+            break
+        close_index = _matching_brace(css, open_index)
+        prelude = css[pos:open_index]
+        selector = prelude.strip()
+        leading = prelude[:len(prelude) - len(prelude.lstrip())]
+        block = css[open_index:close_index + 1]
+
+        if selector.startswith(_GROUPING_AT_RULES):
+            inner = prune_css(block[1:-1], classes)
+            if inner.strip():
+                out.append(f'{prelude}{{{inner}}}')
+        elif selector.startswith('@'):
+            out.append(prelude + block)
+        else:
+            parts = selector.split(',')
+            kept = [part for part in parts if _selector_used(part, classes)]
+            if len(kept) == len(parts):
+                out.append(prelude + block)
+            elif kept:
+                separator = ',\n' if '\n' in selector else ','
+                kept_selector = separator.join(part.strip() for part in kept)
+                trailing = prelude[len(prelude.rstrip()):]
+                out.append(f'{leading}{kept_selector}{trailing}{block}')
+        pos = close_index + 1
+    return ''.join(out)
+
+
+def iter_pages(site_dir=SITE_DIR):
+    """Yield (rel_path, page_type) for every HTML page under `site_dir`."""
+    for root, dirs, files in os.walk(site_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith('.html'):
+                rel_path = os.path.relpath(os.path.join(root, name), site_dir).replace(os.sep, '/')
+                yield rel_path, page_type_for(rel_path)
+
+
+def prune_site(site_dir=SITE_DIR, page_types=PRUNED_PAGE_TYPES):
+    """
+    Prune the inline stylesheets of every page of `page_types`.
+
+    Returns:
+        {page_type: {'pages', 'css_bytes', 'pruned_bytes'}}
+    """
+    pages = [(p, t) for p, t in iter_pages(site_dir) if t in page_types]
+    stage = current_stage()
+    stage.count('records', len(pages))
+
+    # Pass 1: union of used classes per page type
+    classes_by_type = {}
+    with stage.span('scan'):
+        for rel_path, page_type in pages:
+            with open(f'{site_dir}/{rel_path}', encoding='utf-8') as f:
+                classes_by_type.setdefault(page_type, set()).update(used_classes(f.read()))
+
+    # Pass 2: rewrite <style> blocks (each distinct block is pruned once per type)
+    stats = {}
+    pruned_cache = {}
+    for rel_path, page_type in pages:
+        path = f'{site_dir}/{rel_path}'
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        type_stats = stats.setdefault(page_type, {'pages': 0, 'css_bytes': 0, 'pruned_bytes': 0})
+
+        def replace_style(match):
+            key = (page_type, match.group(2))
+            if key not in pruned_cache:
+                pruned_cache[key] = prune_css(match.group(2), classes_by_type[page_type])
+            pruned = pruned_cache[key]
+            type_stats['css_bytes'] += len(match.group(2).encode('utf-8'))
+            type_stats['pruned_bytes'] += len(pruned.encode('utf-8'))
+            return f'{match.group(1)}{pruned}{match.group(3)}'
+
+        pruned_html = _STYLE_RE.sub(replace_style, html)
+        type_stats['pages'] += 1
+        if pruned_html != html:
+            with open_output(path) as f:
+                f.write(pruned_html)
+            stage.page(path)
+        else:
+            stage.count('skipped_unchanged')
+    return stats
+
+
+def main():
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - PRUNING UNUSED CSS")
+    print("=" * 60)
+
+    stats = prune_site()
+    for page_type, type_stats in stats.items():
+        saved = type_stats['css_bytes'] - type_stats['pruned_bytes']
+        print(f"  {page_type}: {type_stats['pages']} pages, inline CSS "
+              f"{type_stats['css_bytes']:,} -> {type_stats['pruned_bytes']:,} bytes ({saved:,} saved)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    from profiling import run_main
+
+    run_main(main, 'prune_css')
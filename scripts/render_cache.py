@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Persistent render cache for Fractional Pulse.
+
+A small SQLite store of rendered HTML fragments, keyed by a hash of the
+renderer and its input, that survives between builds (build/cache/). Entries
+are evicted least-recently-used first once the cache grows past its size
+budget, so unchanged content costs a hash and a lookup instead of a render.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+CACHE_DIR = 'build/cache'
+CACHE_FILE = f'{CACHE_DIR}/render_cache.sqlite3'
+
+# Total size of cached values before least-recently-used entries are evicted
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def cache_key(*parts):
+    """Hash the given strings into a cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Key/value cache of rendered fragments backed by SQLite.
+
+    Reads and writes happen in one transaction that is committed (and the
+    cache trimmed to `max_bytes`) on close(). Usable as a context manager.
+    """
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_CACHE_BYTES):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+        self._clock = time.time_ns()
+
+    def _tick(self):
+        """Monotonic use stamp (later calls always sort after earlier ones)."""
+        self._clock = max(self._clock + 1, time.time_ns())
+        return self._clock
+
+    def get(self, key):
+        """Return the cached value for `key`, or None."""
+        row = self.db.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute('UPDATE entries SET last_used = ? WHERE key = ?', (self._tick(), key))
+        return row[0]
+
+    def put(self, key, value):
+        """Store `value` under `key`."""
+        self.db.execute(
+            'INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)',
+            (key, value, len(value.encode('utf-8')), self._tick()),
+        )
+
+    def get_or_render(self, key, render):
+        """Return the cached value for `key`, calling `render()` and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.put(key, value)
+        return value
+
+    def evict(self):
+        """Drop least-recently-used entries until the cache fits in max_bytes; returns the count."""
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        doomed = []
+        for key, size in self.db.execute('SELECT key, size FROM entries ORDER BY last_used'):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self.db.executemany('DELETE FROM entries WHERE key = ?', doomed)
+        return len(doomed)
+
+    def close(self):
+        """Trim the cache, commit and close the database."""
+        self.evict()
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
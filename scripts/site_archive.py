@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Archive output for the generated site.
+
+With SITE_ARCHIVE set (e.g. SITE_ARCHIVE=build/artifact.tar), pages that
+generators write through site_output.py are streamed straight into one
+archive instead of thousands of files under site/: no per-page directory
+creation and no filesystem metadata. A .tar archive is uncompressed (the
+format the GitHub Pages artifact uses); a .zip archive deflates text
+entries and stores already-compressed ones (.gz, .br, images).
+
+Each generator run appends to the archive, so a build starts with `reset`,
+which truncates it; otherwise every rerun would pile another copy of each
+page into it. A path written more than once keeps its last entry, which is
+the one extracted. Files that stages still write to disk (assets, search
+index) are added with `pack`, which skips paths already archived:
+
+    python scripts/site_archive.py reset build/artifact.tar
+    SITE_ARCHIVE=build/artifact.tar python scripts/generate_job_pages.py
+    SITE_ARCHIVE=build/artifact.tar python scripts/generate_sitemap.py
+    python scripts/site_archive.py pack build/artifact.tar
+    python scripts/site_archive.py expand build/artifact.tar preview/
+
+The post-processing stages (prune_css.py, audit_pages.py, build_manifest.py,
+check_links.py, precompress_site.py) read pages from site/ and are not run
+in archive mode.
+"""
+
+import atexit
+import io
+import os
+import sys
+import tarfile
+import threading
+import time
+import warnings
+import zipfile
+
+SITE_DIR = 'site'
+
+SITE_ARCHIVE = os.environ.get('SITE_ARCHIVE', '')
+
+# Zip entries with these suffixes are stored; everything else is deflated
+STORED_SUFFIXES = ('.gz', '.br', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.woff', '.woff2', '.zip')
+
+ZIP_LEVEL = 6
+
+
+class SiteArchive:
+    """Append-only tar or zip archive of site files; add() is thread-safe."""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_zip = path.endswith('.zip')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.is_zip:
+            self.archive = zipfile.ZipFile(path, 'a', compresslevel=ZIP_LEVEL)
+            self.names = set(self.archive.namelist())
+        else:
+            self.archive = tarfile.open(path, 'a', format=tarfile.PAX_FORMAT)
+            self.names = set(self.archive.getnames())
+        self.mtime = int(time.time())
+        # Size of the latest entry per name written by this process
+        self.sizes = {}
+        self.lock = threading.Lock()
+
+    def add(self, name, data):
+        """Add `data` (bytes) as entry `name`, a site-relative path."""
+        with self.lock:
+            if self.is_zip:
+                info = zipfile.ZipInfo(name, time.localtime(self.mtime)[:6])
+                info.compress_type = zipfile.ZIP_STORED if name.endswith(STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                if name in self.names:
+                    # A later entry for the same name replaces the earlier one on extraction
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        self.archive.writestr(info, data)
+                else:
+                    self.archive.writestr(info, data)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = self.mtime
+                info.mode = 0o644
+                self.archive.addfile(info, io.BytesIO(data))
+            self.names.add(name)
+            self.sizes[name] = len(data)
+
+    def close(self):
+        with self.lock:
+            self.archive.close()
+
+
+class _ArchiveEntry:
+    """Text (or, with `binary`, bytes) file-like sink that adds its contents to the archive on close."""
+
+    def __init__(self, archive, name, binary=False):
+        self.archive = archive
+        self.name = name
+        self.binary = binary
+        self.fragments = []
+
+    def write(self, fragment):
+        self.fragments.append(fragment)
+
+    def flush(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def close(self):
+        data = b''.join(self.fragments) if self.binary else ''.join(self.fragments).encode('utf-8')
+        self.archive.add(self.name, data)
+        self.fragments = []
+
+
+_archive = None
+# Writer threads race to open the archive on their first page
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """The SITE_ARCHIVE archive for this process, opened on first use (None when unset)."""
+    global _archive
+    if _archive is None and SITE_ARCHIVE:
+        with _archive_lock:
+            if _archive is None:
+                archive = SiteArchive(SITE_ARCHIVE)
+                atexit.register(archive.close)
+                _archive = archive
+    return _archive
+
+
+def archive_name(path, site_dir=SITE_DIR):
+    """Site-relative entry name for `path`, or None if it is outside `site_dir`."""
+    rel_path = os.path.relpath(os.path.abspath(path), os.path.abspath(site_dir))
+    if rel_path == '.' or rel_path.startswith('..'):
+        return None
+    return rel_path.replace(os.sep, '/')
+
+
+def is_archived(path):
+    """True when `path` is written into SITE_ARCHIVE rather than to disk."""
+    return bool(SITE_ARCHIVE) and archive_name(path) is not None
+
+
+def open_archive_entry(path, binary=False):
+    """Text (or bytes) sink for `path` inside SITE_ARCHIVE, or None when not archiving this path."""
+    archive = get_archive()
+    name = archive_name(path) if archive else None
+    if name is None:
+        return None
+    return _ArchiveEntry(archive, name, binary)
+
+
+def archived_size(path):
+    """Size of the entry this process last archived for `path`, or None."""
+    if _archive is None:
+        return None
+    return _archive.sizes.get(archive_name(path))
+
+
+def reset(archive_path):
+    """Start a build with an empty archive; returns True if an old one was removed."""
+    if os.path.exists(archive_path):
+        os.remove(archive_path)
+        return True
+    return False
+
+
+def pack(archive_path, site_dir=SITE_DIR):
+    """Add every file under `site_dir` not yet in the archive; returns the number added."""
+    archive = SiteArchive(archive_path)
+    added = 0
+    try:
+        for root, dirs, files in os.walk(site_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                rel_path = os.path.relpath(path, site_dir).replace(os.sep, '/')
+                if rel_path in archive.names:
+                    continue
+                with open(path, 'rb') as f:
+                    archive.add(rel_path, f.read())
+                added += 1
+    finally:
+        archive.close()
+    return added
+
+
+def expand(archive_path, dest):
+    """Extract an archive into `dest` for local inspection; returns the number of entries."""
+    os.makedirs(dest, exist_ok=True)
+    if archive_path.endswith('.zip'):
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(dest)
+            return len(archive.infolist())
+    with tarfile.open(archive_path) as archive:
+        archive.extractall(dest, filter='data')
+        return len(archive.getmembers())
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pack or expand a site archive")
+    sub = parser.add_subparsers(dest='command', required=True)
+    reset_cmd = sub.add_parser('reset', help="Remove the archive before a build writes into it")
+    reset_cmd.add_argument('archive')
+    pack_cmd = sub.add_parser('pack', help="Add files under site/ that are not yet archived")
+    pack_cmd.add_argument('archive')
+    pack_cmd.add_argument('site_dir', nargs='?', default=SITE_DIR)
+    expand_cmd = sub.add_parser('expand', help="Extract an archive for local inspection")
+    expand_cmd.add_argument('archive')
+    expand_cmd.add_argument('dest', nargs='?', default='build/site-preview')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  FRACTIONAL PULSE - SITE ARCHIVE")
+    print("=" * 60)
+
+    if not os.path.exists(args.archive) and args.command == 'expand':
+        print(f"  ERROR: {args.archive} not found")
+        sys.exit(1)
+
+    if args.command == 'reset':
+        if reset(args.archive):
+            print(f"  Removed {args.archive}")
+        else:
+            print(f"  {args.archive} does not exist yet")
+        print("=" * 60)
+        return
+
+    if args.command == 'pack':
+        added = pack(args.archive, args.site_dir)
+        print(f"  Added {added} files from {args.site_dir}/ to {args.archive}")
+    else:
+        entries = expand(args.archive, args.dest)
+        print(f"  Extracted {entries} entries from {args.archive} to {args.dest}/")
+    print(f"  Archive size: {os.path.getsize(args.archive):,} bytes")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Output helpers for writing generated site files.
+
+Pages are streamed fragment by fragment into a buffered file handle, so
+generators never have to hold a whole page (or sitemap) as one string.
+
+Set MINIFY_HTML=1 to minify HTML pages on the way out (see minify.py); each
+generator then reports the bytes saved per page type. Set SITE_ARCHIVE to a
+.tar or .zip path to stream files under site/ into that archive instead
+(see site_archive.py).
+"""
+
+import os
+import time
+
+from templates import get_full_page
+from minify import minify_html
+from site_archive import open_archive_entry
+
+# Buffer size for generated files
+WRITE_BUFFER_SIZE = 1 << 16
+
+MINIFY_HTML = os.environ.get('MINIFY_HTML', '') not in ('', '0')
+
+# Per page type: pages written, bytes before/after minification, seconds spent
+OUTPUT_STATS = {}
+
+# Output directories already created by this process
+_CREATED_DIRS = set()
+
+
+def page_type_for(rel_path):
+    """Classify a site-relative page path as home, board, job or other."""
+    if rel_path == 'index.html':
+        return 'home'
+    if rel_path == 'jobs/index.html' or rel_path.startswith(('jobs/page/', 'jobs/remote/', 'jobs/role/')):
+        return 'board'
+    if rel_path.startswith('jobs/') and rel_path.count('/') == 2:
+        return 'job'
+    return 'other'
+
+
+def _make_output_dir(path):
+    directory = os.path.dirname(path)
+    if directory and directory not in _CREATED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _CREATED_DIRS.add(directory)
+
+
+def open_output(path):
+    """
+    Open a generated file for writing, creating its directory first. Under
+    SITE_ARCHIVE, site files go into the archive instead.
+    """
+    entry = open_archive_entry(path)
+    if entry is not None:
+        return entry
+    _make_output_dir(path)
+    return open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+
+def open_binary_output(path):
+    """open_output() for bytes (e.g. gzipped sitemap parts)."""
+    entry = open_archive_entry(path, binary=True)
+    if entry is not None:
+        return entry
+    _make_output_dir(path)
+    return open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+
+class _MinifyingPage:
+    """File-like page sink that minifies the whole page when closed."""
+
+    def __init__(self, path, page_type):
+        self.path = path
+        self.page_type = page_type
+        self.fragments = []
+
+    def write(self, fragment):
+        self.fragments.append(fragment)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def close(self):
+        start = time.perf_counter()
+        html = ''.join(self.fragments)
+        minified = minify_html(html)
+        elapsed = time.perf_counter() - start
+        self.fragments = []
+
+        with open_output(self.path) as f:
+            f.write(minified)
+        record_minified(self.page_type, len(html.encode('utf-8')), len(minified.encode('utf-8')), elapsed)
+
+
+def record_minified(page_type, size, minified_size, seconds):
+    """Add one minified page to OUTPUT_STATS (also for pages minified in worker processes)."""
+    stats = OUTPUT_STATS.setdefault(page_type, {'pages': 0, 'bytes': 0, 'minified_bytes': 0, 'seconds': 0.0})
+    stats['pages'] += 1
+    stats['bytes'] += size
+    stats['minified_bytes'] += minified_size
+    stats['seconds'] += seconds
+
+
+def open_page(path, page_type='page'):
+    """Open an HTML page for writing; minified on close when MINIFY_HTML is set."""
+    if MINIFY_HTML:
+        return _MinifyingPage(path, page_type)
+    return open_output(path)
+
+
+def write_fragments(path, fragments):
+    """Write an iterable of string fragments to `path`."""
+    with open_output(path) as f:
+        for fragment in fragments:
+            f.write(fragment)
+
+
+def write_page(path, title, description, body_content, canonical_path="/", extra_head="", page_type='page'):
+    """Stream a complete HTML page to `path` (see templates.get_full_page)."""
+    with open_page(path, page_type) as f:
+        get_full_page(title, description, body_content, canonical_path, extra_head, out=f)
+
+
+def print_output_report():
+    """Print bytes saved by minification per page type (nothing when disabled)."""
+    for page_type, stats in OUTPUT_STATS.items():
+        saved = stats['bytes'] - stats['minified_bytes']
+        print(f"  Minified {stats['pages']} {page_type} page(s): {stats['bytes']:,} -> "
+              f"{stats['minified_bytes']:,} bytes ({saved:,} saved, "
+              f"{saved / max(stats['bytes'], 1):.0%}) in {stats['seconds']:.2f}s")
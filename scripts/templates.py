@@ -884,19 +884,20 @@ def get_header_html():
 
 def get_footer_html():
     """Generate footer HTML."""
-    columns_html = ""
+    columns = []
     for col in FOOTER_COLUMNS:
         links = "\n".join([
             f'                    <li><a href="{link["href"]}" class="footer__link">{link["label"]}</a></li>'
             for link in col["links"]
         ])
-        columns_html += f'''
+        columns.append(f'''
             <div class="footer__col">
                 <h4 class="footer__col-title">{col["title"]}</h4>
                 <ul class="footer__links">
 {links}
                 </ul>
-            </div>'''
+            </div>''')
+    columns_html = ''.join(columns)
 
     return f'''
     <footer class="footer">
@@ -952,15 +953,39 @@ def get_mobile_nav_js():
 '''
 
 
-def get_full_page(title, description, body_content, canonical_path="/", extra_head=""):
-    """Generate a complete HTML page."""
-    return f'''{get_html_head(title, description, canonical_path, extra_head)}
+def iter_full_page(title, description, body_content, canonical_path="/", extra_head=""):
+    """
+    Yield a complete HTML page as fragments.
+
+    `body_content` may be a string or an iterable of HTML fragments, so long
+    listings can be streamed without building the body as one string.
+    """
+    yield f'''{get_html_head(title, description, canonical_path, extra_head)}
 <body>
 {get_header_html()}
     <main>
-{body_content}
+'''
+    if isinstance(body_content, str):
+        yield body_content
+    else:
+        yield from body_content
+    yield f'''
     </main>
 {get_footer_html()}
 {get_mobile_nav_js()}
 </body>
 </html>'''
+
+
+def get_full_page(title, description, body_content, canonical_path="/", extra_head="", out=None):
+    """
+    Generate a complete HTML page.
+
+    When `out` (any object with a write() method) is given, fragments are
+    written to it as they are produced and nothing is returned.
+    """
+    fragments = iter_full_page(title, description, body_content, canonical_path, extra_head)
+    if out is None:
+        return ''.join(fragments)
+    for fragment in fragments:
+        out.write(fragment)